@@ -5,13 +5,18 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from ...services import get_auto_trader, AutoTraderStatus
 from ...config.constants import TradingStyle
 
 
 router = APIRouter(prefix="/auto-trader", tags=["Auto Trader"])
 
 
+def get_auto_trader():
+    """자동매매 인스턴스 조회 (services.auto_trader는 첫 요청 시 import, 워커 부팅 시 로드 안 함)"""
+    from ...services import get_auto_trader as _get_auto_trader
+    return _get_auto_trader()
+
+
 # === Request/Response Models ===
 
 class AutoTraderConfigUpdate(BaseModel):
@@ -3,11 +3,12 @@
 """
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from ...config.constants import TradingStyle
 from ...core.broker import IBrokerClient, create_broker_from_settings
-from ...services import AnalysisService, ScreeningService
+from ...services import AnalysisService, ScreeningService, analysis_for_display
 
 router = APIRouter(prefix="/signals", tags=["신호"])
 
@@ -60,10 +61,10 @@ async def analyze_stock(
             trading_style
         )
 
-        return {
+        return ORJSONResponse({
             "success": True,
-            "data": result
-        }
+            "data": analysis_for_display(result)
+        })
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -95,11 +96,12 @@ async def screen_stocks(
             sort_order=request.sort_order,
             limit=request.limit
         )
+        result['items'] = [analysis_for_display(item) for item in result['items']]
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "data": result
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -128,13 +130,13 @@ async def get_top_signals(
             limit=limit
         )
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "data": {
                 "trading_style": trading_style,
                 "count": len(result),
-                "items": result
+                "items": [analysis_for_display(item) for item in result]
             }
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
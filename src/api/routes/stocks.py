@@ -3,9 +3,10 @@
 """
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 
 from ...core.broker import IBrokerClient, create_broker_from_settings
-from ...services import AnalysisService
+from ...services import AnalysisService, indicators_for_display
 
 router = APIRouter(prefix="/stocks", tags=["종목"])
 
@@ -81,15 +82,15 @@ async def get_stock_indicators(
         indicators = await analysis_service.get_stock_indicators(stock_code, period)
         quote = await broker.get_quote(stock_code)
 
-        return {
+        return ORJSONResponse({
             "success": True,
             "data": {
                 "stock_code": stock_code,
                 "stock_name": quote.name,
                 "current_price": quote.price,
-                "indicators": indicators
+                "indicators": indicators_for_display(indicators)
             }
-        }
+        })
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -105,7 +106,7 @@ async def get_stock_ohlcv(
     await broker.connect()
     try:
         ohlcv_data = await broker.get_ohlcv(stock_code, period, count)
-        return {
+        return ORJSONResponse({
             "success": True,
             "data": {
                 "stock_code": stock_code,
@@ -123,6 +124,6 @@ async def get_stock_ohlcv(
                     for d in ohlcv_data
                 ]
             }
-        }
+        })
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
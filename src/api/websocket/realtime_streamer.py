@@ -136,8 +136,8 @@ class RealtimeStreamer:
                         "stock_code": stock_code,
                         "stock_name": result.get('stock_name', ''),
                         "signal": signal,
-                        "score": result.get('total_score', 0),
-                        "confidence": result.get('confidence', 0),
+                        "score": round(result.get('total_score', 0), 2),
+                        "confidence": round(result.get('confidence', 0), 2),
                         "reasons": result.get('reasons', []),
                         "timestamp": datetime.now().isoformat()
                     })
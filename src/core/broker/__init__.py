@@ -3,6 +3,7 @@
 """
 from .interfaces import (
     IBrokerClient,
+    BrokerError,
     Quote,
     OHLCV,
     OrderBook,
@@ -80,6 +81,7 @@ def create_broker_from_settings() -> IBrokerClient:
 __all__ = [
     # Interfaces & Types
     "IBrokerClient",
+    "BrokerError",
     "Quote",
     "OHLCV",
     "OrderBook",
@@ -8,6 +8,10 @@ from datetime import datetime
 from enum import Enum
 
 
+class BrokerError(Exception):
+    """브로커 API 오류 (인증 실패, 응답 오류, 통신 실패)"""
+
+
 class OrderType(Enum):
     MARKET = "MARKET"
     LIMIT = "LIMIT"
@@ -36,7 +40,7 @@ class Quote:
     extra: Dict[str, Any] = field(default_factory=dict)  # 추가 정보 (PER, PBR 등)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OHLCV:
     """OHLCV 데이터"""
     timestamp: datetime
@@ -15,7 +15,7 @@ from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass
 
 from .interfaces import (
-    IBrokerClient, Quote, OHLCV, OrderBook, OrderResult,
+    IBrokerClient, BrokerError, Quote, OHLCV, OrderBook, OrderResult,
     Balance, HoldingStock, OrderType, OrderSide
 )
 
@@ -294,12 +294,12 @@ class KISClient(IBrokerClient):
         async with self._session.post(url, headers=headers, json=body) as resp:
             if resp.status != 200:
                 text = await resp.text()
-                raise Exception(f"토큰 발급 실패: {resp.status} - {text}")
+                raise BrokerError(f"토큰 발급 실패: {resp.status} - {text}")
 
             data = await resp.json()
 
             if "access_token" not in data:
-                raise Exception(f"토큰 응답 오류: {data}")
+                raise BrokerError(f"토큰 응답 오류: {data}")
 
             expires_in = int(data.get("expires_in", 86400))
             self._token = KISToken(
@@ -411,7 +411,7 @@ class KISClient(IBrokerClient):
 
         except aiohttp.ClientError as e:
             logger.error(f"API 요청 실패 [{tr_id}]: {e}")
-            raise
+            raise BrokerError(f"API 요청 실패 [{tr_id}]: {e}") from e
 
     async def _handle_response(self, resp: aiohttp.ClientResponse, tr_id: str = "") -> Dict:
         """응답 처리"""
@@ -422,7 +422,7 @@ class KISClient(IBrokerClient):
             msg = data.get("msg1", "알 수 없는 오류")
             msg_cd = data.get("msg_cd", "")
             logger.warning(f"API 오류 [{tr_id}][{msg_cd}]: {msg}")
-            raise Exception(f"API 오류 [{msg_cd}]: {msg}")
+            raise BrokerError(f"API 오류 [{msg_cd}]: {msg}")
 
         return data
 
@@ -833,14 +833,17 @@ class KISClient(IBrokerClient):
         data = await self._request("GET", path, TRID.BALANCE, params=params)
         output2 = data.get("output2", [{}])[0] if data.get("output2") else {}
 
-        return Balance(
-            total_asset=float(output2.get("tot_evlu_amt", 0)),
-            available_cash=float(output2.get("dnca_tot_amt", 0)),
-            total_purchase=float(output2.get("pchs_amt_smtl_amt", 0)),
-            total_evaluation=float(output2.get("evlu_amt_smtl_amt", 0)),
-            total_pnl=float(output2.get("evlu_pfls_smtl_amt", 0)),
-            total_pnl_rate=float(output2.get("tot_evlu_pfls_rt", 0)) if output2.get("tot_evlu_pfls_rt") else 0
-        )
+        try:
+            return Balance(
+                total_asset=float(output2.get("tot_evlu_amt", 0)),
+                available_cash=float(output2.get("dnca_tot_amt", 0)),
+                total_purchase=float(output2.get("pchs_amt_smtl_amt", 0)),
+                total_evaluation=float(output2.get("evlu_amt_smtl_amt", 0)),
+                total_pnl=float(output2.get("evlu_pfls_smtl_amt", 0)),
+                total_pnl_rate=float(output2.get("tot_evlu_pfls_rt", 0)) if output2.get("tot_evlu_pfls_rt") else 0
+            )
+        except (AttributeError, IndexError, TypeError, ValueError) as e:
+            raise BrokerError(f"잔고 응답 파싱 실패: {e}") from e
 
     async def get_positions(self) -> List[HoldingStock]:
         """보유 종목 조회"""
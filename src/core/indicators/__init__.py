@@ -1,12 +1,12 @@
 """
 기술적 지표 계산기 패키지
 """
-from .base import IIndicator, OHLCV
+from .base import IIndicator, OHLCV, OHLCVFrame, ohlcv_list_to_frame
 from .volume import VolumeIndicator
 from .vwap import VWAPIndicator
 from .moving_average import MovingAverageIndicator
-from .rsi import RSIIndicator
-from .macd import MACDIndicator
+from .rsi import RSIIndicator, StreamingRSI
+from .macd import MACDIndicator, StreamingMACD
 from .bollinger import BollingerBandIndicator
 from .obv import OBVIndicator
 from .order_book import OrderBookIndicator, OrderBookDepthIndicator
@@ -14,11 +14,15 @@ from .order_book import OrderBookIndicator, OrderBookDepthIndicator
 __all__ = [
     "IIndicator",
     "OHLCV",
+    "OHLCVFrame",
+    "ohlcv_list_to_frame",
     "VolumeIndicator",
     "VWAPIndicator",
     "MovingAverageIndicator",
     "RSIIndicator",
+    "StreamingRSI",
     "MACDIndicator",
+    "StreamingMACD",
     "BollingerBandIndicator",
     "OBVIndicator",
     "OrderBookIndicator",
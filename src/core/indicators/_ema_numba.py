@@ -0,0 +1,162 @@
+"""
+EMA / MACD 시계열 커널
+- numba 설치 시 import 시점에 시그니처로 컴파일 (cache=True로 재시작 시 재사용)
+- 미설치 시 macd_last는 NumPy 누적합 기반 벡터 연산으로 동작
+"""
+import math
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba 미설치 환경
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+# 블록 내 감쇠 계수 역수 거듭제곱의 상한 (float64 범위 안에서 누적합 계산)
+_MAX_LOG_SCALE = 460.0
+
+
+@lru_cache(maxsize=32)
+def _recurrence_weights(alpha: float) -> Tuple[np.ndarray, np.ndarray]:
+    """블록 길이만큼의 (decay^k, alpha / decay^k), k = 1..block"""
+    decay = 1.0 - alpha
+    block = max(1, int(_MAX_LOG_SCALE / -math.log(decay)))
+    powers = decay ** np.arange(1, block + 1)
+    scaled = alpha / powers
+    powers.flags.writeable = False
+    scaled.flags.writeable = False
+    return powers, scaled
+
+
+def ema_recurrence(seed, values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    지수 평활 점화식 벡터 계산 (numba 미설치 시 사용)
+    - y[t] = y[t-1] + alpha * (values[t] - y[t-1]), y[-1] = seed
+    - y[k] = decay^k * (seed + alpha * Σ values[j] / decay^j) 를 블록 단위 누적합으로 계산
+    - values가 2차원이면 행마다 독립 계산 (seed는 행별 초기값 배열)
+
+    Returns:
+        values와 같은 모양의 평활 배열
+    """
+    if alpha >= 1.0:
+        return values.astype(np.float64, copy=True)
+
+    powers, scaled = _recurrence_weights(alpha)
+    block = powers.shape[0]
+    n = values.shape[-1]
+    prev = seed if values.ndim == 1 else np.asarray(seed)[..., None]
+    if n <= block:
+        out = np.cumsum(values * scaled[:n], axis=-1)
+        out += prev
+        out *= powers[:n]
+        return out
+
+    out = np.empty(values.shape)
+    for start in range(0, n, block):
+        chunk = values[..., start:start + block]
+        m = chunk.shape[-1]
+        acc = np.cumsum(chunk * scaled[:m], axis=-1)
+        acc += prev
+        acc *= powers[:m]
+        out[..., start:start + m] = acc
+        prev = acc[..., -1:]
+    return out
+
+
+def _ema_line_numpy(data: np.ndarray, period: int) -> np.ndarray:
+    """EMA 시계열 (앞 period-1개는 0, 첫 값은 단순평균)"""
+    out = np.zeros(data.shape[0])
+    if data.shape[0] < period:
+        return out
+    seed = data[:period].sum() / period
+    out[period - 1] = seed
+    out[period:] = ema_recurrence(seed, data[period:], 2.0 / (period + 1))
+    return out
+
+
+def _macd_last(closes: np.ndarray, fast: int, slow: int, signal: int):
+    """
+    MACD 최근 값 계산 (중간 배열 없이 1회 순회)
+    - 기간 이전 EMA는 0, signal은 MACD 선 앞 signal개 평균으로 시작 (기존 리스트 구현과 같은 규칙)
+
+    Returns:
+        (macd, signal, histogram, prev_histogram)
+    """
+    n = closes.shape[0]
+    fast_mult = 2.0 / (fast + 1)
+    slow_mult = 2.0 / (slow + 1)
+    signal_mult = 2.0 / (signal + 1)
+
+    fast_ema = 0.0
+    slow_ema = 0.0
+    signal_ema = 0.0
+    fast_sum = 0.0
+    slow_sum = 0.0
+    macd = 0.0
+    signal_val = 0.0
+    histogram = 0.0
+    prev_histogram = 0.0
+
+    for i in range(n):
+        price = closes[i]
+
+        if i < fast:
+            fast_sum += price
+            fast_val = fast_sum / fast if i == fast - 1 else 0.0
+            if i == fast - 1:
+                fast_ema = fast_val
+        else:
+            fast_ema = (price - fast_ema) * fast_mult + fast_ema
+            fast_val = fast_ema
+
+        if i < slow:
+            slow_sum += price
+            slow_val = slow_sum / slow if i == slow - 1 else 0.0
+            if i == slow - 1:
+                slow_ema = slow_val
+        else:
+            slow_ema = (price - slow_ema) * slow_mult + slow_ema
+            slow_val = slow_ema
+
+        macd = fast_val - slow_val
+
+        if i < signal:
+            signal_ema += macd
+            if i == signal - 1:
+                signal_ema /= signal
+            signal_val = signal_ema if i == signal - 1 else 0.0
+        else:
+            signal_ema = (macd - signal_ema) * signal_mult + signal_ema
+            signal_val = signal_ema
+
+        prev_histogram = histogram
+        histogram = macd - signal_val
+
+    return macd, signal_val, histogram, prev_histogram
+
+
+def _macd_last_numpy(closes: np.ndarray, fast: int, slow: int, signal: int):
+    """_macd_last의 NumPy 구현 (numba 미설치 시, 호출부에서 길이 slow + signal 이상 보장)"""
+    macd_line = _ema_line_numpy(closes, fast) - _ema_line_numpy(closes, slow)
+    signal_line = _ema_line_numpy(macd_line, signal)
+    histogram = macd_line[-2:] - signal_line[-2:]
+    return (
+        float(macd_line[-1]),
+        float(signal_line[-1]),
+        float(histogram[-1]),
+        float(histogram[0]) if histogram.shape[0] > 1 else 0.0
+    )
+
+
+# StreamingMACD와 같은 연산 순서를 유지하도록 fastmath 미사용
+if NUMBA_AVAILABLE:
+    macd_last = njit(
+        'UniTuple(float64, 4)(float64[:], int64, int64, int64)', cache=True
+    )(_macd_last)
+else:  # pragma: no cover - numba 미설치 환경
+    macd_last = _macd_last_numpy
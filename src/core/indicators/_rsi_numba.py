@@ -0,0 +1,86 @@
+"""
+Wilder RSI 시계열 커널
+- numba 설치 시 import 시점에 시그니처로 컴파일 (cache=True로 재시작 시 재사용)
+- 미설치 시 NumPy 누적합 기반 벡터 연산으로 동작
+"""
+import numpy as np
+
+from ._ema_numba import NUMBA_AVAILABLE, ema_recurrence, njit
+
+
+def _rsi_series(changes: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder smoothing RSI 시계열 계산
+
+    Args:
+        changes: 종가 변화량 (np.diff(closes))
+        period: RSI 기간
+
+    Returns:
+        changes와 같은 길이의 RSI 배열 (앞 period-1개는 NaN)
+    """
+    n = changes.shape[0]
+    out = np.empty(n)
+    out[:] = np.nan
+    if n < period:
+        return out
+
+    # 초기값: 첫 period 구간 단순평균
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(period):
+        c = changes[i]
+        if c > 0:
+            avg_gain += c
+        else:
+            avg_loss -= c
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period - 1, n):
+        if i >= period:
+            c = changes[i]
+            gain = c if c > 0 else 0.0
+            loss = -c if c < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+
+        if avg_loss == 0:
+            out[i] = 100.0
+        elif avg_gain == 0:
+            out[i] = 0.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+
+def _rsi_series_numpy(changes: np.ndarray, period: int) -> np.ndarray:
+    """_rsi_series의 NumPy 구현 (numba 미설치 시, 상승/하락 평균을 한 번에 평활)"""
+    n = changes.shape[0]
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+
+    # 0행: 상승폭, 1행: 하락폭
+    moves = np.empty((2, n))
+    np.maximum(changes, 0.0, out=moves[0])
+    np.subtract(moves[0], changes, out=moves[1])
+    averages = np.empty((2, n - period + 1))
+    averages[:, 0] = moves[:, :period].sum(axis=1) / period
+    averages[:, 1:] = ema_recurrence(averages[:, 0], moves[:, period:], 1.0 / period)
+
+    # 100 - 100 / (1 + gain / loss) = 100 * gain / (gain + loss), 둘 다 0이면 100
+    avg_gain = averages[0]
+    total = avg_gain + averages[1]
+    rsi = np.divide(avg_gain, total, out=np.ones_like(total), where=total > 0)
+    rsi *= 100.0
+    out[period - 1:] = rsi
+    return out
+
+
+# StreamingRSI와 같은 연산 순서를 유지하도록 fastmath 미사용
+if NUMBA_AVAILABLE:
+    rsi_series = njit('float64[:](float64[:], int64)', cache=True)(_rsi_series)
+else:  # pragma: no cover - numba 미설치 환경
+    rsi_series = _rsi_series_numpy
@@ -2,14 +2,16 @@
 지표 계산기 베이스
 """
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, Union
 from dataclasses import dataclass
+import numpy as np
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OHLCV:
-    """OHLCV 데이터"""
-    timestamp: str
+    """OHLCV 데이터 (timestamp는 변환 없이 원본 datetime 그대로 보관 가능)"""
+    timestamp: Union[str, datetime]
     open: float
     high: float
     low: float
@@ -17,6 +19,50 @@ class OHLCV:
     volume: int
 
 
+@dataclass
+class OHLCVFrame:
+    """OHLCV 배열 묶음 (필드별 연속 배열)"""
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    length: int
+
+    def tail(self, n: int) -> 'OHLCVFrame':
+        """최근 n개 봉만 담은 OHLCVFrame (복사 없이 뷰 반환)"""
+        if n >= self.length:
+            return self
+        return OHLCVFrame(
+            open=self.open[-n:],
+            high=self.high[-n:],
+            low=self.low[-n:],
+            close=self.close[-n:],
+            volume=self.volume[-n:],
+            length=n
+        )
+
+
+def ohlcv_list_to_frame(data: List[OHLCV]) -> OHLCVFrame:
+    """OHLCV 리스트를 OHLCVFrame으로 변환 (같은 속성을 가진 브로커 OHLCV도 가능)"""
+    n = len(data)
+    return OHLCVFrame(
+        open=np.fromiter((d.open for d in data), dtype=np.float64, count=n),
+        high=np.fromiter((d.high for d in data), dtype=np.float64, count=n),
+        low=np.fromiter((d.low for d in data), dtype=np.float64, count=n),
+        close=np.fromiter((d.close for d in data), dtype=np.float64, count=n),
+        volume=np.fromiter((d.volume for d in data), dtype=np.int64, count=n),
+        length=n
+    )
+
+
+def as_frame(data: Union[List[OHLCV], OHLCVFrame]) -> OHLCVFrame:
+    """OHLCVFrame이 아니면 변환"""
+    if isinstance(data, OHLCVFrame):
+        return data
+    return ohlcv_list_to_frame(data)
+
+
 class IIndicator(ABC):
     """지표 계산기 인터페이스"""
 
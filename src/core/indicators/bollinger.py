@@ -1,9 +1,9 @@
 """
 볼린저밴드 지표 계산기
 """
-from typing import Dict, List
-import numpy as np
-from .base import IIndicator, OHLCV
+from typing import Dict, List, Union
+from numpy.lib.stride_tricks import sliding_window_view
+from .base import IIndicator, OHLCV, OHLCVFrame, as_frame
 
 
 class BollingerBandIndicator(IIndicator):
@@ -17,7 +17,7 @@ class BollingerBandIndicator(IIndicator):
     def name(self) -> str:
         return "bollinger"
 
-    def calculate(self, data: List[OHLCV]) -> Dict:
+    def calculate(self, data: Union[List[OHLCV], OHLCVFrame]) -> Dict:
         """
         볼린저밴드 계산
 
@@ -32,7 +32,8 @@ class BollingerBandIndicator(IIndicator):
                 'squeeze': bool        # 스퀴즈 여부
             }
         """
-        if len(data) < self.period:
+        frame = as_frame(data)
+        if frame.length < self.period:
             return {
                 'upper': 0,
                 'middle': 0,
@@ -43,31 +44,23 @@ class BollingerBandIndicator(IIndicator):
                 'squeeze': False
             }
 
-        closes = [d.close for d in data]
+        closes = frame.close
 
-        # 중심선 (SMA)
-        middle = np.mean(closes[-self.period:])
+        # 현재/직전 구간을 한 번에: (구간 수, period) 뷰에서 행별 평균/표준편차
+        windows = sliding_window_view(closes[-self.period-1:], self.period)
+        middles = windows.mean(axis=1)
+        stds = windows.std(axis=1)
+        bandwidths = 2 * self.std_dev * stds
 
-        # 표준편차
-        std = np.std(closes[-self.period:])
-
-        # 상단/하단 밴드
+        # 중심선 (SMA) / 상단/하단 밴드
+        middle = float(middles[-1])
+        std = float(stds[-1])
         upper = middle + (self.std_dev * std)
         lower = middle - (self.std_dev * std)
 
-        # 밴드폭
-        bandwidth = upper - lower
-
-        # 이전 밴드폭 계산
-        if len(closes) > self.period:
-            prev_closes = closes[-self.period-1:-1]
-            prev_middle = np.mean(prev_closes)
-            prev_std = np.std(prev_closes)
-            prev_upper = prev_middle + (self.std_dev * prev_std)
-            prev_lower = prev_middle - (self.std_dev * prev_std)
-            prev_bandwidth = prev_upper - prev_lower
-        else:
-            prev_bandwidth = bandwidth
+        # 밴드폭 (직전 구간이 없으면 현재 밴드폭)
+        bandwidth = float(bandwidths[-1])
+        prev_bandwidth = float(bandwidths[0])
 
         # 현재가 위치 판단
         current_price = closes[-1]
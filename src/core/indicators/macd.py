@@ -1,8 +1,106 @@
 """
 MACD (Moving Average Convergence Divergence) 지표 계산기
 """
-from typing import Dict, List
-from .base import IIndicator, OHLCV
+from typing import Dict, List, Optional, Tuple, Union
+from .base import IIndicator, OHLCV, OHLCVFrame, as_frame
+from ._ema_numba import macd_last
+
+_MACD_DEFAULT = {
+    'macd': 0,
+    'signal': 0,
+    'histogram': 0,
+    'prev_histogram': 0,
+    'cross_signal': 'none'
+}
+
+
+def _macd_result(
+    macd: float,
+    signal: float,
+    histogram: float,
+    prev_histogram: float
+) -> Dict:
+    """MACD 결과 딕셔너리 구성 (크로스 신호 판단 포함)"""
+    if prev_histogram < 0 and histogram > 0:
+        cross_signal = 'golden_cross'
+    elif prev_histogram > 0 and histogram < 0:
+        cross_signal = 'dead_cross'
+    else:
+        cross_signal = 'none'
+
+    return {
+        'macd': round(float(macd), 2),
+        'signal': round(float(signal), 2),
+        'histogram': round(float(histogram), 2),
+        'prev_histogram': round(float(prev_histogram), 2),
+        'cross_signal': cross_signal
+    }
+
+
+class StreamingEMA:
+    """스트리밍 EMA (워밍업 중 0, period번째 값에서 단순평균으로 시작)"""
+    __slots__ = ('period', 'multiplier', 'value', '_count')
+
+    def __init__(self, period: int):
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self.reset()
+
+    def reset(self):
+        """상태 초기화"""
+        self.value = 0.0
+        self._count = 0
+
+    def update(self, x: float) -> float:
+        """값 1개 반영 후 EMA 반환"""
+        self._count += 1
+        count = self._count
+        if count < self.period:
+            self.value += x          # 워밍업 동안은 합계 누적
+            return 0.0
+        if count == self.period:
+            self.value = (self.value + x) / self.period
+        else:
+            self.value += (x - self.value) * self.multiplier
+        return self.value
+
+
+class StreamingMACD:
+    """
+    스트리밍 MACD (봉 단위 O(1) 갱신)
+    - 같은 종가 시퀀스에 대해 MACDIndicator.calculate와 동일한 값
+    """
+    __slots__ = ('fast', 'slow', 'signal', 'signal_period', 'prev_histogram', '_count')
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+        self.signal_period = signal
+        self.reset()
+
+    def reset(self):
+        """상태 초기화"""
+        self.fast.reset()
+        self.slow.reset()
+        self.signal.reset()
+        self.prev_histogram = 0.0
+        self._count = 0
+
+    @property
+    def ready(self) -> bool:
+        """MACD 산출 가능 여부"""
+        return self._count >= self.slow.period + self.signal_period
+
+    def update(self, close: float) -> Tuple[float, float, float, float]:
+        """종가 1개 반영 후 (macd, signal, histogram, prev_histogram) 반환"""
+        self._count += 1
+        macd = self.fast.update(close) - self.slow.update(close)
+        signal = self.signal.update(macd)
+        histogram = macd - signal
+        prev_histogram = self.prev_histogram if self._count > 1 else 0.0
+        self.prev_histogram = histogram
+        return macd, signal, histogram, prev_histogram
 
 
 class MACDIndicator(IIndicator):
@@ -12,12 +110,29 @@ class MACDIndicator(IIndicator):
         self.fast = fast
         self.slow = slow
         self.signal_period = signal
+        self._stream: Optional[StreamingMACD] = None
 
     @property
     def name(self) -> str:
         return "macd"
 
-    def calculate(self, data: List[OHLCV]) -> Dict:
+    def update(self, close: float) -> Dict:
+        """
+        스트리밍 MACD 갱신 (백테스트용)
+
+        봉마다 종가를 순서대로 전달하면 calculate(지금까지의 데이터)와
+        같은 결과를 O(1)로 반환
+        """
+        if self._stream is None:
+            self._stream = StreamingMACD(self.fast, self.slow, self.signal_period)
+        stream = self._stream
+
+        values = stream.update(close)
+        if not stream.ready:
+            return dict(_MACD_DEFAULT)
+        return _macd_result(*values)
+
+    def calculate(self, data: Union[List[OHLCV], OHLCVFrame]) -> Dict:
         """
         MACD 계산
 
@@ -30,61 +145,10 @@ class MACDIndicator(IIndicator):
                 'cross_signal': str    # 'golden_cross', 'dead_cross', 'none'
             }
         """
-        if len(data) < self.slow + self.signal_period:
-            return {
-                'macd': 0,
-                'signal': 0,
-                'histogram': 0,
-                'prev_histogram': 0,
-                'cross_signal': 'none'
-            }
-
-        closes = [d.close for d in data]
-
-        # EMA 계산
-        ema_fast = self._ema(closes, self.fast)
-        ema_slow = self._ema(closes, self.slow)
-
-        # MACD 라인
-        macd_line = [f - s for f, s in zip(ema_fast, ema_slow)]
-
-        # Signal 라인
-        signal_line = self._ema(macd_line, self.signal_period)
-
-        # 히스토그램
-        histogram = [m - s for m, s in zip(macd_line, signal_line)]
-
-        current_macd = macd_line[-1]
-        current_signal = signal_line[-1]
-        current_histogram = histogram[-1]
-        prev_histogram = histogram[-2] if len(histogram) > 1 else 0
-
-        # 크로스 신호
-        if prev_histogram < 0 and current_histogram > 0:
-            cross_signal = 'golden_cross'
-        elif prev_histogram > 0 and current_histogram < 0:
-            cross_signal = 'dead_cross'
-        else:
-            cross_signal = 'none'
-
-        return {
-            'macd': round(current_macd, 2),
-            'signal': round(current_signal, 2),
-            'histogram': round(current_histogram, 2),
-            'prev_histogram': round(prev_histogram, 2),
-            'cross_signal': cross_signal
-        }
-
-    def _ema(self, data: List[float], period: int) -> List[float]:
-        """지수이동평균 계산"""
-        if len(data) < period:
-            return [0] * len(data)
-
-        ema = [sum(data[:period]) / period]
-        multiplier = 2 / (period + 1)
-
-        for price in data[period:]:
-            ema.append((price - ema[-1]) * multiplier + ema[-1])
+        frame = as_frame(data)
+        if frame.length < self.slow + self.signal_period:
+            return dict(_MACD_DEFAULT)
 
-        # 앞부분 패딩
-        return [0] * (period - 1) + ema
+        return _macd_result(
+            *macd_last(frame.close, self.fast, self.slow, self.signal_period)
+        )
@@ -1,9 +1,9 @@
 """
 이동평균선 지표 계산기
 """
-from typing import Dict, List
+from typing import Dict, List, Union
 import numpy as np
-from .base import IIndicator, OHLCV
+from .base import IIndicator, OHLCV, OHLCVFrame, as_frame
 
 
 class MovingAverageIndicator(IIndicator):
@@ -11,12 +11,14 @@ class MovingAverageIndicator(IIndicator):
 
     def __init__(self, periods: List[int] = None):
         self.periods = periods or [5, 20, 60, 120]
+        # 누적합 작업 버퍼 (calculate는 동기 함수라 호출 간 재사용해도 안전)
+        self._scratch = np.empty(0)
 
     @property
     def name(self) -> str:
         return "ma"
 
-    def calculate(self, data: List[OHLCV]) -> Dict:
+    def calculate(self, data: Union[List[OHLCV], OHLCVFrame]) -> Dict:
         """
         이동평균선 계산
 
@@ -35,17 +37,31 @@ class MovingAverageIndicator(IIndicator):
                 'above_ma120': bool
             }
         """
-        if not data:
+        frame = as_frame(data)
+        if not frame.length:
             return self._empty_result()
 
-        closes = [d.close for d in data]
-        current_price = closes[-1]
+        closes = frame.close
+        n = frame.length
+        current_price = float(closes[-1])
         result = {'current_price': current_price}
 
+        # 누적합 1회로 모든 기간 합계를 차분으로 계산
+        # (현재가 기준 편차를 누적해 큰 가격대에서도 오차 최소화)
+        if self._scratch.shape[0] < n + 1:
+            self._scratch = np.empty(n + 1)
+        csum = self._scratch[:n + 1]
+        csum[0] = 0.0
+        np.subtract(closes, current_price, out=csum[1:])
+        np.cumsum(csum[1:], out=csum[1:])
+
+        def window_mean(end: int, period: int) -> float:
+            return (csum[end] - csum[end - period]) / period + current_price
+
         # 각 기간별 이동평균 계산
         for period in self.periods:
-            if len(closes) >= period:
-                ma = np.mean(closes[-period:])
+            if n >= period:
+                ma = window_mean(n, period)
                 result[f'ma{period}'] = round(ma, 2)
                 result[f'above_ma{period}'] = current_price >= ma
             else:
@@ -68,9 +84,9 @@ class MovingAverageIndicator(IIndicator):
             result['arrangement'] = None
 
         # 크로스 신호 (5MA, 20MA 기준)
-        if len(closes) >= 21:
-            prev_ma5 = np.mean(closes[-6:-1])
-            prev_ma20 = np.mean(closes[-21:-1])
+        if n >= 21:
+            prev_ma5 = window_mean(n - 1, 5)
+            prev_ma20 = window_mean(n - 1, 20)
 
             if ma5 and ma20:
                 if prev_ma5 <= prev_ma20 and ma5 > ma20:
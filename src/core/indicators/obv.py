@@ -1,8 +1,9 @@
 """
 OBV (On-Balance Volume) 지표 계산기
 """
-from typing import Dict, List
-from .base import IIndicator, OHLCV
+from typing import Dict, List, Union
+import numpy as np
+from .base import IIndicator, OHLCV, OHLCVFrame, as_frame
 
 
 class OBVIndicator(IIndicator):
@@ -12,7 +13,7 @@ class OBVIndicator(IIndicator):
     def name(self) -> str:
         return "obv"
 
-    def calculate(self, data: List[OHLCV]) -> Dict:
+    def calculate(self, data: Union[List[OHLCV], OHLCVFrame]) -> Dict:
         """
         OBV 계산
 
@@ -24,7 +25,8 @@ class OBVIndicator(IIndicator):
                 'obv_divergence': str  # 'bullish', 'bearish', 'none'
             }
         """
-        if len(data) < 2:
+        frame = as_frame(data)
+        if frame.length < 2:
             return {
                 'obv': 0,
                 'obv_trend': 'flat',
@@ -32,24 +34,21 @@ class OBVIndicator(IIndicator):
                 'obv_divergence': 'none'
             }
 
-        # OBV 계산
-        obv = [0]
-        for i in range(1, len(data)):
-            if data[i].close > data[i-1].close:
-                obv.append(obv[-1] + data[i].volume)
-            elif data[i].close < data[i-1].close:
-                obv.append(obv[-1] - data[i].volume)
-            else:
-                obv.append(obv[-1])
+        # OBV 계산 (전일 대비 방향 * 거래량의 누적합, 첫 봉은 0)
+        closes = frame.close
+        volumes = frame.volume
+        diffs = np.ediff1d(closes, to_begin=0.0)
+        signed_volumes = np.where(diffs > 0, volumes, np.where(diffs < 0, -volumes, 0))
+        obv = np.cumsum(signed_volumes)
 
-        current_obv = obv[-1]
+        current_obv = int(obv[-1])
 
         # 추세 판단 (최근 5일)
         if len(obv) >= 5:
-            recent_obv = obv[-5:]
-            if all(recent_obv[i] < recent_obv[i+1] for i in range(len(recent_obv)-1)):
+            recent_diffs = np.diff(obv[-5:])
+            if (recent_diffs > 0).all():
                 obv_trend = 'up'
-            elif all(recent_obv[i] > recent_obv[i+1] for i in range(len(recent_obv)-1)):
+            elif (recent_diffs < 0).all():
                 obv_trend = 'down'
             else:
                 obv_trend = 'flat'
@@ -58,11 +57,11 @@ class OBVIndicator(IIndicator):
 
         # 신고가 여부 (최근 20일 기준)
         lookback = min(20, len(obv))
-        max_obv = max(obv[-lookback:])
-        obv_new_high = current_obv >= max_obv
+        max_obv = obv[-lookback:].max()
+        obv_new_high = bool(current_obv >= max_obv)
 
         # 다이버전스 판단
-        obv_divergence = self._check_divergence(data, obv)
+        obv_divergence = self._check_divergence(closes, obv)
 
         return {
             'obv': current_obv,
@@ -71,13 +70,13 @@ class OBVIndicator(IIndicator):
             'obv_divergence': obv_divergence
         }
 
-    def _check_divergence(self, data: List[OHLCV], obv: List[float]) -> str:
+    def _check_divergence(self, closes: np.ndarray, obv: np.ndarray) -> str:
         """다이버전스 확인"""
-        if len(data) < 10:
+        if len(closes) < 10:
             return 'none'
 
         # 최근 10일 데이터로 간단한 다이버전스 판단
-        recent_prices = [d.close for d in data[-10:]]
+        recent_prices = closes[-10:]
         recent_obv = obv[-10:]
 
         price_change = recent_prices[-1] - recent_prices[0]
@@ -1,10 +1,44 @@
 """
 호가/체결강도 지표 계산기
 """
-from typing import Dict
+from bisect import bisect_right
+from math import inf, nextafter
+from typing import Dict, Tuple
+import numpy as np
 from .base import IIndicator
 
 
+# 체결강도 구간: <=80 매도, >=120 매수 (양끝 포함이므로 하단 경계를 한 칸 올림)
+_PRESSURE_EDGES = (nextafter(80.0, inf), 120.0)
+_PRESSURE_LABELS = ('sell', 'neutral', 'buy')
+
+# 잔량 비율 구간: <=0.7 매도 우위, >=1.3 매수 우위
+_IMBALANCE_EDGES = (nextafter(0.7, inf), 1.3)
+_IMBALANCE_LABELS = ('sell_heavy', 'balanced', 'buy_heavy')
+
+
+def analyze_depth(ask: np.ndarray, bid: np.ndarray) -> Tuple[int, int, str]:
+    """
+    호가 잔량 합계와 매물벽을 한 번에 계산
+
+    Returns:
+        (매도 잔량 합계, 매수 잔량 합계, 매물벽 위치 'ask'/'bid'/'none')
+        매물벽: 특정 호가에 평균의 3배 초과 잔량
+    """
+    ask_sum = int(ask.sum()) if ask.size else 0
+    bid_sum = int(bid.sum()) if bid.size else 0
+
+    # 평균 = 합계 / 개수 이므로 max*n > sum*3 으로 mean 재계산 생략
+    if ask.size and ask.max() * ask.size > ask_sum * 3:
+        wall_side = 'ask'
+    elif bid.size and bid.max() * bid.size > bid_sum * 3:
+        wall_side = 'bid'
+    else:
+        wall_side = 'none'
+
+    return ask_sum, bid_sum, wall_side
+
+
 class OrderBookIndicator(IIndicator):
     """호가/체결강도 지표"""
 
@@ -40,15 +74,10 @@ class OrderBookIndicator(IIndicator):
             strength = (buy_vol / sell_vol) * 100
 
         # 매수/매도 압력 판단
-        if strength >= 120:
-            pressure = 'buy'
-        elif strength <= 80:
-            pressure = 'sell'
-        else:
-            pressure = 'neutral'
+        pressure = _PRESSURE_LABELS[bisect_right(_PRESSURE_EDGES, strength)]
 
         return {
-            'strength': round(strength, 2),
+            'strength': strength,
             'pressure': pressure,
             'buy_volume': buy_vol,
             'sell_volume': sell_vol
@@ -75,7 +104,9 @@ class OrderBookDepthIndicator:
                 'bid_ask_ratio': float,     # 매수/매도 잔량 비율
                 'imbalance': str,           # 'buy_heavy', 'sell_heavy', 'balanced'
                 'wall_detected': bool,      # 매물벽 감지
-                'wall_side': str            # 'ask', 'bid', 'none'
+                'wall_side': str,           # 'ask', 'bid', 'none'
+                'ask_depth': List[float],   # 호가별 매도 잔량 비중 (합계 1)
+                'bid_depth': List[float]    # 호가별 매수 잔량 비중 (합계 1)
             }
         """
         total_ask = orderbook.get('total_ask_volume', 0)
@@ -90,32 +121,23 @@ class OrderBookDepthIndicator:
             bid_ask_ratio = total_bid / total_ask
 
         # 불균형 판단
-        if bid_ask_ratio >= 1.3:
-            imbalance = 'buy_heavy'
-        elif bid_ask_ratio <= 0.7:
-            imbalance = 'sell_heavy'
-        else:
-            imbalance = 'balanced'
-
-        # 매물벽 감지 (특정 호가에 평균의 3배 이상 잔량)
-        wall_detected = False
-        wall_side = 'none'
+        imbalance = _IMBALANCE_LABELS[bisect_right(_IMBALANCE_EDGES, bid_ask_ratio)]
 
-        if ask_volumes:
-            avg_ask = sum(ask_volumes) / len(ask_volumes)
-            if any(v > avg_ask * 3 for v in ask_volumes):
-                wall_detected = True
-                wall_side = 'ask'
+        # 잔량 합계 + 매물벽 감지 (단일 패스)
+        ask_arr = np.asarray(ask_volumes, dtype=np.int64)
+        bid_arr = np.asarray(bid_volumes, dtype=np.int64)
+        ask_sum, bid_sum, wall_side = analyze_depth(ask_arr, bid_arr)
+        wall_detected = wall_side != 'none'
 
-        if bid_volumes and not wall_detected:
-            avg_bid = sum(bid_volumes) / len(bid_volumes)
-            if any(v > avg_bid * 3 for v in bid_volumes):
-                wall_detected = True
-                wall_side = 'bid'
+        # 호가별 잔량 비중 (정규화 깊이)
+        ask_depth = (ask_arr / ask_sum).tolist() if ask_sum > 0 else [0.0] * ask_arr.size
+        bid_depth = (bid_arr / bid_sum).tolist() if bid_sum > 0 else [0.0] * bid_arr.size
 
         return {
-            'bid_ask_ratio': round(bid_ask_ratio, 2),
+            'bid_ask_ratio': bid_ask_ratio,
             'imbalance': imbalance,
             'wall_detected': wall_detected,
-            'wall_side': wall_side
+            'wall_side': wall_side,
+            'ask_depth': ask_depth,
+            'bid_depth': bid_depth
         }
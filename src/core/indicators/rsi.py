@@ -1,9 +1,104 @@
 """
 RSI (Relative Strength Index) 지표 계산기
 """
-from typing import Dict, List
+from collections import deque
+from typing import Dict, List, Optional, Union
 import numpy as np
-from .base import IIndicator, OHLCV
+from .base import IIndicator, OHLCV, OHLCVFrame, as_frame
+from ._rsi_numba import rsi_series
+
+# RSI 상태/추세 라벨 (인덱스 조회용)
+_RSI_STATUS = ('oversold', 'neutral', 'overbought')
+_RSI_TREND = ('falling', 'stable', 'rising')
+
+_RSI_DEFAULT = {
+    'rsi': 50,
+    'rsi_status': 'neutral',
+    'rsi_trend': 'stable'
+}
+
+
+# 추세 판단 허용 오차 (연산 순서에 따른 ULP 차이로 'stable'이 뒤집히지 않도록)
+_RSI_TREND_TOL = 1e-9
+
+
+def _rsi_trend(delta: float) -> str:
+    """추세 판단: 비교 구간 RSI 변화량이 허용 오차 이내면 'stable'"""
+    return _RSI_TREND[int(delta > _RSI_TREND_TOL) - int(delta < -_RSI_TREND_TOL) + 1]
+
+
+def _rsi_status(rsi: float) -> str:
+    """상태 판단: (-inf, 30] 과매도, (30, 70) 중립, [70, inf) 과매수"""
+    return _RSI_STATUS[int(rsi > 30) + int(rsi >= 70)]
+
+
+class StreamingRSI:
+    """
+    스트리밍 RSI (봉 단위 O(1) 갱신)
+    - 백테스트 루프에서 전체 구간 재계산 대신 사용
+    - 같은 종가 시퀀스에 대해 RSIIndicator.calculate와 동일한 값
+    """
+    __slots__ = ('period', 'avg_gain', 'avg_loss', 'prev_close', '_count', '_history')
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.reset()
+
+    def reset(self):
+        """상태 초기화"""
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.prev_close: Optional[float] = None
+        self._count = 0                      # 누적 변화량 개수
+        self._history = deque(maxlen=3)      # 추세 비교용 최근 RSI
+
+    @property
+    def ready(self) -> bool:
+        """RSI 산출 가능 여부"""
+        return self._count >= self.period
+
+    @property
+    def trend(self) -> str:
+        """최근 RSI 추세 ('rising', 'falling', 'stable')"""
+        if self._count < self.period + 5:
+            return 'stable'
+        history = self._history
+        return _rsi_trend(history[-1] - history[0])
+
+    def update(self, close: float) -> float:
+        """종가 1개 반영 후 RSI 반환 (워밍업 중에는 50)"""
+        prev_close = self.prev_close
+        self.prev_close = close
+        if prev_close is None:
+            return 50.0
+
+        change = close - prev_close
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        period = self.period
+        self._count += 1
+
+        if self._count < period:
+            self.avg_gain += gain
+            self.avg_loss += loss
+            return 50.0
+        if self._count == period:
+            # 초기값: 첫 period 구간 단순평균
+            self.avg_gain = (self.avg_gain + gain) / period
+            self.avg_loss = (self.avg_loss + loss) / period
+        else:
+            self.avg_gain = (self.avg_gain * (period - 1) + gain) / period
+            self.avg_loss = (self.avg_loss * (period - 1) + loss) / period
+
+        if self.avg_loss == 0:
+            rsi = 100.0
+        elif self.avg_gain == 0:
+            rsi = 0.0
+        else:
+            rsi = 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+
+        self._history.append(rsi)
+        return rsi
 
 
 class RSIIndicator(IIndicator):
@@ -11,12 +106,34 @@ class RSIIndicator(IIndicator):
 
     def __init__(self, period: int = 14):
         self.period = period
+        self._stream: Optional[StreamingRSI] = None
 
     @property
     def name(self) -> str:
         return "rsi"
 
-    def calculate(self, data: List[OHLCV]) -> Dict:
+    def update(self, close: float) -> Dict:
+        """
+        스트리밍 RSI 갱신 (백테스트용)
+
+        봉마다 종가를 순서대로 전달하면 calculate(지금까지의 데이터)와
+        같은 결과를 O(1)로 반환
+        """
+        if self._stream is None:
+            self._stream = StreamingRSI(self.period)
+        stream = self._stream
+
+        rsi = stream.update(close)
+        if not stream.ready:
+            return dict(_RSI_DEFAULT)
+
+        return {
+            'rsi': rsi,
+            'rsi_status': _rsi_status(rsi),
+            'rsi_trend': stream.trend
+        }
+
+    def calculate(self, data: Union[List[OHLCV], OHLCVFrame]) -> Dict:
         """
         RSI 계산
 
@@ -27,78 +144,27 @@ class RSIIndicator(IIndicator):
                 'rsi_trend': str       # 'rising', 'falling', 'stable'
             }
         """
-        if len(data) < self.period + 1:
-            return {
-                'rsi': 50,
-                'rsi_status': 'neutral',
-                'rsi_trend': 'stable'
-            }
+        frame = as_frame(data)
 
-        closes = [d.close for d in data]
+        if frame.length < self.period + 1:
+            return dict(_RSI_DEFAULT)
 
-        # 가격 변화 계산
-        changes = [closes[i] - closes[i-1] for i in range(1, len(closes))]
+        # Wilder's smoothing RSI 시계열 (1회 계산)
+        changes = np.diff(frame.close)
+        series = rsi_series(changes, self.period)
+        rsi = float(series[-1])
 
-        gains = [c if c > 0 else 0 for c in changes]
-        losses = [-c if c < 0 else 0 for c in changes]
-
-        # Wilder's smoothing을 사용한 평균 계산
-        avg_gain = self._wilder_smooth(gains[-self.period:])
-        avg_loss = self._wilder_smooth(losses[-self.period:])
-
-        # RSI 계산
-        if avg_loss == 0:
-            rsi = 100
-        elif avg_gain == 0:
-            rsi = 0
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-
-        # 상태 판단
-        if rsi >= 70:
-            rsi_status = 'overbought'
-        elif rsi <= 30:
-            rsi_status = 'oversold'
-        else:
-            rsi_status = 'neutral'
+        rsi_status = _rsi_status(rsi)
 
-        # RSI 추세 판단 (최근 5개 RSI 비교)
+        # RSI 추세 판단 (최근 RSI 비교)
         if len(changes) >= self.period + 5:
-            recent_rsis = []
-            for i in range(5):
-                idx = -(5 - i)
-                g = gains[idx - self.period:idx] if idx != 0 else gains[-self.period:]
-                l = losses[idx - self.period:idx] if idx != 0 else losses[-self.period:]
-                ag = self._wilder_smooth(g)
-                al = self._wilder_smooth(l)
-                if al == 0:
-                    recent_rsis.append(100)
-                elif ag == 0:
-                    recent_rsis.append(0)
-                else:
-                    recent_rsis.append(100 - (100 / (1 + ag / al)))
-
-            if len(recent_rsis) >= 3:
-                if recent_rsis[-1] > recent_rsis[-3]:
-                    rsi_trend = 'rising'
-                elif recent_rsis[-1] < recent_rsis[-3]:
-                    rsi_trend = 'falling'
-                else:
-                    rsi_trend = 'stable'
-            else:
-                rsi_trend = 'stable'
+            rsi_trend = _rsi_trend(float(series[-1] - series[-3]))
         else:
             rsi_trend = 'stable'
 
         return {
-            'rsi': round(rsi, 2),
+            'rsi': rsi,
             'rsi_status': rsi_status,
             'rsi_trend': rsi_trend
         }
 
-    def _wilder_smooth(self, values: List[float]) -> float:
-        """Wilder's smoothing 방식 평균 계산"""
-        if not values:
-            return 0
-        return np.mean(values)
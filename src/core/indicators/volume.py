@@ -1,9 +1,9 @@
 """
 거래량 지표 계산기
 """
-from typing import Dict, List
+from typing import Dict, List, Union
 import numpy as np
-from .base import IIndicator, OHLCV
+from .base import IIndicator, OHLCV, OHLCVFrame, as_frame
 
 
 class VolumeIndicator(IIndicator):
@@ -16,7 +16,7 @@ class VolumeIndicator(IIndicator):
     def name(self) -> str:
         return "volume"
 
-    def calculate(self, data: List[OHLCV]) -> Dict:
+    def calculate(self, data: Union[List[OHLCV], OHLCVFrame]) -> Dict:
         """
         거래량 관련 지표 계산
 
@@ -29,17 +29,19 @@ class VolumeIndicator(IIndicator):
                 'volume_trend': str        # 'increasing', 'decreasing', 'stable'
             }
         """
-        if len(data) < self.period:
+        frame = as_frame(data)
+
+        if frame.length < self.period:
             return {
-                'current_volume': data[-1].volume if data else 0,
+                'current_volume': int(frame.volume[-1]) if frame.length else 0,
                 'avg_volume': 0,
                 'volume_ratio': 0,
                 'is_volume_surge': False,
                 'volume_trend': 'stable'
             }
 
-        volumes = [d.volume for d in data]
-        current_volume = volumes[-1]
+        volumes = frame.volume
+        current_volume = int(volumes[-1])
 
         # 평균 거래량 (이전 period 기간)
         avg_volume = np.mean(volumes[-self.period-1:-1])
@@ -53,9 +55,10 @@ class VolumeIndicator(IIndicator):
         # 추세 판단 (최근 5개)
         recent = volumes[-5:]
         if len(recent) >= 5:
-            if all(recent[i] < recent[i+1] for i in range(len(recent)-1)):
+            diffs = np.diff(recent)
+            if (diffs > 0).all():
                 volume_trend = 'increasing'
-            elif all(recent[i] > recent[i+1] for i in range(len(recent)-1)):
+            elif (diffs < 0).all():
                 volume_trend = 'decreasing'
             else:
                 volume_trend = 'stable'
@@ -64,8 +67,8 @@ class VolumeIndicator(IIndicator):
 
         return {
             'current_volume': current_volume,
-            'avg_volume': round(avg_volume, 0),
-            'volume_ratio': round(volume_ratio, 2),
+            'avg_volume': float(avg_volume),
+            'volume_ratio': volume_ratio,
             'is_volume_surge': is_volume_surge,
             'volume_trend': volume_trend
         }
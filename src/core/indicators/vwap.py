@@ -1,8 +1,9 @@
 """
 VWAP (거래량 가중평균가격) 지표 계산기
 """
-from typing import Dict, List
-from .base import IIndicator, OHLCV
+from typing import Dict, List, Union
+import numpy as np
+from .base import IIndicator, OHLCV, OHLCVFrame, as_frame
 
 
 class VWAPIndicator(IIndicator):
@@ -12,7 +13,7 @@ class VWAPIndicator(IIndicator):
     def name(self) -> str:
         return "vwap"
 
-    def calculate(self, data: List[OHLCV]) -> Dict:
+    def calculate(self, data: Union[List[OHLCV], OHLCVFrame]) -> Dict:
         """
         VWAP 계산
 
@@ -23,27 +24,27 @@ class VWAPIndicator(IIndicator):
                 'vwap_position': str       # 'above', 'at', 'below'
             }
         """
-        if not data:
+        frame = as_frame(data)
+
+        if not frame.length:
             return {
                 'vwap': 0,
                 'price_vs_vwap': 0,
                 'vwap_position': 'at'
             }
 
-        # Typical Price * Volume의 누적합
-        cumulative_tp_vol = 0
-        cumulative_vol = 0
+        volumes = frame.volume.astype(np.float64)
 
-        for d in data:
-            typical_price = (d.high + d.low + d.close) / 3
-            cumulative_tp_vol += typical_price * d.volume
-            cumulative_vol += d.volume
+        # Typical Price * Volume의 누적합
+        typical_prices = (frame.high + frame.low + frame.close) / 3
+        cumulative_tp_vol = float(np.dot(typical_prices, volumes))
+        cumulative_vol = float(volumes.sum())
 
         # VWAP 계산
         vwap = cumulative_tp_vol / cumulative_vol if cumulative_vol > 0 else 0
 
         # 현재가
-        current_price = data[-1].close
+        current_price = float(frame.close[-1])
 
         # 현재가 대비 VWAP 비율
         price_vs_vwap = ((current_price - vwap) / vwap * 100) if vwap > 0 else 0
@@ -57,8 +58,8 @@ class VWAPIndicator(IIndicator):
             vwap_position = 'at'
 
         return {
-            'vwap': round(vwap, 2),
+            'vwap': vwap,
             'current_price': current_price,
-            'price_vs_vwap': round(price_vs_vwap, 2),
+            'price_vs_vwap': price_vs_vwap,
             'vwap_position': vwap_position
         }
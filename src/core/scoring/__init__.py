@@ -1,12 +1,14 @@
 """
 점수 계산 및 신호 생성 패키지
 """
-from .calculator import ScoreCalculator
-from .signal_generator import SignalGenerator, SignalResult, signal_to_dict
+from .calculator import ScoreCalculator, IndicatorBundle
+from .signal_generator import SignalGenerator, SignalResult, get_signal_generator, signal_to_dict
 
 __all__ = [
     "ScoreCalculator",
+    "IndicatorBundle",
     "SignalGenerator",
     "SignalResult",
+    "get_signal_generator",
     "signal_to_dict"
 ]
@@ -3,12 +3,65 @@
 - 각 지표별 점수 계산
 - 스타일별 가중치 적용
 """
-from typing import Dict, Tuple
+from typing import Dict, NamedTuple, Tuple
+import numpy as np
 from ...config.constants import (
     TradingStyle, WEIGHT_CONFIGS, WeightConfig,
     VOLUME_SCORE_THRESHOLDS, STRENGTH_SCORE_THRESHOLDS
 )
 
+# 지표 데이터 누락 시 사용하는 공용 빈 dict (읽기 전용)
+_EMPTY: Dict = {}
+
+# RSI 구간 테이블 (경계값, searchsorted side, 배율, 설명)
+# 단기 매매: 중립~과열 구간 선호 (모멘텀), 각 구간은 좌폐구간 [a, b)
+_RSI_TABLE_SHORT = (
+    np.array([30, 40, 50, 70], dtype=np.float64),
+    'right',
+    (0.2, 0.5, 0.7, 1.0, 0.3),
+    ('과매도', '하락세', '중립', '상승세', '과열')
+)
+# 스윙: 과매도 구간 반등 선호, (-inf, 30], (30, 40], (40, 60), [60, 70), [70, inf)
+# 60/70은 좌폐구간이므로 직전 float 값을 경계로 사용
+_RSI_TABLE_SWING = (
+    np.array([30, 40, np.nextafter(60, -np.inf), np.nextafter(70, -np.inf)], dtype=np.float64),
+    'left',
+    (1.0, 0.8, 0.6, 0.4, 0.2),
+    ('과매도 (반등 기대)', '저점 접근', '중립', '상승 추세', '과열')
+)
+_RSI_TABLES = {
+    TradingStyle.SCALPING: _RSI_TABLE_SHORT,
+    TradingStyle.DAYTRADING: _RSI_TABLE_SHORT,
+    TradingStyle.SWING: _RSI_TABLE_SWING
+}
+
+
+class IndicatorBundle(NamedTuple):
+    """신호 판단용 평탄화 지표 (필수 조건/진입가에 쓰는 값만, 지표 dict에서 1회 생성)"""
+    rsi: float
+    above_ma20: bool
+    vwap_position: str
+    current_price: float
+    volume_ratio: float
+    order_book_strength: float
+
+    @classmethod
+    def from_indicators(cls, indicators: Dict) -> 'IndicatorBundle':
+        """
+        지표 dict를 IndicatorBundle로 변환
+
+        필수 조건 기본값은 누락 시 조건 미충족이 되도록 설정 (rsi=100 등)
+        """
+        vwap = indicators.get('vwap') or _EMPTY
+        return cls(
+            rsi=(indicators.get('rsi') or _EMPTY).get('rsi', 100),
+            above_ma20=(indicators.get('ma') or _EMPTY).get('above_ma20', False),
+            vwap_position=vwap.get('vwap_position', ''),
+            current_price=vwap.get('current_price', 0),
+            volume_ratio=(indicators.get('volume') or _EMPTY).get('volume_ratio', 0),
+            order_book_strength=(indicators.get('order_book') or _EMPTY).get('strength', 0)
+        )
+
 
 class ScoreCalculator:
     """점수 계산기 구현"""
@@ -17,15 +70,42 @@ class ScoreCalculator:
         self.style = style
         self.weights = WEIGHT_CONFIGS[style]
 
+        # 임계값 테이블 (내림차순) -> 부호 반전 배열로 searchsorted 조회
+        self._vol_thr = -np.array([t for t, _ in VOLUME_SCORE_THRESHOLDS], dtype=np.float64)
+        self._vol_mul = np.array([m for _, m in VOLUME_SCORE_THRESHOLDS], dtype=np.float64)
+        strength_thresholds = STRENGTH_SCORE_THRESHOLDS[style]
+        self._str_thr = -np.array([t for t, _ in strength_thresholds], dtype=np.float64)
+        self._str_mul = np.array([m for _, m in strength_thresholds], dtype=np.float64)
+        self._rsi_table = _RSI_TABLES[style]
+
+        # 지표별 점수 계산 메서드 (바인딩 1회)
+        self._calc_methods = (
+            ('volume', self.calc_volume_score),
+            ('order_book', self.calc_order_book_score),
+            ('vwap', self.calc_vwap_score),
+            ('ma', self.calc_ma_score),
+            ('rsi', self.calc_rsi_score),
+            ('macd', self.calc_macd_score),
+            ('bollinger', self.calc_bollinger_score),
+            ('obv', self.calc_obv_score)
+        )
+
+    @staticmethod
+    def _lookup_multiplier(neg_thresholds: np.ndarray, multipliers: np.ndarray, value: float) -> float:
+        """value 이하인 첫 번째 임계값의 배율 (해당 없으면 0)"""
+        idx = int(np.searchsorted(neg_thresholds, -value, side='left'))
+        if idx < len(multipliers):
+            return float(multipliers[idx])
+        return 0.0
+
     def calc_volume_score(self, data: Dict) -> Tuple[float, str]:
         """거래량 점수"""
         ratio = data.get('volume_ratio', 0)
         max_score = self.weights.volume
 
-        for threshold, multiplier in VOLUME_SCORE_THRESHOLDS:
-            if ratio >= threshold:
-                score = max_score * multiplier
-                return score, f"거래량 {ratio:.0f}%"
+        multiplier = self._lookup_multiplier(self._vol_thr, self._vol_mul, ratio)
+        if multiplier > 0:
+            return max_score * multiplier, f"거래량 {ratio:.0f}%"
 
         return 0, f"거래량 부족 {ratio:.0f}%"
 
@@ -33,12 +113,10 @@ class ScoreCalculator:
         """체결강도 점수"""
         strength = data.get('strength', 0)
         max_score = self.weights.order_book
-        thresholds = STRENGTH_SCORE_THRESHOLDS[self.style]
 
-        for threshold, multiplier in thresholds:
-            if strength >= threshold:
-                score = max_score * multiplier
-                return score, f"체결강도 {strength:.1f}%"
+        multiplier = self._lookup_multiplier(self._str_thr, self._str_mul, strength)
+        if multiplier > 0:
+            return max_score * multiplier, f"체결강도 {strength:.1f}%"
 
         return 0, f"체결강도 약함 {strength:.1f}%"
 
@@ -87,7 +165,6 @@ class ScoreCalculator:
         cross_signal = data.get('cross_signal')
         above_ma5 = data.get('above_ma5', False)
         above_ma20 = data.get('above_ma20', False)
-        above_ma60 = data.get('above_ma60', False)
 
         score = 0
         details = []
@@ -121,43 +198,11 @@ class ScoreCalculator:
         """RSI 점수"""
         max_score = self.weights.rsi
         rsi = data.get('rsi', 50)
-        status = data.get('rsi_status', 'neutral')
-        trend = data.get('rsi_trend', 'stable')
 
-        if self.style in [TradingStyle.SCALPING, TradingStyle.DAYTRADING]:
-            # 단기 매매: 중립~과열 구간 선호 (모멘텀)
-            if 50 <= rsi < 70:
-                score = max_score * 1.0
-                detail = f"RSI {rsi:.0f} 상승세"
-            elif 40 <= rsi < 50:
-                score = max_score * 0.7
-                detail = f"RSI {rsi:.0f} 중립"
-            elif rsi >= 70:
-                score = max_score * 0.3
-                detail = f"RSI {rsi:.0f} 과열"
-            elif 30 <= rsi < 40:
-                score = max_score * 0.5
-                detail = f"RSI {rsi:.0f} 하락세"
-            else:
-                score = max_score * 0.2
-                detail = f"RSI {rsi:.0f} 과매도"
-        else:  # SWING
-            # 스윙: 과매도 구간 반등 선호
-            if rsi <= 30:
-                score = max_score * 1.0
-                detail = f"RSI {rsi:.0f} 과매도 (반등 기대)"
-            elif 30 < rsi <= 40:
-                score = max_score * 0.8
-                detail = f"RSI {rsi:.0f} 저점 접근"
-            elif 40 < rsi < 60:
-                score = max_score * 0.6
-                detail = f"RSI {rsi:.0f} 중립"
-            elif 60 <= rsi < 70:
-                score = max_score * 0.4
-                detail = f"RSI {rsi:.0f} 상승 추세"
-            else:
-                score = max_score * 0.2
-                detail = f"RSI {rsi:.0f} 과열"
+        edges, side, multipliers, labels = self._rsi_table
+        idx = int(np.searchsorted(edges, rsi, side=side))
+        score = max_score * multipliers[idx]
+        detail = f"RSI {rsi:.0f} {labels[idx]}"
 
         return score, detail
 
@@ -270,26 +315,15 @@ class ScoreCalculator:
         scores = {}
         details = {}
 
-        calc_methods = {
-            'volume': (self.calc_volume_score, indicators.get('volume', {})),
-            'order_book': (self.calc_order_book_score, indicators.get('order_book', {})),
-            'vwap': (self.calc_vwap_score, indicators.get('vwap', {})),
-            'ma': (self.calc_ma_score, indicators.get('ma', {})),
-            'rsi': (self.calc_rsi_score, indicators.get('rsi', {})),
-            'macd': (self.calc_macd_score, indicators.get('macd', {})),
-            'bollinger': (self.calc_bollinger_score, indicators.get('bollinger', {})),
-            'obv': (self.calc_obv_score, indicators.get('obv', {}))
-        }
-
-        for name, (method, data) in calc_methods.items():
-            score, detail = method(data)
-            scores[name] = round(score, 2)
+        for name, method in self._calc_methods:
+            score, detail = method(indicators.get(name) or _EMPTY)
+            scores[name] = score
             details[name] = detail
 
         total_score = sum(scores.values())
 
         return {
-            'total_score': round(total_score, 2),
+            'total_score': total_score,
             'scores_breakdown': scores,
             'details': details
         }
@@ -3,18 +3,34 @@
 - 점수 기반 매매 신호 생성
 - 필수 조건 체크
 - 매매 파라미터 생성
+- 모든 판정(신호 임계값, 필수 조건, 스크리닝/자동매매 min_score)은 전체 정밀도 값 기준
+  (소수점 반올림은 API 응답에서만 적용)
 """
-from typing import Dict, List
+from typing import Dict, List, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 
 from ...config.constants import (
     TradingStyle, SignalType, SIGNAL_THRESHOLDS,
     MANDATORY_CONDITIONS, TRADE_PARAMS
 )
-from .calculator import ScoreCalculator
+from .calculator import ScoreCalculator, IndicatorBundle
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _compute_levels(price: float, style: TradingStyle) -> Tuple[float, float, float]:
+    """진입가 기준 손절/익절가 계산 (캐시됨)"""
+    params = TRADE_PARAMS[style]
+    return (
+        round(price * (1 + params.stop_loss_pct / 100), 0),
+        round(price * (1 + params.take_profit_1_pct / 100), 0),
+        round(price * (1 + params.take_profit_2_pct / 100), 0)
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class SignalResult:
     """신호 결과"""
     signal: SignalType
@@ -37,29 +53,27 @@ class SignalGenerator:
         self.mandatory_config = MANDATORY_CONDITIONS[style]
         self.trade_config = TRADE_PARAMS[style]
 
-    def check_mandatory(self, indicators: Dict) -> Dict[str, bool]:
+    def check_mandatory(self, indicators: Union[Dict, IndicatorBundle]) -> Dict[str, bool]:
         """필수 조건 체크"""
         checks = {}
+        if not isinstance(indicators, IndicatorBundle):
+            indicators = IndicatorBundle.from_indicators(indicators)
 
-        volume_data = indicators.get('volume', {})
-        order_book_data = indicators.get('order_book', {})
-        vwap_data = indicators.get('vwap', {})
-        rsi_data = indicators.get('rsi', {})
-        ma_data = indicators.get('ma', {})
+        volume_ratio = indicators.volume_ratio
 
         if self.style == TradingStyle.SCALPING:
-            checks['체결강도≥120%'] = order_book_data.get('strength', 0) >= 120
-            checks['거래량≥200%'] = volume_data.get('volume_ratio', 0) >= 200
+            checks['체결강도≥120%'] = indicators.order_book_strength >= 120
+            checks['거래량≥200%'] = volume_ratio >= 200
 
         elif self.style == TradingStyle.DAYTRADING:
-            checks['체결강도≥110%'] = order_book_data.get('strength', 0) >= 110
-            checks['거래량≥200%'] = volume_data.get('volume_ratio', 0) >= 200
-            checks['VWAP상단'] = vwap_data.get('vwap_position', '') in ['above', 'at']
+            checks['체결강도≥110%'] = indicators.order_book_strength >= 110
+            checks['거래량≥200%'] = volume_ratio >= 200
+            checks['VWAP상단'] = indicators.vwap_position in ('above', 'at')
 
         else:  # SWING
-            checks['RSI<70'] = rsi_data.get('rsi', 100) < 70
-            checks['20일선위'] = ma_data.get('above_ma20', False)
-            checks['거래량증가'] = volume_data.get('volume_ratio', 0) >= 100
+            checks['RSI<70'] = indicators.rsi < 70
+            checks['20일선위'] = indicators.above_ma20
+            checks['거래량증가'] = volume_ratio >= 100
 
         checks['all_passed'] = all(v for k, v in checks.items() if k != 'all_passed')
         return checks
@@ -71,14 +85,15 @@ class SignalGenerator:
         total_score = score_result['total_score']
 
         # 필수 조건 체크
-        mandatory = self.check_mandatory(indicators)
+        bundle = IndicatorBundle.from_indicators(indicators)
+        mandatory = self.check_mandatory(bundle)
 
         # 신호 결정
         signal = self._determine_signal(total_score, mandatory)
 
         # 매매 파라미터 생성
         if current_price == 0:
-            current_price = indicators.get('vwap', {}).get('current_price', 0)
+            current_price = bundle.current_price
         trade_params = self._generate_trade_params(current_price, signal)
 
         # 신뢰도 계산
@@ -87,7 +102,7 @@ class SignalGenerator:
             confidence *= 0.7
 
         # 판단 근거 생성
-        reasons = self._generate_reasons(score_result, mandatory, signal)
+        reasons = self._generate_reasons(total_score, score_result, mandatory, signal)
 
         return SignalResult(
             signal=signal,
@@ -96,12 +111,12 @@ class SignalGenerator:
             details=score_result['details'],
             mandatory_check=mandatory,
             trade_params=trade_params,
-            confidence=round(confidence, 2),
+            confidence=confidence,
             reasons=reasons
         )
 
     def _determine_signal(self, score: float, mandatory: Dict) -> SignalType:
-        """신호 결정"""
+        """신호 결정 (전체 정밀도 총점 기준, 표시용 반올림 값과 무관)"""
         if not mandatory['all_passed']:
             if score >= self.thresholds.watch:
                 return SignalType.WATCH
@@ -126,19 +141,16 @@ class SignalGenerator:
             return {'action': 'NONE', 'error': 'Invalid price'}
 
         params = self.trade_config
-
-        stop_loss = price * (1 + params.stop_loss_pct / 100)
-        take_profit_1 = price * (1 + params.take_profit_1_pct / 100)
-        take_profit_2 = price * (1 + params.take_profit_2_pct / 100)
+        stop_loss, take_profit_1, take_profit_2 = _compute_levels(price, self.style)
 
         return {
             'action': 'BUY',
             'entry_price': price,
-            'stop_loss': round(stop_loss, 0),
+            'stop_loss': stop_loss,
             'stop_loss_pct': params.stop_loss_pct,
-            'take_profit_1': round(take_profit_1, 0),
+            'take_profit_1': take_profit_1,
             'take_profit_1_pct': params.take_profit_1_pct,
-            'take_profit_2': round(take_profit_2, 0),
+            'take_profit_2': take_profit_2,
             'take_profit_2_pct': params.take_profit_2_pct,
             'trailing_stop_pct': params.trailing_stop_pct,
             'position_size_pct': params.position_size_pct
@@ -146,6 +158,7 @@ class SignalGenerator:
 
     def _generate_reasons(
         self,
+        total_score: float,
         score_result: Dict,
         mandatory: Dict,
         signal: SignalType
@@ -156,7 +169,7 @@ class SignalGenerator:
         # 점수 기반 근거 (상위 3개 지표)
         scores = score_result['scores_breakdown']
         details = score_result['details']
-        top_indicators = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_indicators = nlargest(3, scores.items(), key=itemgetter(1))
 
         for ind, score in top_indicators:
             if score > 0:
@@ -170,19 +183,25 @@ class SignalGenerator:
 
         # 신호별 추가 설명
         if signal == SignalType.STRONG_BUY:
-            reasons.insert(0, f"총점 {score_result['total_score']:.1f}점 - 강력 매수 신호")
+            reasons.insert(0, f"총점 {total_score:.1f}점 - 강력 매수 신호")
         elif signal == SignalType.BUY:
-            reasons.insert(0, f"총점 {score_result['total_score']:.1f}점 - 매수 신호")
+            reasons.insert(0, f"총점 {total_score:.1f}점 - 매수 신호")
         elif signal == SignalType.WATCH:
-            reasons.insert(0, f"총점 {score_result['total_score']:.1f}점 - 관심 종목")
+            reasons.insert(0, f"총점 {total_score:.1f}점 - 관심 종목")
         else:
-            reasons.insert(0, f"총점 {score_result['total_score']:.1f}점 - 대기")
+            reasons.insert(0, f"총점 {total_score:.1f}점 - 대기")
 
         return reasons
 
 
+@lru_cache(maxsize=None)
+def get_signal_generator(style: TradingStyle) -> SignalGenerator:
+    """스타일별 공유 SignalGenerator 반환 (캐시됨)"""
+    return SignalGenerator(style)
+
+
 def signal_to_dict(signal_result: SignalResult) -> Dict:
-    """SignalResult를 dict로 변환"""
+    """SignalResult를 dict로 변환 (전체 정밀도, 표시용 반올림은 API 응답에서 적용)"""
     return {
         'signal': signal_result.signal.value,
         'total_score': signal_result.total_score,
@@ -0,0 +1,165 @@
+"""
+포지션 청산 조건 커널
+- numba 설치 시 import 시점에 시그니처로 컴파일 (cache=True로 재시작 시 재사용)
+- 미설치 시 check_exit은 순수 Python, update_prices_batch는 NumPy 벡터 연산으로 동작
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba 미설치 환경
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """numba 미설치 시 데코레이터를 무시"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# 반환 코드 (PositionManager에서 ExitReason으로 매핑)
+EXIT_NONE = 0
+EXIT_STOP_LOSS = 1
+EXIT_TRAILING_STOP = 2
+EXIT_TAKE_PROFIT_1 = 3
+EXIT_TAKE_PROFIT_2 = 4
+
+
+@njit('int32(float64,float64,float64,float64,float64,float64,float64,int64)',
+      cache=True, fastmath=True)
+def check_exit(price, sl, hp, entry, tmult, tp1, tp2, sold):
+    """
+    청산 조건 체크
+    - 우선순위: 손절 > 트레일링 스탑 > 1차 익절 > 2차 익절
+      (1차/2차 익절가를 동시에 넘으면 부분 청산인 1차 익절이 우선)
+
+    Args:
+        price: 현재가
+        sl: 손절가
+        hp: 최고가
+        entry: 진입가
+        tmult: 트레일링 스탑 배율 (1 - 트레일링 스탑% / 100)
+        tp1: 1차 익절가
+        tp2: 2차 익절가
+        sold: 누적 청산 수량
+
+    Returns:
+        EXIT_* 코드
+    """
+    # 손절 체크
+    if price <= sl:
+        return 1
+
+    # 트레일링 스탑 체크 (최고가 대비)
+    # price > entry 이고 tmult <= 1 이면 hp > entry는 자동 성립
+    # 손실 구간은 곱셈 없이 비교 1회로 통과
+    if price > entry and price <= hp * tmult:
+        return 2
+
+    # 1차 익절 체크 (아직 1차 익절 안했으면)
+    if sold == 0 and price >= tp1:
+        return 3
+
+    # 2차 익절 체크
+    if price >= tp2:
+        return 4
+
+    return 0
+
+
+def _update_prices_batch(prices, is_open, entry, inv_entry, sl, hp, tp1, tp2,
+                         tmult, sold, qty, out_price, out_pnl, out_pnl_pct, out_codes):
+    """
+    포지션 배열 일괄 가격 갱신 + 청산 조건 체크
+
+    Args:
+        prices: 행별 현재가 (가격 없는 행은 NaN)
+        is_open: 열린 포지션 여부
+        hp: 최고가 (제자리 갱신)
+        out_price, out_pnl, out_pnl_pct: 갱신 대상 행만 기록
+        out_codes: 행별 EXIT_* 코드 (갱신하지 않은 행은 0)
+
+    Returns:
+        청산 조건에 걸린 행 수
+    """
+    hits = 0
+    for i in prange(prices.shape[0]):
+        price = prices[i]
+        if not is_open[i] or np.isnan(price):
+            out_codes[i] = 0
+            continue
+
+        high = hp[i]
+        if price > high:
+            high = price
+            hp[i] = high
+
+        out_price[i] = price
+        out_pnl[i] = (price - entry[i]) * qty[i]
+        out_pnl_pct[i] = (price * inv_entry[i] - 1.0) * 100
+
+        code = check_exit(price, sl[i], high, entry[i], tmult[i], tp1[i], tp2[i], sold[i])
+        out_codes[i] = code
+        if code != 0:
+            hits += 1
+
+    return hits
+
+
+def _update_prices_batch_numpy(prices, is_open, entry, inv_entry, sl, hp, tp1, tp2,
+                               tmult, sold, qty, out_price, out_pnl, out_pnl_pct, out_codes):
+    """_update_prices_batch의 NumPy 구현 (numba 미설치 시)"""
+    out_codes[:] = 0
+    rows = np.flatnonzero(is_open & ~np.isnan(prices))
+    if rows.size == 0:
+        return 0
+
+    price = prices[rows]
+    high = np.maximum(hp[rows], price)
+    entry_r = entry[rows]
+
+    hp[rows] = high
+    out_price[rows] = price
+    out_pnl[rows] = (price - entry_r) * qty[rows]
+    out_pnl_pct[rows] = (price * inv_entry[rows] - 1.0) * 100
+
+    # check_exit과 동일한 우선순위 (손절 > 트레일링 > 1차 익절 > 2차 익절)
+    codes = np.select(
+        [
+            price <= sl[rows],
+            (price <= high * tmult[rows]) & (price > entry_r),
+            (sold[rows] == 0) & (price >= tp1[rows]),
+            price >= tp2[rows]
+        ],
+        [EXIT_STOP_LOSS, EXIT_TRAILING_STOP, EXIT_TAKE_PROFIT_1, EXIT_TAKE_PROFIT_2],
+        default=EXIT_NONE
+    )
+    out_codes[rows] = codes
+    return int(np.count_nonzero(codes))
+
+
+# NaN 판정이 필요하므로 fastmath 미사용
+_BATCH_SIGNATURE = (
+    'int64(float64[:], boolean[:], float64[:], float64[:], float64[:], float64[:], '
+    'float64[:], float64[:], float64[:], int64[:], int64[:], '
+    'float64[:], float64[:], float64[:], int32[:])'
+)
+
+# 이 행 수 이상이면 병렬 커널 사용 (그 이하는 스레드 분배 비용이 더 큼)
+PARALLEL_MIN_ROWS = 4096
+
+if NUMBA_AVAILABLE:
+    _batch_serial = njit(_BATCH_SIGNATURE, cache=True, boundscheck=False)(_update_prices_batch)
+    _batch_parallel = njit(
+        _BATCH_SIGNATURE, cache=True, boundscheck=False, parallel=True
+    )(_update_prices_batch)
+
+    def update_prices_batch(prices, *arrays):
+        """행 수에 따라 직렬/병렬 커널 선택"""
+        if prices.shape[0] >= PARALLEL_MIN_ROWS:
+            return _batch_parallel(prices, *arrays)
+        return _batch_serial(prices, *arrays)
+else:  # pragma: no cover - numba 미설치 환경
+    update_prices_batch = _update_prices_batch_numpy
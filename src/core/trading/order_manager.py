@@ -4,21 +4,31 @@
 - 주문 상태 관리
 - 체결 처리
 """
-from typing import Dict, List, Optional, Callable, Awaitable
+from typing import Dict, List, Optional, Callable, Awaitable, Set
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-import uuid
+from itertools import count, islice
 import asyncio
+import logging
 
 from ...config.constants import OrderType, OrderSide, OrderStatus
 from ...core.broker.interfaces import IBrokerClient, OrderResult
+from ...core.broker.interfaces import OrderSide as BrokerOrderSide
+from ...core.broker.interfaces import OrderType as BrokerOrderType
 
+# 내부 주문 enum → 브로커 enum
+_SIDE_MAP = {OrderSide.BUY: BrokerOrderSide.BUY, OrderSide.SELL: BrokerOrderSide.SELL}
+_TYPE_MAP = {OrderType.MARKET: BrokerOrderType.MARKET, OrderType.LIMIT: BrokerOrderType.LIMIT}
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class OrderInfo:
     """주문 정보"""
-    order_id: str
+    order_id: int
     stock_code: str
     stock_name: str
     order_side: OrderSide
@@ -44,21 +54,58 @@ class OrderManager:
 
     def __init__(self, broker: IBrokerClient):
         self.broker = broker
-        self._orders: Dict[str, OrderInfo] = {}
-        self._pending_orders: List[str] = []
+        self._orders: Dict[int, OrderInfo] = {}
+        self._id_counter = count(1)  # 프로세스 내 주문 ID
+        self._pending_orders: Set[int] = set()
         self._order_callbacks: List[Callable[[OrderInfo], Awaitable[None]]] = []
 
+        # 상태 전이 시 증분 갱신되는 인덱스/집계
+        self._orders_by_stock: Dict[str, List[int]] = {}
+        self._filled_ids: List[int] = []
+        self._status_counts: Counter = Counter()
+        self._filled_counts: Counter = Counter()        # OrderSide → 체결 건수
+        self._filled_amounts: Dict[OrderSide, float] = {OrderSide.BUY: 0, OrderSide.SELL: 0}
+
+    def _register(self, order: OrderInfo):
+        """신규 주문 등록 (인덱스 반영)"""
+        self._orders[order.order_id] = order
+        self._orders_by_stock.setdefault(order.stock_code, []).append(order.order_id)
+        self._status_counts[order.status] += 1
+
+    def _transition(self, order: OrderInfo, new_status: OrderStatus):
+        """주문 상태 변경 (인덱스/집계 증분 갱신)"""
+        old_status = order.status
+        side = order.order_side
+
+        if old_status == OrderStatus.FILLED:
+            self._filled_ids.remove(order.order_id)
+            self._filled_counts[side] -= 1
+            self._filled_amounts[side] -= order.executed_price * order.executed_quantity
+
+        order.status = new_status
+        self._status_counts[old_status] -= 1
+        self._status_counts[new_status] += 1
+
+        if new_status == OrderStatus.FILLED:
+            self._filled_ids.append(order.order_id)
+            self._filled_counts[side] += 1
+            self._filled_amounts[side] += order.executed_price * order.executed_quantity
+        elif new_status == OrderStatus.CANCELED:
+            self._pending_orders.discard(order.order_id)
+
     def register_callback(self, callback: Callable[[OrderInfo], Awaitable[None]]):
         """주문 체결 콜백 등록"""
         self._order_callbacks.append(callback)
 
     async def _notify_callbacks(self, order: OrderInfo):
-        """콜백 호출"""
-        for callback in self._order_callbacks:
-            try:
-                await callback(order)
-            except Exception as e:
-                print(f"Order callback error: {e}")
+        """콜백 호출 (동시 실행)"""
+        results = await asyncio.gather(
+            *(callback(order) for callback in self._order_callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Order callback error", exc_info=result)
 
     async def place_order(
         self,
@@ -70,7 +117,7 @@ class OrderManager:
         price: Optional[float] = None
     ) -> OrderInfo:
         """주문 실행"""
-        order_id = str(uuid.uuid4())
+        order_id = next(self._id_counter)
 
         order = OrderInfo(
             order_id=order_id,
@@ -82,16 +129,13 @@ class OrderManager:
             order_quantity=quantity
         )
 
-        self._orders[order_id] = order
-        self._pending_orders.append(order_id)
+        self._register(order)
+        self._pending_orders.add(order_id)
 
         try:
             # 브로커 주문 실행
-            from ...core.broker.interfaces import OrderSide as BrokerOrderSide
-            from ...core.broker.interfaces import OrderType as BrokerOrderType
-
-            broker_side = BrokerOrderSide.BUY if side == OrderSide.BUY else BrokerOrderSide.SELL
-            broker_type = BrokerOrderType.MARKET if order_type == OrderType.MARKET else BrokerOrderType.LIMIT
+            broker_side = _SIDE_MAP[side]
+            broker_type = _TYPE_MAP[order_type]
 
             result: OrderResult = await self.broker.place_order(
                 stock_code=stock_code,
@@ -107,11 +151,11 @@ class OrderManager:
             order.message = result.message
 
             if result.executed_qty >= quantity:
-                order.status = OrderStatus.FILLED
+                self._transition(order, OrderStatus.FILLED)
             elif result.executed_qty > 0:
-                order.status = OrderStatus.PARTIAL
+                self._transition(order, OrderStatus.PARTIAL)
             else:
-                order.status = OrderStatus.PENDING
+                self._transition(order, OrderStatus.PENDING)
 
             order.updated_at = datetime.now()
 
@@ -119,13 +163,12 @@ class OrderManager:
                 await self._notify_callbacks(order)
 
         except Exception as e:
-            order.status = OrderStatus.CANCELED
+            self._transition(order, OrderStatus.CANCELED)
             order.message = str(e)
             order.updated_at = datetime.now()
 
         finally:
-            if order_id in self._pending_orders:
-                self._pending_orders.remove(order_id)
+            self._pending_orders.discard(order_id)
 
         return order
 
@@ -193,7 +236,7 @@ class OrderManager:
             price=price
         )
 
-    async def cancel_order(self, order_id: str) -> bool:
+    async def cancel_order(self, order_id: int) -> bool:
         """주문 취소"""
         order = self._orders.get(order_id)
         if not order:
@@ -203,18 +246,17 @@ class OrderManager:
             return False
 
         try:
-            result = await self.broker.cancel_order(order_id)
+            result = await self.broker.cancel_order(str(order_id))
             if result:
-                order.status = OrderStatus.CANCELED
+                self._transition(order, OrderStatus.CANCELED)
                 order.updated_at = datetime.now()
-                if order_id in self._pending_orders:
-                    self._pending_orders.remove(order_id)
             return result
         except Exception as e:
             order.message = f"Cancel failed: {e}"
+            logger.warning("Cancel failed: order_id=%s", order_id, exc_info=e)
             return False
 
-    def get_order(self, order_id: str) -> Optional[OrderInfo]:
+    def get_order(self, order_id: int) -> Optional[OrderInfo]:
         """주문 조회"""
         return self._orders.get(order_id)
 
@@ -224,36 +266,26 @@ class OrderManager:
 
     def get_orders_by_stock(self, stock_code: str) -> List[OrderInfo]:
         """종목별 주문 목록"""
-        return [o for o in self._orders.values() if o.stock_code == stock_code]
+        orders = self._orders
+        return [orders[oid] for oid in self._orders_by_stock.get(stock_code, ())]
 
     def get_filled_orders(self) -> List[OrderInfo]:
         """체결 완료 주문 목록"""
-        return [o for o in self._orders.values() if o.status == OrderStatus.FILLED]
+        orders = self._orders
+        return [orders[oid] for oid in self._filled_ids]
 
     def get_order_history(self, limit: int = 100) -> List[OrderInfo]:
-        """주문 내역 조회"""
-        orders = sorted(
-            self._orders.values(),
-            key=lambda x: x.created_at,
-            reverse=True
-        )
-        return orders[:limit]
+        """주문 내역 조회 (최신순, _orders는 생성 순서를 유지)"""
+        return list(islice(reversed(self._orders.values()), limit))
 
     def get_order_summary(self) -> Dict:
         """주문 요약"""
-        orders = list(self._orders.values())
-        filled = [o for o in orders if o.status == OrderStatus.FILLED]
-        pending = [o for o in orders if o.status == OrderStatus.PENDING]
-
-        buy_orders = [o for o in filled if o.order_side == OrderSide.BUY]
-        sell_orders = [o for o in filled if o.order_side == OrderSide.SELL]
-
         return {
-            "total_orders": len(orders),
-            "filled_orders": len(filled),
-            "pending_orders": len(pending),
-            "buy_orders": len(buy_orders),
-            "sell_orders": len(sell_orders),
-            "total_buy_amount": sum(o.executed_price * o.executed_quantity for o in buy_orders),
-            "total_sell_amount": sum(o.executed_price * o.executed_quantity for o in sell_orders)
+            "total_orders": len(self._orders),
+            "filled_orders": self._status_counts[OrderStatus.FILLED],
+            "pending_orders": self._status_counts[OrderStatus.PENDING],
+            "buy_orders": self._filled_counts[OrderSide.BUY],
+            "sell_orders": self._filled_counts[OrderSide.SELL],
+            "total_buy_amount": self._filled_amounts[OrderSide.BUY],
+            "total_sell_amount": self._filled_amounts[OrderSide.SELL]
         }
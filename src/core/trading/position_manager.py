@@ -4,21 +4,33 @@
 - 손익 계산
 - 트레일링 스탑 관리
 """
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-import uuid
+from itertools import count
+
+import numpy as np
 
 from ...config.constants import (
     TradingStyle, PositionStatus, ExitReason, TradeParams, TRADE_PARAMS
 )
+from ._exit_njit import check_exit, update_prices_batch
+
+# check_exit 반환 코드 → ExitReason
+_EXIT_REASONS = (
+    None,
+    ExitReason.STOP_LOSS,
+    ExitReason.TRAILING_STOP,
+    ExitReason.TAKE_PROFIT_1,
+    ExitReason.TAKE_PROFIT_2
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionInfo:
     """포지션 정보"""
-    position_id: str
+    position_id: int
     stock_code: str
     stock_name: str
     trading_style: TradingStyle
@@ -49,13 +61,111 @@ class PositionInfo:
     exit_time: Optional[datetime] = None
     exit_reason: Optional[ExitReason] = None
 
+    # 진입 시 고정되는 파생값 (틱마다 나눗셈 방지)
+    _inv_entry: float = field(default=0.0, init=False, repr=False)
+    _trailing_mult: float = field(default=1.0, init=False, repr=False)
+
+    def __post_init__(self):
+        self._inv_entry = 1.0 / self.entry_price if self.entry_price else 0.0
+        self._trailing_mult = 1 - self.trailing_stop_pct / 100
+
+
+def _new_position(
+    position_id: int,
+    stock_code: str,
+    stock_name: str,
+    style: TradingStyle,
+    entry_price: float,
+    quantity: int,
+    stop_loss: float,
+    take_profit_1: float,
+    take_profit_2: float,
+    trailing_pct: float
+) -> PositionInfo:
+    """신규 포지션 생성 (dataclass __init__을 거치지 않고 슬롯에 직접 기록)"""
+    p = object.__new__(PositionInfo)
+    p.position_id = position_id
+    p.stock_code = stock_code
+    p.stock_name = stock_name
+    p.trading_style = style
+    p.entry_price = entry_price
+    p.quantity = quantity
+    p.entry_time = datetime.now()
+    p.stop_loss_price = stop_loss
+    p.take_profit_1 = take_profit_1
+    p.take_profit_2 = take_profit_2
+    p.trailing_stop_pct = trailing_pct
+    p.current_price = entry_price
+    p.highest_price = entry_price
+    p.unrealized_pnl = 0
+    p.unrealized_pnl_pct = 0
+    p.sold_quantity = 0
+    p.remaining_quantity = quantity
+    p.realized_pnl = 0
+    p.status = PositionStatus.OPEN
+    p.exit_time = None
+    p.exit_reason = None
+    p._inv_entry = 1.0 / entry_price if entry_price else 0.0
+    p._trailing_mult = 1 - trailing_pct / 100
+    return p
+
 
 class PositionManager:
-    """포지션 관리자"""
+    """
+    포지션 관리자
+    - PositionInfo 외에 가격/손익 관리 필드를 행 단위 NumPy 배열(SoA)로 유지
+    - update_prices는 배열 연산으로 전 포지션을 한 번에 갱신하고,
+      PositionInfo에는 조회 시점에 반영(_flush)
+    - 배열에는 열린 포지션만 유지 (전량 청산 시 행을 당겨 제거, 생성 순서 유지)
+    - 단일 작성자 전제: 모든 변경은 TradingEngine 이벤트 루프 태스크에서만 수행
+      (락 없음, 인덱스는 PositionInfo 참조를 직접 보관)
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    # SoA 배열 이름 → dtype
+    _ARRAY_DTYPES = (
+        ('_arr_entry', np.float64),     # 진입가
+        ('_arr_sl', np.float64),        # 손절가
+        ('_arr_hp', np.float64),        # 최고가
+        ('_arr_tp1', np.float64),       # 1차 익절가
+        ('_arr_tp2', np.float64),       # 2차 익절가
+        ('_arr_tmult', np.float64),     # 트레일링 스탑 배율 (1 - pct/100)
+        ('_arr_inv_entry', np.float64), # 1 / 진입가
+        ('_arr_qty', np.int64),         # 잔여 수량
+        ('_arr_sold', np.int64),        # 청산 수량
+        ('_arr_price', np.float64),     # 현재가
+        ('_arr_pnl', np.float64),       # 미실현 손익
+        ('_arr_pnl_pct', np.float64),   # 미실현 손익률
+        ('_open_idx', np.bool_),        # 열린 포지션 여부
+    )
+
+    __slots__ = (
+        '_positions', '_positions_by_stock', '_id_counter',
+        '_open_positions', '_open_by_stock',
+        '_rows', '_row_positions', '_codes', '_size', '_stale'
+    ) + tuple(name for name, _ in _ARRAY_DTYPES)
 
     def __init__(self):
-        self._positions: Dict[str, PositionInfo] = {}
-        self._positions_by_stock: Dict[str, List[str]] = {}
+        self._positions: Dict[int, PositionInfo] = {}
+        self._positions_by_stock: Dict[str, List[PositionInfo]] = {}
+        self._id_counter = count(1)  # 프로세스 내 포지션 ID
+        self._open_positions: Dict[int, PositionInfo] = {}  # 열린 포지션 (생성 순서 유지)
+        self._open_by_stock: Dict[str, Dict[int, PositionInfo]] = {}  # 종목별 열린 포지션
+
+        # SoA 배열 (행 = 열린 포지션, 생성 순서)
+        self._rows: Dict[int, int] = {}
+        self._row_positions: List[PositionInfo] = []
+        self._codes: List[str] = []
+        self._size = 0
+        for name, dtype in self._ARRAY_DTYPES:
+            setattr(self, name, np.zeros(self._INITIAL_CAPACITY, dtype=dtype))
+        self._stale = False
+
+    def _grow_arrays(self, capacity: int):
+        """SoA 배열 용량 확장"""
+        for name, _ in self._ARRAY_DTYPES:
+            setattr(self, name, np.resize(getattr(self, name), capacity))
 
     def create_position(
         self,
@@ -67,7 +177,7 @@ class PositionManager:
         trade_params: Optional[Dict] = None
     ) -> PositionInfo:
         """새 포지션 생성"""
-        position_id = str(uuid.uuid4())
+        position_id = next(self._id_counter)
 
         # 매매 파라미터 설정
         if trade_params:
@@ -82,91 +192,179 @@ class PositionManager:
             take_profit_2 = entry_price * (1 + params.take_profit_2_pct / 100)
             trailing_pct = params.trailing_stop_pct
 
-        position = PositionInfo(
-            position_id=position_id,
-            stock_code=stock_code,
-            stock_name=stock_name,
-            trading_style=style,
-            entry_price=entry_price,
-            quantity=quantity,
-            entry_time=datetime.now(),
-            stop_loss_price=stop_loss,
-            take_profit_1=take_profit_1,
-            take_profit_2=take_profit_2,
-            trailing_stop_pct=trailing_pct,
-            current_price=entry_price,
-            highest_price=entry_price,
-            remaining_quantity=quantity
+        position = _new_position(
+            position_id, stock_code, stock_name, style, entry_price, quantity,
+            stop_loss, take_profit_1, take_profit_2, trailing_pct
         )
 
         self._positions[position_id] = position
-
-        if stock_code not in self._positions_by_stock:
-            self._positions_by_stock[stock_code] = []
-        self._positions_by_stock[stock_code].append(position_id)
+        self._open_positions[position_id] = position
+        self._open_by_stock.setdefault(stock_code, {})[position_id] = position
+        self._positions_by_stock.setdefault(stock_code, []).append(position)
+        self._append_row(position)
 
         return position
 
-    def update_price(self, position_id: str, current_price: float) -> Optional[ExitReason]:
+    def _append_row(self, position: PositionInfo):
+        """포지션을 SoA 배열에 추가"""
+        row = self._size
+        if row >= self._arr_entry.shape[0]:
+            self._grow_arrays(row * 2)
+
+        self._rows[position.position_id] = row
+        self._row_positions.append(position)
+        self._codes.append(position.stock_code)
+        self._arr_entry[row] = position.entry_price
+        self._arr_sl[row] = position.stop_loss_price
+        self._arr_hp[row] = position.highest_price
+        self._arr_tp1[row] = position.take_profit_1
+        self._arr_tp2[row] = position.take_profit_2
+        self._arr_tmult[row] = position._trailing_mult
+        self._arr_inv_entry[row] = position._inv_entry
+        self._arr_qty[row] = position.remaining_quantity
+        self._arr_sold[row] = position.sold_quantity
+        self._arr_price[row] = position.current_price
+        self._arr_pnl[row] = position.unrealized_pnl
+        self._arr_pnl_pct[row] = position.unrealized_pnl_pct
+        self._open_idx[row] = position.status != PositionStatus.CLOSED
+        self._size = row + 1
+
+    def _remove_row(self, position_id: int):
+        """청산된 포지션 행을 SoA 배열에서 제거 (이후 행을 한 칸씩 당김)"""
+        row = self._rows.pop(position_id)
+        n = self._size
+        if row < n - 1:
+            for name, _ in self._ARRAY_DTYPES:
+                arr = getattr(self, name)
+                arr[row:n - 1] = arr[row + 1:n]
+
+        del self._row_positions[row]
+        del self._codes[row]
+        for moved_row in range(row, n - 1):
+            self._rows[self._row_positions[moved_row].position_id] = moved_row
+        self._size = n - 1
+
+    def _flush(self):
+        """배열에서 갱신된 가격/손익을 PositionInfo에 반영"""
+        if not self._stale:
+            return
+        self._stale = False
+
+        rows = np.flatnonzero(self._open_idx[:self._size])
+        prices = self._arr_price[rows].tolist()
+        highs = self._arr_hp[rows].tolist()
+        pnls = self._arr_pnl[rows].tolist()
+        pnl_pcts = self._arr_pnl_pct[rows].tolist()
+        row_positions = self._row_positions
+
+        for i, row in enumerate(rows.tolist()):
+            position = row_positions[row]
+            position.current_price = prices[i]
+            position.highest_price = highs[i]
+            position.unrealized_pnl = pnls[i]
+            position.unrealized_pnl_pct = pnl_pcts[i]
+
+    def update_price(self, position_id: int, current_price: float) -> Optional[ExitReason]:
         """가격 업데이트 및 청산 조건 체크"""
         position = self._positions.get(position_id)
         if not position or position.status == PositionStatus.CLOSED:
             return None
 
-        position.current_price = current_price
+        self._flush()
+        entry_price = position.entry_price
 
         # 최고가 갱신
-        if current_price > position.highest_price:
-            position.highest_price = current_price
+        highest_price = position.highest_price
+        if current_price > highest_price:
+            highest_price = current_price
 
         # 손익 계산
-        position.unrealized_pnl = (current_price - position.entry_price) * position.remaining_quantity
-        position.unrealized_pnl_pct = ((current_price / position.entry_price) - 1) * 100
+        unrealized_pnl = (current_price - entry_price) * position.remaining_quantity
+        unrealized_pnl_pct = (current_price * position._inv_entry - 1.0) * 100
 
-        # 청산 조건 체크
-        exit_reason = self._check_exit_conditions(position)
-
-        return exit_reason
-
-    def _check_exit_conditions(self, position: PositionInfo) -> Optional[ExitReason]:
-        """청산 조건 체크"""
-        price = position.current_price
+        position.current_price = current_price
+        position.highest_price = highest_price
+        position.unrealized_pnl = unrealized_pnl
+        position.unrealized_pnl_pct = unrealized_pnl_pct
 
-        # 손절 체크
-        if price <= position.stop_loss_price:
-            return ExitReason.STOP_LOSS
+        row = self._rows[position_id]
+        self._arr_price[row] = current_price
+        self._arr_hp[row] = highest_price
+        self._arr_pnl[row] = unrealized_pnl
+        self._arr_pnl_pct[row] = unrealized_pnl_pct
 
-        # 트레일링 스탑 체크 (최고가 대비)
-        if position.highest_price > position.entry_price:
-            trailing_stop_price = position.highest_price * (1 - position.trailing_stop_pct / 100)
-            if price <= trailing_stop_price and price > position.entry_price:
-                return ExitReason.TRAILING_STOP
+        # 청산 조건 체크
+        code = check_exit(
+            float(current_price),
+            float(position.stop_loss_price),
+            float(highest_price),
+            float(entry_price),
+            position._trailing_mult,
+            float(position.take_profit_1),
+            float(position.take_profit_2),
+            position.sold_quantity
+        )
+        return _EXIT_REASONS[code]
 
-        # 1차 익절 체크 (아직 1차 익절 안했으면)
-        if position.sold_quantity == 0 and price >= position.take_profit_1:
-            return ExitReason.TAKE_PROFIT_1
+    def update_prices(
+        self,
+        prices: Dict[str, float]
+    ) -> List[Tuple[PositionInfo, float, ExitReason]]:
+        """
+        열린 포지션 일괄 가격 업데이트 및 청산 조건 체크
+
+        Args:
+            prices: 종목코드 → 현재가 (없는 종목은 건너뜀)
+
+        Returns:
+            청산 조건에 걸린 (포지션, 현재가, 청산 사유) 목록
+        """
+        n = self._size
+        if n == 0:
+            return []
+
+        price_all = np.fromiter(
+            (prices.get(code, np.nan) for code in self._codes), np.float64, n
+        )
+        codes = np.empty(n, dtype=np.int32)
+
+        hit_count = update_prices_batch(
+            price_all, self._open_idx[:n],
+            self._arr_entry[:n], self._arr_inv_entry[:n], self._arr_sl[:n], self._arr_hp[:n],
+            self._arr_tp1[:n], self._arr_tp2[:n], self._arr_tmult[:n],
+            self._arr_sold[:n], self._arr_qty[:n],
+            self._arr_price[:n], self._arr_pnl[:n], self._arr_pnl_pct[:n], codes
+        )
+        self._stale = True
 
-        # 2차 익절 체크
-        if price >= position.take_profit_2:
-            return ExitReason.TAKE_PROFIT_2
+        if hit_count == 0:
+            return []
 
-        return None
+        self._flush()
+        row_positions = self._row_positions
+        return [
+            (row_positions[row], float(price_all[row]), _EXIT_REASONS[codes[row]])
+            for row in np.flatnonzero(codes).tolist()
+        ]
 
     def partial_close(
         self,
-        position_id: str,
+        position_id: int,
         quantity: int,
         price: float,
         reason: ExitReason
     ) -> bool:
         """부분 청산"""
-        position = self._positions.get(position_id)
-        if not position:
+        try:
+            position = self._positions[position_id]
+        except KeyError:
             return False
 
         if quantity > position.remaining_quantity:
             quantity = position.remaining_quantity
 
+        self._flush()
+
         # 손익 계산
         pnl = (price - position.entry_price) * quantity
         position.realized_pnl += pnl
@@ -177,44 +375,68 @@ class PositionManager:
             position.status = PositionStatus.CLOSED
             position.exit_time = datetime.now()
             position.exit_reason = reason
+            if self._open_positions.pop(position_id, None) is not None:
+                stock_open = self._open_by_stock[position.stock_code]
+                del stock_open[position_id]
+                if not stock_open:
+                    del self._open_by_stock[position.stock_code]
+                self._remove_row(position_id)
         else:
             position.status = PositionStatus.PARTIAL_CLOSED
+            row = self._rows[position_id]
+            self._arr_qty[row] = position.remaining_quantity
+            self._arr_sold[row] = position.sold_quantity
 
         return True
 
     def close_position(
         self,
-        position_id: str,
+        position_id: int,
         price: float,
         reason: ExitReason
     ) -> bool:
         """포지션 전량 청산"""
-        position = self._positions.get(position_id)
-        if not position:
+        try:
+            position = self._positions[position_id]
+        except KeyError:
             return False
 
         return self.partial_close(position_id, position.remaining_quantity, price, reason)
 
-    def get_position(self, position_id: str) -> Optional[PositionInfo]:
+    def get_position(self, position_id: int) -> Optional[PositionInfo]:
         """포지션 조회"""
+        self._flush()
         return self._positions.get(position_id)
 
     def get_positions_by_stock(self, stock_code: str) -> List[PositionInfo]:
         """종목별 포지션 조회"""
-        position_ids = self._positions_by_stock.get(stock_code, [])
-        return [self._positions[pid] for pid in position_ids if pid in self._positions]
+        self._flush()
+        return list(self._positions_by_stock.get(stock_code, ()))
+
+    def get_open_positions_by_stock(self, stock_code: str) -> List[PositionInfo]:
+        """종목별 열린 포지션 조회"""
+        self._flush()
+        stock_open = self._open_by_stock.get(stock_code)
+        return list(stock_open.values()) if stock_open else []
 
     def get_open_positions(self) -> List[PositionInfo]:
         """열린 포지션 목록"""
-        return [p for p in self._positions.values() if p.status != PositionStatus.CLOSED]
+        self._flush()
+        return list(self._open_positions.values())
+
+    def count_open_positions(self) -> int:
+        """열린 포지션 수"""
+        return len(self._open_positions)
 
     def get_all_positions(self) -> List[PositionInfo]:
         """전체 포지션 목록"""
+        self._flush()
         return list(self._positions.values())
 
     def get_total_unrealized_pnl(self) -> float:
         """총 미실현 손익"""
-        return sum(p.unrealized_pnl for p in self.get_open_positions())
+        n = self._size
+        return float(self._arr_pnl[:n][self._open_idx[:n]].sum())
 
     def get_total_realized_pnl(self) -> float:
         """총 실현 손익"""
@@ -4,22 +4,27 @@
 - 포지션/주문 통합 관리
 - 리스크 관리
 """
-from typing import Dict, List, Optional, Callable, Awaitable
+from typing import Dict, List, Optional, Callable, Awaitable, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import asyncio
+import logging
 
 from ...config.constants import (
     TradingStyle, SignalType, OrderSide, OrderType,
-    ExitReason, PositionStatus, TRADE_PARAMS
+    ExitReason, TRADE_PARAMS
 )
 from ...core.broker.interfaces import IBrokerClient
-from ...core.scoring.signal_generator import SignalGenerator, SignalResult
+from ...core.scoring.signal_generator import SignalResult, get_signal_generator
 from .position_manager import PositionManager, PositionInfo
 from .order_manager import OrderManager, OrderInfo
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_BUY_SIGNALS = frozenset({SignalType.STRONG_BUY, SignalType.BUY})
+
+
+@dataclass(slots=True)
 class TradingConfig:
     """트레이딩 설정"""
     style: TradingStyle
@@ -31,7 +36,7 @@ class TradingConfig:
     partial_close_ratio: float = 0.5
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeDecision:
     """매매 판단 결과"""
     stock_code: str
@@ -53,13 +58,17 @@ class TradingEngine:
     ):
         self.broker = broker
         self.config = config
-        self.signal_generator = SignalGenerator(config.style)
+        self.signal_generator = get_signal_generator(config.style)
         self.position_manager = PositionManager()
         self.order_manager = OrderManager(broker)
 
         self._running = False
         self._trade_callbacks: List[Callable[[TradeDecision], Awaitable[None]]] = []
 
+        # 신호별 매매 판단 핸들러
+        self._action_handlers = dict.fromkeys(_BUY_SIGNALS, self._decide_buy)
+        self._action_handlers[SignalType.SELL] = self._decide_sell
+
         # 주문 체결 콜백 등록
         self.order_manager.register_callback(self._on_order_filled)
 
@@ -68,12 +77,14 @@ class TradingEngine:
         self._trade_callbacks.append(callback)
 
     async def _notify_trade(self, decision: TradeDecision):
-        """매매 콜백 호출"""
-        for callback in self._trade_callbacks:
-            try:
-                await callback(decision)
-            except Exception as e:
-                print(f"Trade callback error: {e}")
+        """매매 콜백 호출 (동시 실행)"""
+        results = await asyncio.gather(
+            *(callback(decision) for callback in self._trade_callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Trade callback error", exc_info=result)
 
     async def _on_order_filled(self, order: OrderInfo):
         """주문 체결 처리"""
@@ -92,11 +103,17 @@ class TradingEngine:
         self,
         stock_code: str,
         indicators: Dict,
-        current_price: float
+        current_price: Optional[float] = None
     ) -> TradeDecision:
-        """종목 분석 및 매매 판단"""
+        """
+        종목 분석 및 매매 판단
+
+        Args:
+            current_price: 현재가. None이면 브로커에서 시세를 조회하고,
+                값이 주어지면 조회 없이 그대로 사용
+        """
         # 현재가 조회
-        if current_price == 0:
+        if current_price is None:
             quote = await self.broker.get_quote(stock_code)
             current_price = quote.price
             stock_name = quote.name
@@ -107,31 +124,14 @@ class TradingEngine:
         signal = self.signal_generator.generate(indicators, current_price)
 
         # 기존 포지션 확인
-        existing_positions = self.position_manager.get_positions_by_stock(stock_code)
-        open_positions = [p for p in existing_positions if p.status != PositionStatus.CLOSED]
+        open_positions = self.position_manager.get_open_positions_by_stock(stock_code)
 
         # 매매 판단
-        action = "HOLD"
-        quantity = 0
-        reason = ""
-
-        if signal.signal in [SignalType.STRONG_BUY, SignalType.BUY]:
-            if len(open_positions) == 0:
-                # 신규 매수
-                if self._can_open_position():
-                    action = "BUY"
-                    quantity = self._calculate_position_size(current_price)
-                    reason = signal.reasons[0] if signal.reasons else "매수 신호"
-                else:
-                    reason = "최대 포지션 수 초과"
-            else:
-                reason = "이미 보유 중"
-
-        elif signal.signal == SignalType.SELL:
-            if len(open_positions) > 0:
-                action = "SELL"
-                quantity = sum(p.remaining_quantity for p in open_positions)
-                reason = "매도 신호"
+        handler = self._action_handlers.get(signal.signal)
+        if handler:
+            action, quantity, reason = handler(signal, open_positions, current_price)
+        else:
+            action, quantity, reason = "HOLD", 0, ""
 
         decision = TradeDecision(
             stock_code=stock_code,
@@ -145,6 +145,37 @@ class TradingEngine:
 
         return decision
 
+    def _decide_buy(
+        self,
+        signal: SignalResult,
+        open_positions: List[PositionInfo],
+        current_price: float
+    ) -> Tuple[str, int, str]:
+        """매수 신호 판단"""
+        if open_positions:
+            return "HOLD", 0, "이미 보유 중"
+
+        # 신규 매수
+        if not self._can_open_position():
+            return "HOLD", 0, "최대 포지션 수 초과"
+
+        quantity = self._calculate_position_size(current_price)
+        reason = signal.reasons[0] if signal.reasons else "매수 신호"
+        return "BUY", quantity, reason
+
+    def _decide_sell(
+        self,
+        signal: SignalResult,
+        open_positions: List[PositionInfo],
+        current_price: float
+    ) -> Tuple[str, int, str]:
+        """매도 신호 판단"""
+        if not open_positions:
+            return "HOLD", 0, ""
+
+        quantity = sum(p.remaining_quantity for p in open_positions)
+        return "SELL", quantity, "매도 신호"
+
     async def execute_decision(self, decision: TradeDecision) -> Optional[OrderInfo]:
         """매매 판단 실행"""
         if not self.config.enable_auto_trade:
@@ -170,14 +201,13 @@ class TradingEngine:
             )
 
             # 포지션 청산 처리
-            positions = self.position_manager.get_positions_by_stock(decision.stock_code)
+            positions = self.position_manager.get_open_positions_by_stock(decision.stock_code)
             for pos in positions:
-                if pos.status != PositionStatus.CLOSED:
-                    self.position_manager.close_position(
-                        pos.position_id,
-                        decision.price,
-                        ExitReason.SIGNAL
-                    )
+                self.position_manager.close_position(
+                    pos.position_id,
+                    decision.price,
+                    ExitReason.SIGNAL
+                )
 
             await self._notify_trade(decision)
             return order
@@ -186,19 +216,10 @@ class TradingEngine:
 
     async def update_positions(self, prices: Dict[str, float]):
         """포지션 가격 업데이트 및 청산 체크"""
-        for position in self.position_manager.get_open_positions():
-            stock_code = position.stock_code
-            if stock_code not in prices:
-                continue
-
-            current_price = prices[stock_code]
-            exit_reason = self.position_manager.update_price(
-                position.position_id,
-                current_price
-            )
+        exits = self.position_manager.update_prices(prices)
 
-            if exit_reason:
-                await self._handle_exit(position, current_price, exit_reason)
+        for position, current_price, exit_reason in exits:
+            await self._handle_exit(position, current_price, exit_reason)
 
     async def _handle_exit(
         self,
@@ -240,7 +261,7 @@ class TradingEngine:
 
     def _can_open_position(self) -> bool:
         """신규 포지션 가능 여부"""
-        open_count = len(self.position_manager.get_open_positions())
+        open_count = self.position_manager.count_open_positions()
         return open_count < self.config.max_positions
 
     def _calculate_position_size(self, price: float) -> int:
@@ -279,7 +300,9 @@ class TradingEngine:
         self.config.enable_auto_trade = enabled
 
     def update_config(self, **kwargs):
-        """설정 업데이트"""
+        """설정 업데이트 (스타일이 바뀌면 신호 생성기도 교체)"""
         for key, value in kwargs.items():
             if hasattr(self.config, key):
                 setattr(self.config, key, value)
+        if 'style' in kwargs:
+            self.signal_generator = get_signal_generator(self.config.style)
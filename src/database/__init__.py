@@ -7,6 +7,9 @@ from .connection import (
     init_db,
     close_db,
     get_session,
+    get_read_session,
+    read_session,
+    write_session,
     DatabaseManager,
     db_manager
 )
@@ -23,6 +26,9 @@ __all__ = [
     "init_db",
     "close_db",
     "get_session",
+    "get_read_session",
+    "read_session",
+    "write_session",
     "DatabaseManager",
     "db_manager",
     "BaseRepository",
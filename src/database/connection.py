@@ -1,21 +1,73 @@
 """
 데이터베이스 연결 관리
+- DATABASE_URL은 postgresql+asyncpg:// 드라이버를 사용해야 함
 """
-from typing import AsyncGenerator, Optional
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Optional
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from ..config.settings import get_settings
 from ..models.base import Base
 
 settings = get_settings()
 
+
+def _connect_args() -> dict:
+    """asyncpg 연결 인자
+    - JIT 비활성화: 짧은 OLTP 쿼리에서 첫 쿼리 지연 방지
+    - 세션 timezone을 KST로 고정: func.now() 기본값이 naive KST 컬럼에 저장되어
+      리포지토리의 KST 기준 날짜 경계(today_midnight)와 일치
+    - PgBouncer(transaction 모드) 사용 시 prepared statement 캐시 비활성화 및
+      서버 연결 간 이름 충돌 방지를 위해 statement 이름을 매번 고유하게 생성
+    """
+    statement_cache_size = 0 if settings.db_pgbouncer else 1024
+    connect_args = {
+        'server_settings': {
+            'jit': 'off',
+            'timezone': 'Asia/Seoul',
+            'application_name': 'weighted-auto-trader'
+        },
+        'statement_cache_size': statement_cache_size,
+        'prepared_statement_cache_size': statement_cache_size
+    }
+    if settings.db_pgbouncer:
+        connect_args['prepared_statement_name_func'] = lambda: f"__asyncpg_{uuid4()}__"
+    return connect_args
+
+
+def _engine_options() -> dict:
+    """엔진 커넥션 풀 옵션"""
+    if settings.db_use_null_pool:
+        return {'poolclass': NullPool, 'connect_args': _connect_args()}
+    return {
+        'connect_args': _connect_args(),
+        'poolclass': AsyncAdaptedQueuePool,
+        'pool_size': settings.db_pool_size,
+        'max_overflow': settings.db_max_overflow,
+        'pool_recycle': settings.db_pool_recycle,
+        'pool_pre_ping': True,
+        'pool_use_lifo': True
+    }
+
+
+def _check_engine(target: AsyncEngine):
+    """드라이버/풀 구성 검증 (이벤트 루프를 막는 동기 풀 사용 방지)"""
+    if target.dialect.driver != "asyncpg":
+        raise RuntimeError(
+            f"DATABASE_URL must use postgresql+asyncpg (got {target.dialect.name}+{target.dialect.driver})"
+        )
+    if not isinstance(target.pool, (AsyncAdaptedQueuePool, NullPool)):
+        raise RuntimeError(f"Unexpected connection pool: {type(target.pool).__name__}")
+
+
 # 비동기 엔진 생성
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    poolclass=NullPool,
-    future=True
+    future=True,
+    **_engine_options()
 )
 
 # 세션 팩토리
@@ -29,6 +81,7 @@ async_session_factory = async_sessionmaker(
 
 async def init_db():
     """데이터베이스 초기화 (테이블 생성)"""
+    _check_engine(engine)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -38,8 +91,16 @@ async def close_db():
     await engine.dispose()
 
 
-async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    """세션 의존성 주입용"""
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """읽기 전용 세션 (커밋 없이 연결만 반납)"""
+    async with async_session_factory() as session:
+        yield session
+
+
+@asynccontextmanager
+async def write_session() -> AsyncIterator[AsyncSession]:
+    """쓰기 세션 (정상 종료 시 커밋, 예외 시 롤백)"""
     async with async_session_factory() as session:
         try:
             yield session
@@ -47,8 +108,18 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """세션 의존성 주입용 (쓰기)"""
+    async with write_session() as session:
+        yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """세션 의존성 주입용 (읽기 전용)"""
+    async with read_session() as session:
+        yield session
 
 
 class DatabaseManager:
@@ -65,9 +136,10 @@ class DatabaseManager:
         self._engine = create_async_engine(
             url,
             echo=settings.debug,
-            poolclass=NullPool,
-            future=True
+            future=True,
+            **_engine_options()
         )
+        _check_engine(self._engine)
 
         self._session_factory = async_sessionmaker(
             self._engine,
@@ -2,13 +2,14 @@
 리포지토리 패키지
 """
 from .base import BaseRepository
-from .position_repository import PositionRepository
+from .position_repository import PositionRepository, PositionView
 from .order_repository import OrderRepository
 from .trade_history_repository import TradeHistoryRepository
 
 __all__ = [
     "BaseRepository",
     "PositionRepository",
+    "PositionView",
     "OrderRepository",
     "TradeHistoryRepository"
 ]
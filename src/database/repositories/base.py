@@ -1,14 +1,51 @@
 """
 기본 리포지토리
 """
-from typing import Generic, TypeVar, Type, List, Optional, Any
-from sqlalchemy import select, update, delete
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Generic, TypeVar, Type, List, Optional, Any, AsyncIterator, Dict, Sequence
+import pytz
+from sqlalchemy import Row, exists, func, insert, select, text, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...models.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 
+# 시간 컬럼은 timezone 없는 DateTime(KST 기준)으로 저장됨 (DB 세션 timezone=Asia/Seoul, connection._connect_args)
+MARKET_TZ = pytz.timezone('Asia/Seoul')
+
+
+def market_now() -> datetime:
+    """장 기준(KST) 현재 시각 (naive, 컬럼 타입과 동일)"""
+    return datetime.now(MARKET_TZ).replace(tzinfo=None)
+
+
+def to_market_naive(value: datetime) -> datetime:
+    """tz-aware 값을 KST naive로 변환 (컬럼과 타입을 맞춰 캐스트 없는 인덱스 범위 검색 유지)"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(MARKET_TZ).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=2)
+def _midnight_of(day: date) -> datetime:
+    return datetime.combine(day, time.min)
+
+
+def today_midnight() -> datetime:
+    """장 기준(KST) 오늘 0시 (날짜가 바뀔 때까지 같은 객체 재사용)"""
+    return _midnight_of(datetime.now(MARKET_TZ).date())
+
+
+# 스트리밍 조회 시 한 번에 가져올 행 수
+STREAM_CHUNK_SIZE = 1000
+
+# 통계 기반 근사 행 수 (힙 스캔 없음, ANALYZE 전이면 -1)
+_APPROX_COUNT_STMT = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+)
+
 
 class BaseRepository(Generic[ModelType]):
     """기본 리포지토리 클래스"""
@@ -16,6 +53,9 @@ class BaseRepository(Generic[ModelType]):
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
+        table = model.__table__
+        self._pk_column = next(iter(table.primary_key.columns))
+        self._column_names = frozenset(table.columns.keys())
 
     async def create(self, **kwargs) -> ModelType:
         """생성"""
@@ -25,44 +65,104 @@ class BaseRepository(Generic[ModelType]):
         await self.session.refresh(instance)
         return instance
 
+    async def bulk_create(self, rows: List[Dict[str, Any]]) -> List[ModelType]:
+        """일괄 생성 (INSERT ... RETURNING 1회 실행)"""
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model)
+        result = await self.session.scalars(stmt, rows)
+        return result.all()
+
     async def get(self, id: Any) -> Optional[ModelType]:
-        """ID로 조회"""
+        """ID로 조회 (세션 identity map에 있으면 SQL 생략)"""
         return await self.session.get(self.model, id)
 
+    async def get_for_update(self, id: Any, skip_locked: bool = False) -> Optional[ModelType]:
+        """
+        행 잠금 조회 (SELECT ... FOR UPDATE, 읽은 뒤 수정하는 경로 전용)
+
+        기본은 다른 트랜잭션의 잠금이 풀릴 때까지 대기.
+        skip_locked=True(SKIP LOCKED)는 선택 사항이며, 잠긴 행은 없는 행과 마찬가지로 None 반환
+        """
+        return await self.session.get(
+            self.model,
+            id,
+            populate_existing=True,
+            with_for_update={"skip_locked": skip_locked}
+        )
+
     async def get_all(self, limit: int = 100, offset: int = 0) -> List[ModelType]:
         """전체 조회"""
         query = select(self.model).limit(limit).offset(offset)
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
+
+    async def get_all_stream(
+        self,
+        limit: Optional[int] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[ModelType]:
+        """전체 조회 (청크 단위 스트리밍)"""
+        query = select(self.model).execution_options(yield_per=chunk_size)
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.stream_scalars(query)
+        async for instance in result:
+            yield instance
+
+    async def get_all_columns(
+        self,
+        columns: Sequence[Any],
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Row]:
+        """지정 컬럼만 조회 (ORM 객체 생성 없이 Row 튜플 반환)"""
+        query = select(*columns).limit(limit).offset(offset)
+        result = await self.session.execute(query)
+        return result.all()
 
     async def update(self, id: Any, **kwargs) -> Optional[ModelType]:
-        """수정"""
-        instance = await self.get(id)
-        if instance:
-            for key, value in kwargs.items():
-                if hasattr(instance, key):
-                    setattr(instance, key, value)
-            await self.session.flush()
-            await self.session.refresh(instance)
-        return instance
+        """수정 (UPDATE ... RETURNING 1회 왕복)"""
+        values = {k: v for k, v in kwargs.items() if k in self._column_names}
+        if not values:
+            return await self.get(id)
+
+        stmt = (
+            update(self.model)
+            .where(self._pk_column == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def delete(self, id: Any) -> bool:
-        """삭제"""
-        instance = await self.get(id)
-        if instance:
-            await self.session.delete(instance)
-            await self.session.flush()
-            return True
-        return False
-
-    async def count(self) -> int:
-        """개수 조회"""
-        from sqlalchemy import func
+        """삭제 (DELETE ... RETURNING 1회 왕복, 세션에 로드된 객체는 삭제 상태로 동기화)"""
+        stmt = (
+            delete(self.model)
+            .where(self._pk_column == id)
+            .returning(self._pk_column)
+        )
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def count(self, approximate: bool = False) -> int:
+        """개수 조회 (approximate=True: pg_class 통계값, 대시보드용)"""
+        if approximate:
+            result = await self.session.execute(
+                _APPROX_COUNT_STMT, {"table_name": self.model.__tablename__}
+            )
+            estimate = result.scalar()
+            if estimate is not None and estimate >= 0:
+                return estimate
+
         query = select(func.count()).select_from(self.model)
         result = await self.session.execute(query)
         return result.scalar() or 0
 
     async def exists(self, id: Any) -> bool:
-        """존재 여부 확인"""
-        instance = await self.get(id)
-        return instance is not None
+        """존재 여부 확인 (SELECT EXISTS, 행 로딩 없음)"""
+        query = select(exists().where(self._pk_column == id))
+        result = await self.session.execute(query)
+        return bool(result.scalar())
@@ -3,12 +3,29 @@
 """
 from typing import List, Optional
 from datetime import datetime, timedelta
-from sqlalchemy import select, and_, desc
+from sqlalchemy import select, and_, bindparam, case, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .base import BaseRepository
+from .base import BaseRepository, to_market_naive, today_midnight
 from ...models.order import Order
+from ...utils.ttl_cache import TTLCache
 
+# 자주 쓰는 조회 쿼리 (모듈 로드 시 1회 생성, 값은 bindparam으로 전달)
+_BY_STOCK_STMT = (
+    select(Order)
+    .where(Order.stock_code == bindparam("stock_code"))
+    .order_by(desc(Order.order_time))
+)
+_BY_STATUS_STMT = select(Order).where(Order.status == bindparam("status"))
+_FILLED_STMT = (
+    select(Order)
+    .where(Order.status == "FILLED")
+    .order_by(desc(Order.order_time))
+    .limit(bindparam("limit"))
+)
+
+# 일일 요약 캐시 (대시보드 폴링 대응, TTL 동안의 지연은 허용)
+_DAILY_SUMMARY_CACHE = TTLCache(ttl=10, maxsize=8)
 
 class OrderRepository(BaseRepository[Order]):
     """주문 리포지토리"""
@@ -18,41 +35,29 @@ class OrderRepository(BaseRepository[Order]):
 
     async def get_by_stock(self, stock_code: str) -> List[Order]:
         """종목별 주문 조회"""
-        query = (
-            select(Order)
-            .where(Order.stock_code == stock_code)
-            .order_by(desc(Order.created_at))
-        )
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        result = await self.session.execute(_BY_STOCK_STMT, {"stock_code": stock_code})
+        return result.scalars().all()
 
     async def get_pending_orders(self) -> List[Order]:
         """대기 주문 조회"""
-        query = select(Order).where(Order.status == "PENDING")
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        result = await self.session.execute(_BY_STATUS_STMT, {"status": "PENDING"})
+        return result.scalars().all()
 
     async def get_filled_orders(self, limit: int = 100) -> List[Order]:
         """체결 완료 주문 조회"""
-        query = (
-            select(Order)
-            .where(Order.status == "FILLED")
-            .order_by(desc(Order.created_at))
-            .limit(limit)
-        )
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        result = await self.session.execute(_FILLED_STMT, {"limit": limit})
+        return result.scalars().all()
 
     async def get_today_orders(self) -> List[Order]:
         """오늘 주문 조회"""
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        today = today_midnight()
         query = (
             select(Order)
-            .where(Order.created_at >= today)
-            .order_by(desc(Order.created_at))
+            .where(Order.order_time >= today)
+            .order_by(desc(Order.order_time))
         )
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_orders_in_range(
         self,
@@ -63,15 +68,14 @@ class OrderRepository(BaseRepository[Order]):
         query = (
             select(Order)
             .where(
-                and_(
-                    Order.created_at >= start_date,
-                    Order.created_at <= end_date
+                Order.order_time.between(
+                    to_market_naive(start_date), to_market_naive(end_date)
                 )
             )
-            .order_by(desc(Order.created_at))
+            .order_by(desc(Order.order_time))
         )
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def update_order_status(
         self,
@@ -82,45 +86,49 @@ class OrderRepository(BaseRepository[Order]):
         message: Optional[str] = None
     ) -> Optional[Order]:
         """주문 상태 업데이트"""
-        order = await self.get(order_id)
-        if order:
-            order.status = status
-            if executed_price is not None:
-                order.executed_price = executed_price
-            if executed_qty is not None:
-                order.executed_qty = executed_qty
-            if message is not None:
-                order.message = message
-            await self.session.flush()
-            await self.session.refresh(order)
-        return order
+        values = {'status': status}
+        if executed_price is not None:
+            values['executed_price'] = executed_price
+        if executed_qty is not None:
+            values['executed_qty'] = executed_qty
+        if message is not None:
+            values['message'] = message
+        return await self.update(order_id, **values)
 
     async def cancel_order(self, order_id: str) -> Optional[Order]:
         """주문 취소"""
         return await self.update_order_status(order_id, "CANCELED")
 
     async def get_daily_summary(self) -> dict:
-        """일일 주문 요약"""
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        orders = await self.get_orders_in_range(today, datetime.now())
-
-        filled_orders = [o for o in orders if o.status == "FILLED"]
-        buy_orders = [o for o in filled_orders if o.order_side == "BUY"]
-        sell_orders = [o for o in filled_orders if o.order_side == "SELL"]
-
-        return {
-            "total_orders": len(orders),
-            "filled_orders": len(filled_orders),
-            "pending_orders": len([o for o in orders if o.status == "PENDING"]),
-            "canceled_orders": len([o for o in orders if o.status == "CANCELED"]),
-            "buy_count": len(buy_orders),
-            "sell_count": len(sell_orders),
-            "total_buy_amount": sum(
-                float(o.executed_price or 0) * (o.executed_qty or 0)
-                for o in buy_orders
-            ),
-            "total_sell_amount": sum(
-                float(o.executed_price or 0) * (o.executed_qty or 0)
-                for o in sell_orders
-            )
-        }
+        """일일 주문 요약 (단일 집계 쿼리, 10초 캐시)"""
+        today = today_midnight()
+        cached = _DAILY_SUMMARY_CACHE.get(today)
+        if cached is not None:
+            return dict(cached)
+
+        filled = Order.status == "FILLED"
+        filled_buy = and_(filled, Order.order_type == "BUY")
+        filled_sell = and_(filled, Order.order_type == "SELL")
+        executed_amount = Order.executed_price * Order.executed_qty
+
+        query = select(
+            func.count().label("total_orders"),
+            func.count().filter(filled).label("filled_orders"),
+            func.count().filter(Order.status == "PENDING").label("pending_orders"),
+            func.count().filter(Order.status == "CANCELED").label("canceled_orders"),
+            func.count().filter(filled_buy).label("buy_count"),
+            func.count().filter(filled_sell).label("sell_count"),
+            func.coalesce(
+                func.sum(case((filled_buy, executed_amount), else_=0)), 0
+            ).label("total_buy_amount"),
+            func.coalesce(
+                func.sum(case((filled_sell, executed_amount), else_=0)), 0
+            ).label("total_sell_amount"),
+        ).where(Order.order_time >= today)
+
+        result = await self.session.execute(query)
+        summary = dict(result.mappings().one())
+        summary["total_buy_amount"] = float(summary["total_buy_amount"])
+        summary["total_sell_amount"] = float(summary["total_sell_amount"])
+        _DAILY_SUMMARY_CACHE.set(today, summary)
+        return dict(summary)
@@ -1,14 +1,58 @@
 """
 포지션 리포지토리
 """
-from typing import List, Optional
+from dataclasses import dataclass, fields
+from decimal import Decimal
+from typing import Any, AsyncIterator, List, Optional
 from datetime import datetime
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_, bindparam, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base import BaseRepository
 from ...models.position import Position
 
+_IS_OPEN = Position.status == "OPEN"
+
+# 모니터링 루프에서 반복 호출되는 집계 쿼리 (모듈 로드 시 1회 생성)
+_COUNT_OPEN_STMT = select(func.count()).select_from(Position).where(_IS_OPEN)
+_SUM_UNREALIZED_PNL_STMT = (
+    select(func.coalesce(func.sum(Position.unrealized_pnl), 0)).where(_IS_OPEN)
+)
+
+# 자주 쓰는 조회 쿼리 (값은 bindparam으로 전달)
+_BY_STOCK_STMT = select(Position).where(Position.stock_code == bindparam("stock_code"))
+_OPEN_STMT = select(Position).where(_IS_OPEN)
+_OPEN_BY_STOCK_STMT = select(Position).where(
+    and_(
+        Position.stock_code == bindparam("stock_code"),
+        _IS_OPEN
+    )
+)
+
+
+@dataclass(slots=True)
+class PositionView:
+    """포지션 조회용 경량 DTO (ORM 상태 추적 없음)"""
+    position_id: Any
+    stock_code: str
+    trading_style: str
+    entry_price: Decimal
+    quantity: int
+    current_price: Optional[Decimal]
+    unrealized_pnl: Optional[Decimal]
+    unrealized_pnl_pct: Optional[Decimal]
+    stop_loss_price: Optional[Decimal]
+    status: str
+    entry_time: Optional[datetime]
+
+
+# PositionView 필드 순서대로 컬럼만 선택
+_OPEN_VIEW_STMT = (
+    select(*(getattr(Position, f.name) for f in fields(PositionView)))
+    .where(_IS_OPEN)
+    .order_by(Position.entry_time)
+)
+
 
 class PositionRepository(BaseRepository[Position]):
     """포지션 리포지토리"""
@@ -18,31 +62,36 @@ class PositionRepository(BaseRepository[Position]):
 
     async def get_by_stock(self, stock_code: str) -> List[Position]:
         """종목별 포지션 조회"""
-        query = select(Position).where(Position.stock_code == stock_code)
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        result = await self.session.execute(_BY_STOCK_STMT, {"stock_code": stock_code})
+        return result.scalars().all()
 
     async def get_open_positions(self) -> List[Position]:
         """열린 포지션 조회"""
-        query = select(Position).where(Position.status == "OPEN")
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        result = await self.session.execute(_OPEN_STMT)
+        return result.scalars().all()
+
+    async def iter_open_position_views(
+        self,
+        chunk_size: int = 500
+    ) -> AsyncIterator[PositionView]:
+        """열린 포지션 조회 (필요 컬럼만 스트리밍, API 응답용)"""
+        result = await self.session.stream(
+            _OPEN_VIEW_STMT.execution_options(yield_per=chunk_size)
+        )
+        async for row in result:
+            yield PositionView(*row)
 
     async def get_by_style(self, trading_style: str) -> List[Position]:
         """매매 스타일별 포지션 조회"""
         query = select(Position).where(Position.trading_style == trading_style)
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_open_by_stock(self, stock_code: str) -> Optional[Position]:
         """종목의 열린 포지션 조회"""
-        query = select(Position).where(
-            and_(
-                Position.stock_code == stock_code,
-                Position.status == "OPEN"
-            )
+        result = await self.session.execute(
+            _OPEN_BY_STOCK_STMT, {"stock_code": stock_code}
         )
-        result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
     async def close_position(
@@ -53,15 +102,13 @@ class PositionRepository(BaseRepository[Position]):
         realized_pnl: float
     ) -> Optional[Position]:
         """포지션 청산"""
-        position = await self.get(position_id)
-        if position:
-            position.status = "CLOSED"
-            position.exit_time = exit_time
-            position.current_price = exit_price
-            position.unrealized_pnl = 0
-            await self.session.flush()
-            await self.session.refresh(position)
-        return position
+        return await self.update(
+            position_id,
+            status="CLOSED",
+            exit_time=exit_time,
+            current_price=exit_price,
+            unrealized_pnl=0
+        )
 
     async def update_price(
         self,
@@ -69,31 +116,30 @@ class PositionRepository(BaseRepository[Position]):
         current_price: float,
         highest_price: float
     ) -> Optional[Position]:
-        """가격 업데이트"""
-        position = await self.get(position_id)
-        if position:
-            position.current_price = current_price
-            if highest_price > (position.highest_price or 0):
-                position.highest_price = highest_price
-
-            # 손익 계산
-            entry_price = float(position.entry_price)
-            quantity = position.quantity
-            position.unrealized_pnl = (current_price - entry_price) * quantity
-            position.unrealized_pnl_pct = ((current_price / entry_price) - 1) * 100
-
-            await self.session.flush()
-            await self.session.refresh(position)
-        return position
+        """가격 업데이트 (손익은 DB에서 계산)"""
+        stmt = (
+            update(Position)
+            .where(Position.position_id == position_id)
+            .values(
+                current_price=current_price,
+                highest_price=func.greatest(
+                    func.coalesce(Position.highest_price, 0), highest_price
+                ),
+                unrealized_pnl=(current_price - Position.entry_price) * Position.quantity,
+                unrealized_pnl_pct=(current_price / Position.entry_price - 1) * 100
+            )
+            .returning(Position)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def get_total_unrealized_pnl(self) -> float:
         """총 미실현 손익"""
-        positions = await self.get_open_positions()
-        return sum(float(p.unrealized_pnl or 0) for p in positions)
+        result = await self.session.execute(_SUM_UNREALIZED_PNL_STMT)
+        return float(result.scalar() or 0)
 
     async def count_open_positions(self) -> int:
         """열린 포지션 수"""
-        from sqlalchemy import func
-        query = select(func.count()).select_from(Position).where(Position.status == "OPEN")
-        result = await self.session.execute(query)
+        result = await self.session.execute(_COUNT_OPEN_STMT)
         return result.scalar() or 0
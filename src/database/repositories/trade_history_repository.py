@@ -3,11 +3,15 @@
 """
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
-from sqlalchemy import select, and_, desc, func
+from sqlalchemy import select, desc, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .base import BaseRepository
+from .base import BaseRepository, market_now, to_market_naive, today_midnight
 from ...models.trade_history import TradeHistory
+from ...utils.ttl_cache import TTLCache
+
+# 월간 요약 캐시 (대시보드 폴링 대응, TTL 동안의 지연은 허용)
+_MONTHLY_SUMMARY_CACHE = TTLCache(ttl=60, maxsize=128)
 
 
 class TradeHistoryRepository(BaseRepository[TradeHistory]):
@@ -25,7 +29,7 @@ class TradeHistoryRepository(BaseRepository[TradeHistory]):
             .limit(limit)
         )
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_style(self, trading_style: str, limit: int = 100) -> List[TradeHistory]:
         """매매 스타일별 거래내역 조회"""
@@ -36,7 +40,7 @@ class TradeHistoryRepository(BaseRepository[TradeHistory]):
             .limit(limit)
         )
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_in_range(
         self,
@@ -47,20 +51,18 @@ class TradeHistoryRepository(BaseRepository[TradeHistory]):
         query = (
             select(TradeHistory)
             .where(
-                and_(
-                    TradeHistory.exit_time >= start_date,
-                    TradeHistory.exit_time <= end_date
+                TradeHistory.exit_time.between(
+                    to_market_naive(start_date), to_market_naive(end_date)
                 )
             )
             .order_by(desc(TradeHistory.exit_time))
         )
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_today_trades(self) -> List[TradeHistory]:
         """오늘 거래내역 조회"""
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        return await self.get_in_range(today, datetime.now())
+        return await self.get_in_range(today_midnight(), market_now())
 
     async def get_winning_trades(self, limit: int = 100) -> List[TradeHistory]:
         """수익 거래 조회"""
@@ -71,7 +73,7 @@ class TradeHistoryRepository(BaseRepository[TradeHistory]):
             .limit(limit)
         )
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_losing_trades(self, limit: int = 100) -> List[TradeHistory]:
         """손실 거래 조회"""
@@ -82,7 +84,7 @@ class TradeHistoryRepository(BaseRepository[TradeHistory]):
             .limit(limit)
         )
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_total_pnl(
         self,
@@ -94,9 +96,8 @@ class TradeHistoryRepository(BaseRepository[TradeHistory]):
 
         if start_date and end_date:
             query = query.where(
-                and_(
-                    TradeHistory.exit_time >= start_date,
-                    TradeHistory.exit_time <= end_date
+                TradeHistory.exit_time.between(
+                    to_market_naive(start_date), to_market_naive(end_date)
                 )
             )
 
@@ -108,13 +109,37 @@ class TradeHistoryRepository(BaseRepository[TradeHistory]):
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None
     ) -> Dict:
-        """거래 통계 조회"""
+        """거래 통계 조회 (단일 집계 쿼리)"""
+        pnl = TradeHistory.realized_pnl
+        holding_minutes = func.extract(
+            'epoch', TradeHistory.exit_time - TradeHistory.entry_time
+        ) / 60
+
+        query = select(
+            func.count().label("total"),
+            func.count().filter(pnl > 0).label("wins"),
+            func.count().filter(pnl < 0).label("losses"),
+            func.sum(pnl).label("pnl_sum"),
+            func.sum(pnl).filter(pnl > 0).label("win_sum"),
+            func.sum(pnl).filter(pnl < 0).label("loss_sum"),
+            func.max(pnl).label("max_profit"),
+            func.min(pnl).label("max_loss"),
+            func.avg(holding_minutes).filter(
+                TradeHistory.entry_time.isnot(None)
+            ).label("avg_hold"),
+        )
+
         if start_date and end_date:
-            trades = await self.get_in_range(start_date, end_date)
-        else:
-            trades = await self.get_all(limit=10000)
+            query = query.where(
+                TradeHistory.exit_time.between(
+                    to_market_naive(start_date), to_market_naive(end_date)
+                )
+            )
+
+        row = (await self.session.execute(query)).one()
+        total = row.total
 
-        if not trades:
+        if not total:
             return {
                 "total_trades": 0,
                 "winning_trades": 0,
@@ -127,36 +152,35 @@ class TradeHistoryRepository(BaseRepository[TradeHistory]):
                 "avg_holding_time": 0
             }
 
-        pnl_list = [float(t.realized_pnl or 0) for t in trades]
-        winning = [p for p in pnl_list if p > 0]
-        losing = [p for p in pnl_list if p < 0]
-
-        # 평균 보유 시간 계산
-        holding_times = []
-        for t in trades:
-            if t.entry_time and t.exit_time:
-                delta = t.exit_time - t.entry_time
-                holding_times.append(delta.total_seconds() / 60)  # 분 단위
+        total_pnl = float(row.pnl_sum or 0)
+        win_sum = float(row.win_sum or 0)
+        loss_sum = float(row.loss_sum or 0)
 
         return {
-            "total_trades": len(trades),
-            "winning_trades": len(winning),
-            "losing_trades": len(losing),
-            "win_rate": round(len(winning) / len(trades) * 100, 2) if trades else 0,
-            "total_pnl": sum(pnl_list),
-            "avg_pnl": sum(pnl_list) / len(trades) if trades else 0,
-            "max_profit": max(pnl_list) if pnl_list else 0,
-            "max_loss": min(pnl_list) if pnl_list else 0,
-            "avg_holding_time": sum(holding_times) / len(holding_times) if holding_times else 0,
-            "profit_factor": abs(sum(winning) / sum(losing)) if losing and sum(losing) != 0 else 0
+            "total_trades": total,
+            "winning_trades": row.wins,
+            "losing_trades": row.losses,
+            "win_rate": round(row.wins / total * 100, 2),
+            "total_pnl": total_pnl,
+            "avg_pnl": total_pnl / total,
+            "max_profit": float(row.max_profit or 0),
+            "max_loss": float(row.max_loss or 0),
+            "avg_holding_time": float(row.avg_hold or 0),
+            "profit_factor": abs(win_sum / loss_sum) if loss_sum != 0 else 0
         }
 
     async def get_monthly_summary(self, year: int, month: int) -> Dict:
-        """월간 요약"""
+        """월간 요약 (60초 캐시)"""
+        cached = _MONTHLY_SUMMARY_CACHE.get((year, month))
+        if cached is not None:
+            return dict(cached)
+
         start = datetime(year, month, 1)
         if month == 12:
             end = datetime(year + 1, 1, 1)
         else:
             end = datetime(year, month + 1, 1)
 
-        return await self.get_statistics(start, end)
+        summary = await self.get_statistics(start, end)
+        _MONTHLY_SUMMARY_CACHE.set((year, month), summary)
+        return dict(summary)
@@ -3,6 +3,7 @@ WeightedAutoTrader FastAPI 애플리케이션
 """
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config.settings import get_settings
@@ -17,7 +18,7 @@ from .api.routes import (
 )
 from .api.websocket import websocket_router
 from .auth.routes import router as auth_router
-from .services import get_auto_trader
+from .utils.log_queue import setup_queue_logging, stop_queue_logging
 
 settings = get_settings()
 
@@ -25,7 +26,11 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 라이프사이클 관리"""
+    # 자동매매 서비스는 워커 부팅 후 lifespan에서 로드
+    from .services import get_auto_trader
+
     # Startup
+    setup_queue_logging(settings.log_level)
     print("[App] 서버 시작 중...")
 
     # 자동매매 설정이 활성화되어 있으면 자동 시작
@@ -51,6 +56,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[App] 자동매매 중지 실패: {e}")
 
+    stop_queue_logging()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -59,6 +66,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
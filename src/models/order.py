@@ -1,7 +1,7 @@
 """
 주문 모델
 """
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, func
+from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, Index, desc, func
 from sqlalchemy.dialects.postgresql import UUID
 from .base import Base
 
@@ -9,6 +9,10 @@ from .base import Base
 class Order(Base):
     """주문 테이블"""
     __tablename__ = "orders"
+    __table_args__ = (
+        Index("ix_orders_status_order_time", "status", desc("order_time")),
+        Index("ix_orders_stock_order_time", "stock_code", desc("order_time")),
+    )
 
     order_id = Column(String(50), primary_key=True, comment="주문번호")
     signal_id = Column(UUID(as_uuid=True), ForeignKey("signals.signal_id"), comment="신호 ID")
@@ -2,7 +2,7 @@
 포지션 모델
 """
 import uuid
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, func
+from sqlalchemy import Column, String, Integer, Numeric, DateTime, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from .base import Base
 
@@ -10,6 +10,9 @@ from .base import Base
 class Position(Base):
     """포지션 테이블"""
     __tablename__ = "positions"
+    __table_args__ = (
+        Index("ix_positions_stock_status", "stock_code", "status"),
+    )
 
     position_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, comment="포지션 ID")
     stock_code = Column(String(10), ForeignKey("stocks.code"), nullable=False, comment="종목코드")
@@ -33,7 +36,7 @@ class Position(Base):
     unrealized_pnl_pct = Column(Numeric(10, 2), comment="미실현 손익률")
 
     # 상태
-    status = Column(String(20), nullable=False, comment="포지션 상태")
+    status = Column(String(20), nullable=False, index=True, comment="포지션 상태")
 
     # 시간
     entry_time = Column(DateTime, default=func.now(), comment="진입시간")
@@ -2,7 +2,7 @@
 매매 이력 모델
 """
 import uuid
-from sqlalchemy import Column, String, Integer, Numeric, DateTime, Interval, ForeignKey, func
+from sqlalchemy import Column, String, Integer, Numeric, DateTime, Interval, ForeignKey, Index, desc, func
 from sqlalchemy.dialects.postgresql import UUID
 from .base import Base
 
@@ -10,6 +10,11 @@ from .base import Base
 class TradeHistory(Base):
     """매매 이력 테이블"""
     __tablename__ = "trade_history"
+    __table_args__ = (
+        Index("ix_trade_history_exit_time", desc("exit_time")),
+        Index("ix_trade_history_realized_pnl", "realized_pnl"),
+        Index("ix_trade_history_style_exit_time", "trading_style", desc("exit_time")),
+    )
 
     trade_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, comment="매매 ID")
     position_id = Column(UUID(as_uuid=True), ForeignKey("positions.position_id"), comment="포지션 ID")
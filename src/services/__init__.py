@@ -1,24 +1,45 @@
 """
 서비스 레이어 패키지
+- 알림/자동매매 서비스는 처음 참조될 때 import (PEP 562)
 """
-from .analysis_service import AnalysisService
+from importlib import import_module
+
+from .analysis_service import AnalysisService, analysis_for_display, indicators_for_display
 from .screening_service import ScreeningService
-from .notification_service import (
-    TelegramNotificationService,
-    NotificationManager,
-    NotificationType
-)
-from .auto_trader import (
-    AutoTrader,
-    AutoTraderConfig,
-    AutoTraderStatus,
-    get_auto_trader,
-    start_auto_trader,
-    stop_auto_trader
-)
+
+# 지연 로드 대상 (이름: 모듈)
+_LAZY_EXPORTS = {
+    "TelegramNotificationService": ".notification_service",
+    "NotificationManager": ".notification_service",
+    "NotificationType": ".notification_service",
+    "AutoTrader": ".auto_trader",
+    "AutoTraderConfig": ".auto_trader",
+    "AutoTraderStatus": ".auto_trader",
+    "get_auto_trader": ".auto_trader",
+    "start_auto_trader": ".auto_trader",
+    "stop_auto_trader": ".auto_trader",
+}
+
+
+def __getattr__(name: str):
+    """지연 로드 대상 이름 접근 시 해당 모듈 import"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """공개 이름 목록 (지연 로드 대상 포함)"""
+    return sorted(__all__)
+
 
 __all__ = [
     "AnalysisService",
+    "analysis_for_display",
+    "indicators_for_display",
     "ScreeningService",
     "TelegramNotificationService",
     "NotificationManager",
@@ -4,17 +4,68 @@
 - 지표 계산
 - 신호 생성
 """
-from typing import Dict, List, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ..config.constants import TradingStyle
 from ..core.broker import IBrokerClient, OHLCV as BrokerOHLCV
 from ..core.indicators import (
-    OHLCV, VolumeIndicator, VWAPIndicator, MovingAverageIndicator,
+    OHLCVFrame, ohlcv_list_to_frame, VolumeIndicator, VWAPIndicator, MovingAverageIndicator,
     RSIIndicator, MACDIndicator, BollingerBandIndicator,
     OBVIndicator, OrderBookIndicator
 )
-from ..core.scoring import SignalGenerator, signal_to_dict
+from ..core.scoring import get_signal_generator, signal_to_dict
+from ..utils.ttl_cache import TTLCache
+
+# OHLCV 기반 지표 캐시 (요청마다 서비스를 새로 만드는 라우트도 공유하도록 모듈 단위)
+INDICATOR_CACHE_TTL = 60
+INDICATOR_CACHE_SIZE = 512
+_INDICATOR_CACHE = TTLCache(ttl=INDICATOR_CACHE_TTL, maxsize=INDICATOR_CACHE_SIZE)
+
+# 응답용 반올림 자릿수 (서비스 결과는 전체 정밀도, API 응답에서만 반올림)
+_DISPLAY_DIGITS = {
+    'volume': (('avg_volume', 0), ('volume_ratio', 2)),
+    'vwap': (('vwap', 2), ('price_vs_vwap', 2)),
+    'rsi': (('rsi', 2),),
+    'order_book': (('strength', 2),),
+}
+_SCORE_DIGITS = 2
+
+
+def indicators_for_display(indicators: Dict) -> Dict:
+    """응답용 지표 dict (반올림 대상 지표는 복사 후 반올림)"""
+    result = dict(indicators)
+    for name, fields in _DISPLAY_DIGITS.items():
+        values = indicators.get(name)
+        if not values:
+            continue
+        values = dict(values)
+        for key, digits in fields:
+            if key in values:
+                values[key] = round(values[key], digits)
+        result[name] = values
+    return result
+
+
+def analysis_for_display(result: Dict) -> Dict:
+    """응답용 분석/스크리닝 결과 (점수, 신뢰도, 지표 반올림 복사본)"""
+    result = dict(result)
+    for key in ('total_score', 'confidence', 'volume_ratio', 'strength'):
+        if key in result:
+            result[key] = round(result[key], _SCORE_DIGITS)
+    if 'scores_breakdown' in result:
+        result['scores_breakdown'] = {
+            name: round(score, _SCORE_DIGITS)
+            for name, score in result['scores_breakdown'].items()
+        }
+    if 'indicators' in result:
+        result['indicators'] = indicators_for_display(result['indicators'])
+    return result
+
+
+# 진행 중인 브로커 조회 (같은 요청은 하나의 태스크 결과를 공유)
+_INFLIGHT: Dict[Tuple, asyncio.Future] = {}
 
 
 class AnalysisService:
@@ -33,19 +84,52 @@ class AnalysisService:
         self.obv_indicator = OBVIndicator()
         self.order_book_indicator = OrderBookIndicator()
 
-    def _convert_ohlcv(self, broker_data: List[BrokerOHLCV]) -> List[OHLCV]:
-        """브로커 OHLCV를 지표 OHLCV로 변환"""
-        return [
-            OHLCV(
-                timestamp=str(d.timestamp),
-                open=d.open,
-                high=d.high,
-                low=d.low,
-                close=d.close,
-                volume=d.volume
-            )
-            for d in broker_data
-        ]
+        # 지표별 필요한 최근 봉 수 (결과가 전체 이력과 동일한 지표만)
+        # VWAP/OBV 누적값과 RSI/MACD 재귀 평활은 전체 이력에 의존하므로 제외
+        self.ohlcv_windows = {
+            'volume': self.volume_indicator.period + 1,
+            'ma': max(max(self.ma_indicator.periods), 21),
+            'bollinger': self.bollinger_indicator.period + 1
+        }
+
+        # 같은 봉 데이터로 반복 호출 시 지표 재계산 생략
+        self._indicator_cache = _INDICATOR_CACHE
+
+    def _convert_ohlcv_soa(self, broker_data: List[BrokerOHLCV]) -> OHLCVFrame:
+        """브로커 OHLCV를 필드별 배열(SoA)로 1회 변환"""
+        return ohlcv_list_to_frame(broker_data)
+
+    async def _coalesced(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """동일한 브로커 조회가 진행 중이면 그 결과를 함께 기다림 (single-flight)"""
+        key = (id(self.broker),) + key
+        task = _INFLIGHT.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            _INFLIGHT[key] = task
+            task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+        # 한 호출자가 취소돼도 공유 태스크는 유지
+        return await asyncio.shield(task)
+
+    def _get_ohlcv(self, stock_code: str, period: str) -> Awaitable[List[BrokerOHLCV]]:
+        """OHLCV 조회 (중복 요청 병합)"""
+        return self._coalesced(
+            ('ohlcv', stock_code, period),
+            lambda: self.broker.get_ohlcv(stock_code, period, count=150)
+        )
+
+    def _get_quote(self, stock_code: str) -> Awaitable[Any]:
+        """현재가 조회 (중복 요청 병합)"""
+        return self._coalesced(
+            ('quote', stock_code),
+            lambda: self.broker.get_quote(stock_code)
+        )
+
+    def _get_execution_data(self, stock_code: str) -> Awaitable[Dict]:
+        """체결 데이터 조회 (중복 요청 병합)"""
+        return self._coalesced(
+            ('execution', stock_code),
+            lambda: self.broker.get_execution_data(stock_code)
+        )
 
     async def analyze_stock(
         self,
@@ -64,21 +148,20 @@ class AnalysisService:
         Returns:
             분석 결과 딕셔너리
         """
-        # 1. OHLCV 데이터 조회
-        ohlcv_data = await self.broker.get_ohlcv(stock_code, period, count=150)
-        ohlcv_list = self._convert_ohlcv(ohlcv_data)
-
-        # 2. 현재가 조회
-        quote = await self.broker.get_quote(stock_code)
-
-        # 3. 체결 데이터 조회
-        execution_data = await self.broker.get_execution_data(stock_code)
+        # 1~3. OHLCV / 현재가 / 체결 데이터 동시 조회 (서로 독립적)
+        ohlcv_data, quote, execution_data = await asyncio.gather(
+            self._get_ohlcv(stock_code, period),
+            self._get_quote(stock_code),
+            self._get_execution_data(stock_code)
+        )
 
         # 4. 모든 지표 계산
-        indicators = await self._calculate_all_indicators(ohlcv_list, execution_data)
+        indicators = await self._calculate_all_indicators(
+            stock_code, period, ohlcv_data, execution_data
+        )
 
         # 5. 신호 생성
-        signal_generator = SignalGenerator(trading_style)
+        signal_generator = get_signal_generator(trading_style)
         signal_result = signal_generator.generate(indicators, quote.price)
 
         # 6. 결과 조합
@@ -92,40 +175,100 @@ class AnalysisService:
             'trading_style': trading_style.value,
             'indicators': indicators,
             **signal_to_dict(signal_result),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now()  # 라우트가 ORJSONResponse로 직접 직렬화 (jsonable_encoder 미경유)
         }
 
+    async def analyze_stocks(
+        self,
+        stock_codes: List[str],
+        trading_style: TradingStyle,
+        period: str = "D",
+        max_concurrency: int = 16
+    ) -> List[Optional[Dict]]:
+        """
+        여러 종목 동시 분석 (동시 실행 수 제한)
+
+        Returns:
+            stock_codes 순서의 분석 결과 (실패한 종목은 None)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_one(stock_code: str) -> Optional[Dict]:
+            async with semaphore:
+                try:
+                    return await self.analyze_stock(stock_code, trading_style, period)
+                except Exception as e:
+                    print(f"분석 오류 ({stock_code}): {e}")
+                    return None
+
+        return await asyncio.gather(*(analyze_one(code) for code in stock_codes))
+
+    def _indicator_cache_key(
+        self,
+        stock_code: str,
+        period: str,
+        ohlcv_data: List[BrokerOHLCV]
+    ) -> Optional[Tuple]:
+        """지표 캐시 키 (마지막 봉이 바뀌거나 갱신되면 달라짐)"""
+        if not ohlcv_data:
+            return None
+        last = ohlcv_data[-1]
+        return (
+            stock_code, period, len(ohlcv_data),
+            last.timestamp, last.close, last.high, last.low, last.volume
+        )
+
     async def _calculate_all_indicators(
         self,
-        ohlcv_list: List[OHLCV],
+        stock_code: str,
+        period: str,
+        ohlcv_data: List[BrokerOHLCV],
         execution_data: Dict
     ) -> Dict:
-        """모든 지표 계산"""
+        """모든 지표 계산 (OHLCV 기반 지표는 같은 봉 데이터면 캐시 재사용)"""
+        key = self._indicator_cache_key(stock_code, period, ohlcv_data)
+        ohlcv_indicators = self._indicator_cache.get(key) if key else None
+        if ohlcv_indicators is None:
+            frame = self._convert_ohlcv_soa(ohlcv_data)
+            ohlcv_indicators = self._calculate_ohlcv_indicators(frame)
+            if key:
+                self._indicator_cache.set(key, ohlcv_indicators)
+
+        # 캐시된 지표 dict가 호출자 수정에 오염되지 않도록 지표별 dict까지 복사
+        indicators = {name: dict(values) for name, values in ohlcv_indicators.items()}
+
+        # 체결강도 (체결 데이터는 매 호출 갱신)
+        indicators['order_book'] = self.order_book_indicator.calculate(execution_data)
+
+        return indicators
+
+    def _calculate_ohlcv_indicators(self, frame: OHLCVFrame) -> Dict:
+        """OHLCV 기반 지표 계산 (모든 지표가 같은 OHLCVFrame 배열을 공유, 단기 지표는 최근 구간 뷰만 사용)"""
         indicators = {}
+        windows = self.ohlcv_windows
 
         # 거래량
-        indicators['volume'] = self.volume_indicator.calculate(ohlcv_list)
+        indicators['volume'] = self.volume_indicator.calculate(frame.tail(windows['volume']))
 
         # VWAP
-        indicators['vwap'] = self.vwap_indicator.calculate(ohlcv_list)
+        indicators['vwap'] = self.vwap_indicator.calculate(frame)
 
         # 이동평균선
-        indicators['ma'] = self.ma_indicator.calculate(ohlcv_list)
+        indicators['ma'] = self.ma_indicator.calculate(frame.tail(windows['ma']))
 
         # RSI
-        indicators['rsi'] = self.rsi_indicator.calculate(ohlcv_list)
+        indicators['rsi'] = self.rsi_indicator.calculate(frame)
 
         # MACD
-        indicators['macd'] = self.macd_indicator.calculate(ohlcv_list)
+        indicators['macd'] = self.macd_indicator.calculate(frame)
 
         # 볼린저밴드
-        indicators['bollinger'] = self.bollinger_indicator.calculate(ohlcv_list)
+        indicators['bollinger'] = self.bollinger_indicator.calculate(
+            frame.tail(windows['bollinger'])
+        )
 
         # OBV
-        indicators['obv'] = self.obv_indicator.calculate(ohlcv_list)
-
-        # 체결강도
-        indicators['order_book'] = self.order_book_indicator.calculate(execution_data)
+        indicators['obv'] = self.obv_indicator.calculate(frame)
 
         return indicators
 
@@ -135,8 +278,12 @@ class AnalysisService:
         period: str = "D"
     ) -> Dict:
         """종목 지표만 조회"""
-        ohlcv_data = await self.broker.get_ohlcv(stock_code, period, count=150)
-        ohlcv_list = self._convert_ohlcv(ohlcv_data)
-        execution_data = await self.broker.get_execution_data(stock_code)
+        ohlcv_data, execution_data = await asyncio.gather(
+            self._get_ohlcv(stock_code, period),
+            self._get_execution_data(stock_code)
+        )
 
-        return await self._calculate_all_indicators(ohlcv_list, execution_data)
+        indicators = await self._calculate_all_indicators(
+            stock_code, period, ohlcv_data, execution_data
+        )
+        return indicators
@@ -5,20 +5,23 @@
 - 포지션 모니터링 (손절/익절)
 - 텔레그램 알림
 """
-from typing import Dict, List, Optional, Callable, Set
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Callable, Set, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime, time, timedelta
 from enum import Enum
 import asyncio
+import itertools
+from time import monotonic
 import pytz
 
 from ..config.constants import TradingStyle, SignalType, ExitReason
 from ..config.settings import get_settings
-from ..core.broker import IBrokerClient, create_broker_from_settings
+from ..core.broker import IBrokerClient, BrokerError, create_broker_from_settings
 from ..core.trading import TradingEngine, TradingConfig, TradeDecision
 from .analysis_service import AnalysisService
 from .screening_service import ScreeningService
 from .notification_service import NotificationManager, NotificationType
+from ..utils.ttl_cache import TTLCache
 
 
 class AutoTraderStatus(str, Enum):
@@ -30,7 +33,7 @@ class AutoTraderStatus(str, Enum):
     MARKET_CLOSED = "closed" # 장 마감
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoTraderConfig:
     """자동매매 설정"""
     enabled: bool = False
@@ -44,6 +47,10 @@ class AutoTraderConfig:
     # 스크리닝 간격 (초)
     screening_interval: int = 60
     position_check_interval: int = 10
+    discover_interval: int = 300
+
+    # 동시 분석/시세 조회 수 (브로커 호출 제한 고려)
+    analysis_concurrency: int = 5
 
     # 매매 설정
     max_positions: int = 5
@@ -62,16 +69,51 @@ class AutoTraderConfig:
     # 필터
     min_score: float = 70.0
     signal_types: List[str] = None
+    # signal_types 멤버십 검사용 (signal_types 변경 시 update_config에서 재생성)
+    signal_type_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.signal_types is None:
             self.signal_types = ["STRONG_BUY", "BUY"]
+        self.signal_type_set = frozenset(self.signal_types)
+
+
+# 브로커 호출 실패로 간주하는 예외 (취소/종료 신호는 그대로 전파)
+_BROKER_ERRORS = (BrokerError, asyncio.TimeoutError, ConnectionError)
+
+# 초기 잔고 조회 타임아웃 (초)
+BALANCE_TIMEOUT = 5
+
+# 같은 (종목, 신호) 알림 재전송 제한 시간 (초) / 기록 최대 개수
+SIGNAL_NOTIFY_TTL = 300
+SIGNAL_NOTIFY_MAXSIZE = 1024
+
+# 트레이딩 엔진 설정으로 전달할 필드 (AutoTraderConfig 필드: TradingConfig 필드)
+_ENGINE_CONFIG_FIELDS = {
+    'trading_style': 'style',
+    'enabled': 'enable_auto_trade',
+    'max_positions': 'max_positions',
+    'max_position_pct': 'max_position_pct',
+    'total_capital': 'total_capital'
+}
 
 
 class AutoTrader:
     """자동매매 서비스"""
 
     KST = pytz.timezone('Asia/Seoul')
+    # 장 시간 판단 캐시 유효 시간 (초)
+    MARKET_STATE_TTL = 1.0
+
+    __slots__ = (
+        'broker', 'config', 'notification', 'analysis_service', 'screening_service',
+        'trading_engine', '_status', '_running', '_resume_event', '_stop_event',
+        '_trade_counter', '_today_trades', '_today_pnl', '_start_balance',
+        '_watched_stocks', '_watched_snapshot', '_last_prices',
+        '_market_state_cache', '_next_open_cache', '_next_discover_at',
+        '_signal_notify_cache', '_loops_task', '_main_task', '_position_task',
+        '_status_callbacks'
+    )
 
     def __init__(
         self,
@@ -107,18 +149,35 @@ class AutoTrader:
         # 상태
         self._status = AutoTraderStatus.STOPPED
         self._running = False
-        self._paused = False
+        # 재개 이벤트 (set=실행, clear=일시 정지) / 중지 이벤트 (대기 중인 sleep 즉시 해제)
+        self._resume_event = asyncio.Event()
+        self._resume_event.set()
+        self._stop_event = asyncio.Event()
 
         # 통계
+        self._trade_counter = itertools.count(1)
         self._today_trades = 0
         self._today_pnl = 0.0
         self._start_balance = 0.0
 
         # 모니터링
         self._watched_stocks: Set[str] = set()
+        # 순회용 불변 스냅샷 (관심종목 변경 시에만 재생성)
+        self._watched_snapshot: Tuple[str, ...] = ()
         self._last_prices: Dict[str, float] = {}
 
+        # (확인 시각(monotonic), 장 시간 여부, 사전 준비 시간 여부)
+        self._market_state_cache: Tuple[float, bool, bool] = (float('-inf'), False, False)
+        # 다음 장 시작 시각 (지나기 전까지 재사용)
+        self._next_open_cache: Optional[datetime] = None
+        # 다음 종목 발굴 시각 (monotonic)
+        self._next_discover_at = 0.0
+
+        # 최근 전송한 신호 알림 (중복 전송 방지)
+        self._signal_notify_cache = TTLCache(ttl=SIGNAL_NOTIFY_TTL, maxsize=SIGNAL_NOTIFY_MAXSIZE)
+
         # 태스크
+        self._loops_task: Optional[asyncio.Task] = None
         self._main_task: Optional[asyncio.Task] = None
         self._position_task: Optional[asyncio.Task] = None
 
@@ -132,39 +191,61 @@ class AutoTrader:
     def status(self) -> AutoTraderStatus:
         return self._status
 
+    @property
+    def today_trades(self) -> int:
+        return self._today_trades
+
+    @property
+    def _paused(self) -> bool:
+        return not self._resume_event.is_set()
+
     @property
     def is_running(self) -> bool:
         return self._running and not self._paused
 
+    async def _sleep(self, seconds: float) -> bool:
+        """중지되지 않는 한 seconds 동안 대기 (중지 시 즉시 True 반환)"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     def _now_kst(self) -> datetime:
         """현재 한국 시간"""
         return datetime.now(self.KST)
 
-    def _is_market_hours(self) -> bool:
-        """장 시간 여부"""
+    def _market_state(self) -> Tuple[bool, bool]:
+        """(장 시간 여부, 사전 준비 시간 여부) - MARKET_STATE_TTL 동안 캐시"""
+        now_mono = monotonic()
+        checked_at, market_hours, pre_market = self._market_state_cache
+        if now_mono - checked_at < self.MARKET_STATE_TTL:
+            return market_hours, pre_market
+
         now = self._now_kst()
         current_time = now.time()
 
         # 주말 제외
         if now.weekday() >= 5:
-            return False
+            market_hours = pre_market = False
+        else:
+            market_hours = self.config.market_open <= current_time <= self.config.market_close
+            pre_market = self.config.pre_market_start <= current_time < self.config.market_open
 
-        return self.config.market_open <= current_time <= self.config.market_close
+        self._market_state_cache = (now_mono, market_hours, pre_market)
+        return market_hours, pre_market
+
+    def _is_market_hours(self) -> bool:
+        """장 시간 여부"""
+        return self._market_state()[0]
 
     def _is_pre_market(self) -> bool:
         """사전 준비 시간 여부"""
-        now = self._now_kst()
-        current_time = now.time()
-
-        if now.weekday() >= 5:
-            return False
+        return self._market_state()[1]
 
-        return self.config.pre_market_start <= current_time < self.config.market_open
-
-    def _seconds_until_market_open(self) -> int:
-        """장 시작까지 남은 초"""
-        now = self._now_kst()
-        today_open = now.replace(
+    def _next_market_open(self, now: datetime) -> datetime:
+        """now 이후 첫 장 시작 시각 (주말 건너뜀)"""
+        next_open = now.replace(
             hour=self.config.market_open.hour,
             minute=self.config.market_open.minute,
             second=0,
@@ -173,12 +254,24 @@ class AutoTrader:
 
         if now.time() >= self.config.market_open:
             # 내일 장 시작
-            today_open += timedelta(days=1)
-            # 주말 건너뛰기
-            while today_open.weekday() >= 5:
-                today_open += timedelta(days=1)
+            next_open += timedelta(days=1)
+
+        # 주말 건너뛰기 (토 -> +2일, 일 -> +1일)
+        weekday = next_open.weekday()
+        if weekday >= 5:
+            next_open += timedelta(days=7 - weekday)
 
-        return int((today_open - now).total_seconds())
+        return next_open
+
+    def _seconds_until_market_open(self) -> int:
+        """장 시작까지 남은 초"""
+        now = self._now_kst()
+        next_open = self._next_open_cache
+        if next_open is None or next_open <= now:
+            next_open = self._next_market_open(now)
+            self._next_open_cache = next_open
+
+        return int((next_open - now).total_seconds())
 
     async def start(self):
         """자동매매 시작"""
@@ -186,82 +279,94 @@ class AutoTrader:
             return
 
         self._running = True
-        self._paused = False
-
-        # 브로커 연결
-        await self.broker.connect()
-        await self.trading_engine.start()
+        self._stop_event.clear()
+        self._resume_event.set()
 
-        # 알림 서비스 시작
-        settings = get_settings()
-        if settings.telegram_bot_token and settings.telegram_chat_id:
-            self.notification.configure_telegram(
-                settings.telegram_bot_token,
-                settings.telegram_chat_id,
-                enabled=True
-            )
-            await self.notification.start()
-
-        # 초기 잔고 기록
         try:
-            balance = await self.broker.get_balance()
-            self._start_balance = balance.total_balance
-        except:
-            self._start_balance = self.config.total_capital
+            # 브로커 연결
+            await self.broker.connect()
+            await self.trading_engine.start()
+
+            # 알림 서비스 시작
+            settings = get_settings()
+            if settings.telegram_bot_token and settings.telegram_chat_id:
+                self.notification.configure_telegram(
+                    settings.telegram_bot_token,
+                    settings.telegram_chat_id,
+                    enabled=True
+                )
+                await self.notification.start()
+
+            # 초기 잔고 기록
+            try:
+                balance = await asyncio.wait_for(self.broker.get_balance(), timeout=BALANCE_TIMEOUT)
+                self._start_balance = balance.total_asset
+            except _BROKER_ERRORS as e:
+                print(f"[AutoTrader] 초기 잔고 조회 실패, 설정 자본 사용: {e}")
+                self._start_balance = self.config.total_capital
+        except BaseException:
+            # 시작 도중 실패 시 연결 정리 후 중지 상태로 복원 (재시작 가능하도록)
+            self._running = False
+            self._stop_event.set()
+            await self._close_services()
+            raise
 
         # 메인 루프 시작
-        self._main_task = asyncio.create_task(self._main_loop())
-        self._position_task = asyncio.create_task(self._position_monitor_loop())
+        self._loops_task = asyncio.create_task(self._run_loops())
 
         await self._update_status(AutoTraderStatus.WAITING)
         await self._notify_system_status("started")
 
         print(f"[AutoTrader] 시작됨 - 스타일: {self.config.trading_style.value}")
 
+    async def _close_services(self):
+        """엔진/브로커/알림 서비스 종료 (한 단계가 실패해도 나머지는 계속 정리)"""
+        for close in (self.trading_engine.stop, self.broker.disconnect, self.notification.stop):
+            try:
+                await close()
+            except Exception as e:
+                print(f"[AutoTrader] 서비스 종료 오류: {e}")
+
     async def stop(self):
         """자동매매 중지"""
         if not self._running:
             return
 
         self._running = False
+        self._stop_event.set()
 
-        # 태스크 취소
-        if self._main_task:
-            self._main_task.cancel()
-            try:
-                await self._main_task
-            except asyncio.CancelledError:
-                pass
-
-        if self._position_task:
-            self._position_task.cancel()
-            try:
-                await self._position_task
-            except asyncio.CancelledError:
-                pass
+        # 루프 태스크 일괄 취소 (TaskGroup이 하위 루프까지 정리)
+        if self._loops_task:
+            self._loops_task.cancel()
+            await asyncio.gather(self._loops_task, return_exceptions=True)
+            self._loops_task = None
 
         # 일일 리포트 전송
         await self._send_daily_report()
 
         # 서비스 종료
-        await self.trading_engine.stop()
-        await self.broker.disconnect()
-        await self.notification.stop()
+        await self._close_services()
 
         await self._update_status(AutoTraderStatus.STOPPED)
         await self._notify_system_status("stopped")
 
         print("[AutoTrader] 중지됨")
 
+    async def _run_loops(self):
+        """메인/포지션 모니터링 루프 실행 (한쪽이 비정상 종료되면 다른 쪽도 함께 취소)"""
+        async with asyncio.TaskGroup() as tg:
+            self._main_task = tg.create_task(self._main_loop())
+            self._position_task = tg.create_task(self._position_monitor_loop())
+
     def pause(self):
         """일시 정지"""
-        self._paused = True
+        self._resume_event.clear()
         asyncio.create_task(self._update_status(AutoTraderStatus.PAUSED))
         print("[AutoTrader] 일시 정지")
 
     def resume(self):
         """재개"""
-        self._paused = False
+        self._resume_event.set()
         asyncio.create_task(self._update_status(AutoTraderStatus.RUNNING))
         print("[AutoTrader] 재개")
 
@@ -271,19 +376,18 @@ class AutoTrader:
 
         while self._running:
             try:
-                if self._paused:
-                    await asyncio.sleep(1)
-                    continue
+                # 일시 정지 중에는 resume()까지 대기 (폴링 없음)
+                await self._resume_event.wait()
 
                 if self._is_market_hours():
                     await self._update_status(AutoTraderStatus.RUNNING)
                     await self._trading_cycle()
-                    await asyncio.sleep(self.config.screening_interval)
+                    await self._sleep(self.config.screening_interval)
 
                 elif self._is_pre_market():
                     await self._update_status(AutoTraderStatus.WAITING)
                     await self._pre_market_preparation()
-                    await asyncio.sleep(30)
+                    await self._sleep(30)
 
                 else:
                     await self._update_status(AutoTraderStatus.MARKET_CLOSED)
@@ -296,7 +400,7 @@ class AutoTrader:
 
                     # 장 시작 대기
                     wait_seconds = min(self._seconds_until_market_open(), 300)
-                    await asyncio.sleep(wait_seconds)
+                    await self._sleep(wait_seconds)
 
             except asyncio.CancelledError:
                 break
@@ -307,7 +411,7 @@ class AutoTrader:
                     error_type="MainLoopError",
                     message=str(e)
                 )
-                await asyncio.sleep(5)
+                await self._sleep(5)
 
     async def _pre_market_preparation(self):
         """장 시작 전 준비"""
@@ -321,12 +425,16 @@ class AutoTrader:
             )
 
             self._watched_stocks = set(s['stock_code'] for s in discovered)
+            self._refresh_watched_snapshot()
             print(f"[AutoTrader] 관심종목 {len(self._watched_stocks)}개 발굴")
 
             # 상위 신호 종목 알림
             top_stocks = discovered[:5]
             for stock in top_stocks:
-                if stock['signal'] in self.config.signal_types:
+                if (
+                    stock['signal'] in self.config.signal_type_set
+                    and self._should_notify_signal(stock['stock_code'], stock['signal'])
+                ):
                     await self.notification.notify(
                         NotificationType.SIGNAL,
                         stock_code=stock['stock_code'],
@@ -351,9 +459,10 @@ class AutoTrader:
             # 1. 관심종목 분석 및 신호 감지
             await self._analyze_and_trade()
 
-            # 2. 새 종목 발굴 (5분마다)
-            now = self._now_kst()
-            if now.minute % 5 == 0:
+            # 2. 새 종목 발굴 (discover_interval마다 1회)
+            now_mono = monotonic()
+            if now_mono >= self._next_discover_at:
+                self._next_discover_at = now_mono + self.config.discover_interval
                 await self._discover_new_stocks()
 
         except Exception as e:
@@ -364,89 +473,82 @@ class AutoTrader:
         if not self._watched_stocks:
             return
 
-        for stock_code in list(self._watched_stocks):
-            try:
-                # 분석
-                analysis = await self.analysis_service.analyze_stock(
-                    stock_code,
-                    self.config.trading_style
-                )
+        # 분석은 동시에 수행, 주문은 일일 제한 체크를 위해 순차 실행
+        stock_codes = self._watched_snapshot
+        analyses = await self.analysis_service.analyze_stocks(
+            stock_codes,
+            self.config.trading_style,
+            max_concurrency=self.config.analysis_concurrency
+        )
+
+        for stock_code, analysis in zip(stock_codes, analyses):
+            if analysis is None:
+                continue
 
+            try:
                 # 가격 업데이트
                 self._last_prices[stock_code] = analysis['current_price']
 
-                # 신호 확인
+                # 신호 확인 -> 기대 매매 방향 결정
                 signal = analysis.get('signal', 'HOLD')
                 score = analysis.get('total_score', 0)
 
-                if signal in self.config.signal_types and score >= self.config.min_score:
-                    # 매수 신호
-                    if self.config.auto_buy_enabled:
-                        decision = await self.trading_engine.analyze_stock(
-                            stock_code,
-                            analysis.get('indicators', {}),
-                            analysis['current_price']
-                        )
+                if signal in self.config.signal_type_set and score >= self.config.min_score:
+                    action = "BUY" if self.config.auto_buy_enabled else None
+                elif signal == "SELL":
+                    action = "SELL" if self.config.auto_sell_enabled else None
+                else:
+                    action = None
 
-                        if decision.action == "BUY":
-                            await self._execute_buy(decision, analysis)
+                if action is None:
+                    continue
 
-                elif signal == "SELL":
-                    # 매도 신호
-                    if self.config.auto_sell_enabled:
-                        decision = await self.trading_engine.analyze_stock(
-                            stock_code,
-                            analysis.get('indicators', {}),
-                            analysis['current_price']
-                        )
+                # 트레이딩 엔진 판단은 종목당 1회
+                decision = await self.trading_engine.analyze_stock(
+                    stock_code,
+                    analysis.get('indicators', {}),
+                    analysis['current_price']
+                )
 
-                        if decision.action == "SELL":
-                            await self._execute_sell(decision, analysis)
+                if decision.action == action:
+                    await self._execute(decision, analysis)
 
             except Exception as e:
-                print(f"[AutoTrader] 종목 분석 오류 ({stock_code}): {e}")
+                print(f"[AutoTrader] 종목 매매 오류 ({stock_code}): {e}")
 
-    async def _execute_buy(self, decision: TradeDecision, analysis: Dict):
-        """매수 실행"""
-        # 일일 거래 수 체크
-        if self._today_trades >= self.config.max_daily_trades:
+    async def _execute(self, decision: TradeDecision, analysis: Dict):
+        """매수/매도 실행 (decision.action 기준)"""
+        is_buy = decision.action == "BUY"
+
+        # 일일 거래 수 체크 (매수만)
+        if is_buy and self._today_trades >= self.config.max_daily_trades:
             return
 
         order = await self.trading_engine.execute_decision(decision)
 
         if order:
-            self._today_trades += 1
-            print(f"[AutoTrader] 매수 실행: {decision.stock_name} {decision.quantity}주 @ {decision.price:,}원")
+            self._today_trades = next(self._trade_counter)
+            label = "매수" if is_buy else "매도"
+            print(f"[AutoTrader] {label} 실행: {decision.stock_name} {decision.quantity}주 @ {decision.price:,}원")
 
             # 알림
             await self.notification.notify(
                 NotificationType.ORDER_FILLED,
                 stock_code=decision.stock_code,
                 stock_name=decision.stock_name,
-                order_type="BUY",
+                order_type=decision.action,
                 quantity=decision.quantity,
                 price=int(decision.price),
-                order_id=order.order_id
+                order_id=str(order.order_id)
             )
 
-    async def _execute_sell(self, decision: TradeDecision, analysis: Dict):
-        """매도 실행"""
-        order = await self.trading_engine.execute_decision(decision)
-
-        if order:
-            self._today_trades += 1
-            print(f"[AutoTrader] 매도 실행: {decision.stock_name} {decision.quantity}주 @ {decision.price:,}원")
-
-            # 알림
-            await self.notification.notify(
-                NotificationType.ORDER_FILLED,
-                stock_code=decision.stock_code,
-                stock_name=decision.stock_name,
-                order_type="SELL",
-                quantity=decision.quantity,
-                price=int(decision.price),
-                order_id=order.order_id
-            )
+    def _should_notify_signal(self, stock_code: str, signal: str) -> bool:
+        """최근 SIGNAL_NOTIFY_TTL 내 같은 (종목, 신호) 알림이 없으면 기록 후 True"""
+        key = (stock_code, signal)
+        if self._signal_notify_cache.get(key) is not None:
+            return False
+        self._signal_notify_cache.set(key, True)
+        return True
 
     async def _discover_new_stocks(self):
         """새 종목 발굴"""
@@ -457,22 +559,33 @@ class AutoTrader:
                 limit=10
             )
 
-            for stock in top_signals:
-                if stock['stock_code'] not in self._watched_stocks:
-                    self._watched_stocks.add(stock['stock_code'])
-
-                    # 새 신호 알림
-                    if stock['total_score'] >= self.config.min_score:
-                        await self.notification.notify(
-                            NotificationType.SIGNAL,
-                            stock_code=stock['stock_code'],
-                            stock_name=stock['stock_name'],
-                            signal=SignalType(stock['signal']),
-                            score=stock['total_score'],
-                            current_price=int(stock['current_price']),
-                            change_rate=stock['change_rate'],
-                            reasons=["실시간 스크리닝 발굴"]
-                        )
+            new_stocks = [
+                stock for stock in top_signals
+                if stock['stock_code'] not in self._watched_stocks
+            ]
+            if not new_stocks:
+                return
+
+            # 관심종목 추가 후 스냅샷은 한 번만 재생성
+            self._watched_stocks.update(stock['stock_code'] for stock in new_stocks)
+            self._refresh_watched_snapshot()
+
+            for stock in new_stocks:
+                # 새 신호 알림
+                if (
+                    stock['total_score'] >= self.config.min_score
+                    and self._should_notify_signal(stock['stock_code'], stock['signal'])
+                ):
+                    await self.notification.notify(
+                        NotificationType.SIGNAL,
+                        stock_code=stock['stock_code'],
+                        stock_name=stock['stock_name'],
+                        signal=SignalType(stock['signal']),
+                        score=stock['total_score'],
+                        current_price=int(stock['current_price']),
+                        change_rate=stock['change_rate'],
+                        reasons=["실시간 스크리닝 발굴"]
+                    )
 
         except Exception as e:
             print(f"[AutoTrader] 종목 발굴 오류: {e}")
@@ -483,35 +596,44 @@ class AutoTrader:
 
         while self._running:
             try:
-                if self._paused or not self._is_market_hours():
-                    await asyncio.sleep(1)
+                await self._resume_event.wait()
+
+                # 장 외 시간에는 장 시작까지 대기 (최대 5분 단위로 재확인)
+                if not self._is_market_hours():
+                    await self._sleep(min(self._seconds_until_market_open(), 300))
                     continue
 
                 # 오픈 포지션 가격 업데이트
                 open_positions = self.trading_engine.position_manager.get_open_positions()
 
                 if open_positions:
-                    # 실시간 가격 조회
-                    prices = {}
-                    for pos in open_positions:
-                        try:
-                            quote = await self.broker.get_quote(pos.stock_code)
-                            prices[pos.stock_code] = quote.price
-                            self._last_prices[pos.stock_code] = quote.price
-                        except:
-                            if pos.stock_code in self._last_prices:
-                                prices[pos.stock_code] = self._last_prices[pos.stock_code]
+                    # 실시간 가격 일괄 조회 (응답에 없는 종목은 마지막 가격 사용)
+                    stock_codes = [pos.stock_code for pos in open_positions]
+                    try:
+                        quotes = await self.broker.get_quotes(stock_codes)
+                    except _BROKER_ERRORS as e:
+                        print(f"[AutoTrader] 시세 일괄 조회 오류: {e}")
+                        quotes = []
+
+                    for quote in quotes:
+                        self._last_prices[quote.stock_code] = quote.price
+
+                    prices = {
+                        code: self._last_prices[code]
+                        for code in stock_codes
+                        if code in self._last_prices
+                    }
 
                     # 포지션 업데이트 (손절/익절 체크)
                     await self.trading_engine.update_positions(prices)
 
-                await asyncio.sleep(self.config.position_check_interval)
+                await self._sleep(self.config.position_check_interval)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 print(f"[AutoTrader] 포지션 모니터링 오류: {e}")
-                await asyncio.sleep(5)
+                await self._sleep(5)
 
     async def _on_trade_executed(self, decision: TradeDecision):
         """매매 실행 콜백"""
@@ -541,8 +663,11 @@ class AutoTrader:
 
     def _reset_daily_stats(self):
         """일일 통계 초기화"""
+        self._trade_counter = itertools.count(1)
         self._today_trades = 0
         self._today_pnl = 0.0
+        self._next_open_cache = None
+        self._signal_notify_cache.clear()
 
     async def _send_daily_report(self):
         """일일 리포트 전송"""
@@ -615,27 +740,49 @@ class AutoTrader:
         }
 
     def update_config(self, **kwargs):
-        """설정 업데이트"""
-        for key, value in kwargs.items():
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
-
-        # 트레이딩 엔진 설정도 업데이트
-        self.trading_engine.update_config(
-            enable_auto_trade=self.config.enabled
-        )
+        """설정 업데이트 (실제로 바뀐 값만 반영)"""
+        changed = {
+            key: value for key, value in kwargs.items()
+            if hasattr(self.config, key) and getattr(self.config, key) != value
+        }
+        if not changed:
+            return
+
+        for key, value in changed.items():
+            setattr(self.config, key, value)
+        if 'signal_types' in changed:
+            self.config.signal_type_set = frozenset(self.config.signal_types)
+
+        # 장 시간 설정이 바뀌었을 수 있으므로 캐시 무효화
+        self._market_state_cache = (float('-inf'), False, False)
+        self._next_open_cache = None
+
+        # 트레이딩 엔진 설정도 바뀐 항목만 업데이트
+        engine_updates = {
+            _ENGINE_CONFIG_FIELDS[key]: value
+            for key, value in changed.items()
+            if key in _ENGINE_CONFIG_FIELDS
+        }
+        if engine_updates:
+            self.trading_engine.update_config(**engine_updates)
 
     def add_watch_stock(self, stock_code: str):
         """관심종목 추가"""
         self._watched_stocks.add(stock_code)
+        self._refresh_watched_snapshot()
 
     def remove_watch_stock(self, stock_code: str):
         """관심종목 제거"""
         self._watched_stocks.discard(stock_code)
+        self._refresh_watched_snapshot()
 
     def get_watched_stocks(self) -> List[str]:
         """관심종목 목록"""
-        return list(self._watched_stocks)
+        return list(self._watched_snapshot)
+
+    def _refresh_watched_snapshot(self):
+        """관심종목 스냅샷 갱신"""
+        self._watched_snapshot = tuple(self._watched_stocks)
 
 
 # 싱글톤 인스턴스
@@ -139,48 +139,43 @@ class ScreeningService:
         filters: Dict
     ) -> List[Dict]:
         """종목 병렬 분석"""
-        async def analyze_single(stock: Dict) -> Optional[Dict]:
-            try:
-                result = await self.analysis_service.analyze_stock(
-                    stock['code'],
-                    trading_style
-                )
+        results = await self.analysis_service.analyze_stocks(
+            [stock['code'] for stock in stocks],
+            trading_style
+        )
 
-                # 거래량/체결강도 필터
-                indicators = result.get('indicators', {})
-                volume_data = indicators.get('volume', {})
-                order_book_data = indicators.get('order_book', {})
-
-                volume_ratio = volume_data.get('volume_ratio', 0)
-                strength = order_book_data.get('strength', 0)
-
-                if 'volume_ratio_min' in filters and volume_ratio < filters['volume_ratio_min']:
-                    return None
-                if 'strength_min' in filters and strength < filters['strength_min']:
-                    return None
-
-                return {
-                    'stock_code': result['stock_code'],
-                    'stock_name': result['stock_name'],
-                    'current_price': result['current_price'],
-                    'change_rate': result['change_rate'],
-                    'total_score': result['total_score'],
-                    'signal': result['signal'],
-                    'volume_ratio': volume_ratio,
-                    'strength': strength,
-                    'mandatory_passed': result['mandatory_check']['all_passed'],
-                    'confidence': result['confidence']
-                }
-            except Exception as e:
-                print(f"분석 오류 ({stock['code']}): {e}")
-                return None
+        filtered = []
+        for result in results:
+            if result is None:
+                continue
 
-        # 병렬 실행
-        tasks = [analyze_single(stock) for stock in stocks]
-        results = await asyncio.gather(*tasks)
+            # 거래량/체결강도 필터
+            indicators = result.get('indicators', {})
+            volume_data = indicators.get('volume', {})
+            order_book_data = indicators.get('order_book', {})
 
-        # None 필터링
-        return [r for r in results if r is not None]
+            volume_ratio = volume_data.get('volume_ratio', 0)
+            strength = order_book_data.get('strength', 0)
+
+            if 'volume_ratio_min' in filters and volume_ratio < filters['volume_ratio_min']:
+                continue
+            if 'strength_min' in filters and strength < filters['strength_min']:
+                continue
+
+            filtered.append({
+                'stock_code': result['stock_code'],
+                'stock_name': result['stock_name'],
+                'current_price': result['current_price'],
+                'change_rate': result['change_rate'],
+                'total_score': result['total_score'],
+                'signal': result['signal'],
+                'volume_ratio': volume_ratio,
+                'strength': strength,
+                'mandatory_passed': result['mandatory_check']['all_passed'],
+                'confidence': result['confidence']
+            })
+
+        return filtered
 
     async def get_top_signals(
         self,
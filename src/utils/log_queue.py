@@ -0,0 +1,54 @@
+"""
+비동기 로깅 설정
+- 이벤트 루프는 QueueHandler로 레코드만 적재
+- 실제 출력은 QueueListener 백그라운드 스레드에서 수행
+- 루트 로거는 건드리지 않고 패키지(src) 로거에만 연결
+"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# 패키지 최상위 로거 (모듈 로거 logging.getLogger(__name__)의 부모)
+PACKAGE_LOGGER = __name__.split('.')[0]
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def setup_queue_logging(level: str = "INFO") -> QueueListener:
+    """패키지 로거를 큐 기반 핸들러로 구성 (중복 호출 시 기존 리스너 반환)"""
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    )
+
+    _queue_handler = QueueHandler(log_queue)
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.setLevel(level.upper())
+    logger.addHandler(_queue_handler)
+    logger.propagate = False  # 루트 핸들러에서 이벤트 루프 스레드 출력 방지
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_queue_logging():
+    """리스너 중지 (남은 레코드 출력 후 종료) 및 패키지 로거 원복"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+
+    _listener.stop()
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.removeHandler(_queue_handler)
+    logger.propagate = True
+    _listener = None
+    _queue_handler = None
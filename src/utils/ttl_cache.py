@@ -0,0 +1,61 @@
+"""
+프로세스 내 TTL 캐시
+- 대시보드 폴링처럼 같은 집계를 짧은 주기로 반복 조회하는 경로용
+"""
+from time import monotonic
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """만료 시간이 있는 소형 딕셔너리 캐시"""
+
+    __slots__ = ('ttl', 'maxsize', 'hits', 'misses', '_data')
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """유효한 값 반환 (없거나 만료 시 None)"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """값 저장 (가득 차면 가장 오래된 항목 제거)"""
+        if key not in self._data and len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable):
+        """개별 무효화"""
+        self._data.pop(key, None)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """적중률 통계"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._data)
+        }
+
+    def clear(self):
+        """전체 무효화"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,43 @@
+"""
+지표 커널 단위 테스트
+"""
+import numpy as np
+import pytest
+
+from src.core.indicators._ema_numba import _macd_last, _macd_last_numpy
+from src.core.indicators._rsi_numba import _rsi_series, _rsi_series_numpy
+
+
+def _random_walk(n: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.cumsum(rng.normal(0, 50, n)) + 50000.0
+
+
+class TestNumpyFallback:
+    """numba 미설치 시 사용하는 NumPy 구현이 루프 커널과 같은 값을 내는지"""
+
+    @pytest.mark.parametrize("n", [5, 14, 15, 60, 200, 5000])
+    @pytest.mark.parametrize("period", [1, 2, 14])
+    def test_rsi_series(self, n, period):
+        """RSI 시계열 (긴 구간은 블록 분할 경로 포함)"""
+        changes = np.diff(_random_walk(n + 1))
+        np.testing.assert_allclose(
+            _rsi_series_numpy(changes, period), _rsi_series(changes, period),
+            rtol=1e-9, atol=1e-7
+        )
+
+    def test_rsi_flat_and_one_sided(self):
+        """변화 없음(100), 상승만(100), 하락만(0)"""
+        for changes, expected in ((np.zeros(30), 100.0), (np.ones(30), 100.0), (-np.ones(30), 0.0)):
+            assert _rsi_series_numpy(changes, 14)[-1] == expected
+            assert _rsi_series(changes, 14)[-1] == expected
+
+    @pytest.mark.parametrize("n", [35, 60, 500, 5000])
+    @pytest.mark.parametrize("periods", [(12, 26, 9), (2, 3, 2)])
+    def test_macd_last(self, n, periods):
+        """MACD 최근 값"""
+        closes = _random_walk(n)
+        np.testing.assert_allclose(
+            _macd_last_numpy(closes, *periods), _macd_last(closes, *periods),
+            rtol=1e-9, atol=1e-7
+        )
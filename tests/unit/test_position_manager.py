@@ -0,0 +1,114 @@
+"""
+포지션 관리자 단위 테스트
+"""
+import pytest
+
+from src.core.trading import PositionManager
+from src.core.trading._exit_njit import (
+    check_exit, EXIT_NONE, EXIT_STOP_LOSS, EXIT_TRAILING_STOP,
+    EXIT_TAKE_PROFIT_1, EXIT_TAKE_PROFIT_2
+)
+from src.config.constants import TradingStyle, ExitReason
+
+
+class TestCheckExit:
+    """청산 조건 커널 테스트"""
+
+    # 진입 10000, 손절 9800, 1차 익절 10200, 2차 익절 10500, 트레일링 1%
+    LEVELS = dict(sl=9800.0, entry=10000.0, tmult=0.99, tp1=10200.0, tp2=10500.0)
+
+    def _check(self, price, hp, sold=0):
+        lv = self.LEVELS
+        return check_exit(price, lv['sl'], hp, lv['entry'], lv['tmult'], lv['tp1'], lv['tp2'], sold)
+
+    def test_hold(self):
+        """청산 조건 없음"""
+        assert self._check(10100.0, 10100.0) == EXIT_NONE
+
+    def test_stop_loss(self):
+        """손절"""
+        assert self._check(9800.0, 10000.0) == EXIT_STOP_LOSS
+
+    def test_trailing_stop_requires_profit(self):
+        """트레일링 스탑은 진입가 위에서만 발동"""
+        assert self._check(10050.0, 10160.0, sold=5) == EXIT_TRAILING_STOP
+        assert self._check(9900.0, 10160.0, sold=5) == EXIT_NONE
+
+    def test_take_profit_1_before_2(self):
+        """1차/2차 익절가 동시 도달 시 1차 익절 우선"""
+        assert self._check(10600.0, 10600.0) == EXIT_TAKE_PROFIT_1
+        assert self._check(10600.0, 10600.0, sold=5) == EXIT_TAKE_PROFIT_2
+
+
+class TestBatchUpdate:
+    """일괄 가격 업데이트 테스트"""
+
+    PRICES = [
+        {'A': 10100, 'B': 9700},
+        {'A': 10400, 'C': 52000},
+        {'A': 10150, 'B': 9400, 'C': 47000},
+        {'A': 9500, 'C': 56000}
+    ]
+
+    def test_update_prices_matches_update_price(self):
+        """update_prices 결과가 종목별 update_price와 일치"""
+        single = PositionManager()
+        batch = PositionManager()
+        for code, price in (('A', 10000), ('B', 10000), ('C', 50000)):
+            single.create_position(code, code, price, 10, TradingStyle.SWING)
+            batch.create_position(code, code, price, 10, TradingStyle.SWING)
+
+        for prices in self.PRICES:
+            expected = []
+            for position in single.get_open_positions():
+                if position.stock_code in prices:
+                    reason = single.update_price(position.position_id, prices[position.stock_code])
+                    if reason:
+                        expected.append((position.position_id, reason))
+
+            actual = [(p.position_id, reason) for p, _, reason in batch.update_prices(prices)]
+            assert actual == expected
+
+            for position_id, reason in expected:
+                single.close_position(position_id, 0, reason)
+                batch.close_position(position_id, 0, reason)
+
+            for position in single.get_all_positions():
+                other = batch.get_position(position.position_id)
+                assert other.highest_price == position.highest_price
+                assert other.unrealized_pnl == pytest.approx(position.unrealized_pnl)
+                assert other.status == position.status
+
+        assert batch.get_total_unrealized_pnl() == pytest.approx(single.get_total_unrealized_pnl())
+
+    def test_closed_position_leaves_open_index(self):
+        """전량 청산 시 열린 포지션 인덱스에서 제거"""
+        manager = PositionManager()
+        first = manager.create_position('A', 'A', 10000, 10, TradingStyle.SWING)
+        second = manager.create_position('A', 'A', 10000, 10, TradingStyle.SWING)
+
+        manager.close_position(first.position_id, 10000, ExitReason.SIGNAL)
+
+        assert manager.count_open_positions() == 1
+        assert manager.get_open_positions_by_stock('A') == [second]
+        assert len(manager.get_positions_by_stock('A')) == 2
+
+    def test_closed_rows_removed_from_arrays(self):
+        """전량 청산된 포지션 행은 배열에서 제거되고 남은 행은 그대로 갱신"""
+        manager = PositionManager()
+        first = manager.create_position('A', 'A', 10000, 10, TradingStyle.SWING)
+        second = manager.create_position('B', 'B', 10000, 10, TradingStyle.SWING)
+        third = manager.create_position('C', 'C', 10000, 10, TradingStyle.SWING)
+
+        manager.close_position(first.position_id, 10000, ExitReason.SIGNAL)
+        manager.update_prices({'A': 9000, 'B': 10100, 'C': 10200})
+
+        assert manager._size == 2
+        assert first.current_price == 10000
+        assert manager.get_position(second.position_id).current_price == 10100
+        assert manager.get_position(third.position_id).current_price == 10200
+        assert manager.get_total_unrealized_pnl() == pytest.approx(1000 + 2000)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -5,10 +5,38 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
-from src.core.scoring import ScoreCalculator, SignalGenerator
+from src.core.scoring import (
+    ScoreCalculator, SignalGenerator, IndicatorBundle,
+    get_signal_generator, signal_to_dict
+)
 from src.config.constants import TradingStyle, SignalType
 
 
+# 신호 비교용 지표 샘플 (빈 dict / 전체 / 일부 누락)
+SAMPLE_INDICATORS = [
+    {},
+    {
+        'volume': {'volume_ratio': 320},
+        'order_book': {'strength': 135},
+        'vwap': {'vwap_position': 'above', 'price_vs_vwap': 1.5},
+        'ma': {'arrangement': 'golden', 'cross_signal': 'golden_cross',
+               'above_ma5': True, 'above_ma20': True},
+        'rsi': {'rsi': 60},
+        'macd': {'histogram': 0.4, 'prev_histogram': 0.2, 'cross_signal': 'none'},
+        'bollinger': {'position': 'lower'},
+        'obv': {'obv_trend': 'up', 'obv_new_high': True, 'obv_divergence': 'bullish'}
+    },
+    {
+        'volume': {'volume_ratio': 90},
+        'vwap': {'vwap_position': 'below', 'price_vs_vwap': -3.0},
+        'ma': {'arrangement': 'dead', 'cross_signal': 'dead_cross', 'above_ma5': None},
+        'rsi': {'rsi': 30},
+        'macd': {'histogram': -0.3, 'prev_histogram': -0.5, 'cross_signal': 'none'},
+        'bollinger': {'position': 'upper'}
+    }
+]
+
+
 class TestScoreCalculator:
     """점수 계산기 테스트"""
 
@@ -304,5 +332,85 @@ class TestConfidenceCalculation:
         assert 0.5 <= confidence <= 0.8
 
 
+class TestThresholdLookup:
+    """임계값 테이블 조회 테스트"""
+
+    def test_volume_threshold_buckets(self):
+        """거래량 임계값 구간별 배율 테스트"""
+        calculator = ScoreCalculator(TradingStyle.SCALPING)
+        max_score = calculator.weights.volume
+
+        assert calculator.calc_volume_score({'volume_ratio': 50})[0] == 0
+        assert calculator.calc_volume_score({'volume_ratio': 100})[0] == max_score * 0.2
+        assert calculator.calc_volume_score({'volume_ratio': 299})[0] == max_score * 0.6
+        assert calculator.calc_volume_score({'volume_ratio': 500})[0] == max_score * 1.0
+
+    def test_strength_threshold_per_style(self):
+        """스타일별 체결강도 임계값 테스트"""
+        swing = ScoreCalculator(TradingStyle.SWING)
+        max_score = swing.weights.order_book
+
+        assert swing.calc_order_book_score({'strength': 104})[0] == 0
+        assert swing.calc_order_book_score({'strength': 105})[0] == max_score * 0.6
+        assert swing.calc_order_book_score({'strength': 115})[0] == max_score * 1.0
+
+
+class TestIndicatorBundle:
+    """평탄화 지표 테스트"""
+
+    @pytest.mark.parametrize("style", list(TradingStyle))
+    def test_check_mandatory_accepts_bundle(self, style):
+        """dict와 IndicatorBundle의 필수 조건 결과가 일치"""
+        generator = get_signal_generator(style)
+
+        for indicators in SAMPLE_INDICATORS:
+            bundle = IndicatorBundle.from_indicators(indicators)
+            assert generator.check_mandatory(bundle) == generator.check_mandatory(indicators)
+
+    def test_missing_indicators_fail_mandatory(self):
+        """지표 누락 시 기본값으로 필수 조건 미충족"""
+        bundle = IndicatorBundle.from_indicators({})
+        assert bundle.rsi == 100
+        assert bundle.vwap_position == ''
+
+
+class TestDecisionThreshold:
+    """신호 임계값 판정 테스트 (전체 정밀도 기준)"""
+
+    def test_threshold_uses_full_precision_total(self):
+        """85.00으로 표시되더라도 총점 84.996은 85점 임계값 미달"""
+        generator = SignalGenerator(TradingStyle.SCALPING)
+        indicators = {'volume': {'volume_ratio': 250}, 'order_book': {'strength': 130}}
+
+        scores = {'volume': 40.498, 'order_book': 44.498}
+        fake_result = {
+            'total_score': sum(scores.values()),
+            'scores_breakdown': scores,
+            'details': {'volume': '', 'order_book': ''}
+        }
+
+        with patch.object(generator.calculator, 'calculate_total', return_value=fake_result):
+            result = generator.generate(indicators, 10000)
+
+        assert result.signal == SignalType.BUY
+        assert result.total_score == sum(result.scores_breakdown.values())
+        assert signal_to_dict(result)['total_score'] == result.total_score
+
+    def test_threshold_boundary(self):
+        """임계값과 같은 총점부터 도달"""
+        generator = SignalGenerator(TradingStyle.SCALPING)
+        mandatory = {'all_passed': True}
+
+        assert generator._determine_signal(84.999, mandatory) == SignalType.BUY
+        assert generator._determine_signal(85.0, mandatory) == SignalType.STRONG_BUY
+
+    def test_mandatory_uses_full_precision_indicators(self):
+        """필수 조건도 반올림 전 지표값으로 판정 (119.996 < 120)"""
+        generator = SignalGenerator(TradingStyle.SCALPING)
+        indicators = {'volume': {'volume_ratio': 250}, 'order_book': {'strength': 119.996}}
+
+        assert generator.check_mandatory(indicators)['체결강도≥120%'] is False
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
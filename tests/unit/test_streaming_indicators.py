@@ -0,0 +1,46 @@
+"""
+스트리밍 지표 단위 테스트
+"""
+import numpy as np
+import pytest
+
+from src.core.indicators import OHLCV, RSIIndicator, MACDIndicator
+
+
+def _bars(closes):
+    return [OHLCV('20240101', c, c, c, c, 1000) for c in closes]
+
+
+def _price_paths():
+    """랜덤 워크 + 횡보 구간 (추세가 'stable'로 떨어지는 경계 포함)"""
+    rng = np.random.default_rng(11)
+    walk = np.round(np.cumsum(rng.normal(0, 120, 150)) + 50000.0, 0)
+    flat_tail = np.concatenate([walk[:60], np.full(40, walk[59])])
+    rising = np.arange(10000.0, 10080.0)
+    return [walk, flat_tail, rising]
+
+
+class TestStreamingMatchesBatch:
+    """봉마다 update한 결과가 그 시점까지의 calculate와 일치하는지"""
+
+    @pytest.mark.parametrize("closes", _price_paths())
+    def test_rsi(self, closes):
+        streaming = RSIIndicator(period=14)
+        batch = RSIIndicator(period=14)
+
+        for i, close in enumerate(closes):
+            step = streaming.update(float(close))
+            expected = batch.calculate(_bars(closes[:i + 1]))
+            assert step['rsi'] == pytest.approx(expected['rsi'], abs=1e-9)
+            assert step['rsi_status'] == expected['rsi_status']
+            assert step['rsi_trend'] == expected['rsi_trend']
+
+    @pytest.mark.parametrize("closes", _price_paths())
+    def test_macd(self, closes):
+        streaming = MACDIndicator(fast=12, slow=26, signal=9)
+        batch = MACDIndicator(fast=12, slow=26, signal=9)
+
+        for i, close in enumerate(closes):
+            step = streaming.update(float(close))
+            expected = batch.calculate(_bars(closes[:i + 1]))
+            assert step == expected